@@ -0,0 +1,88 @@
+"""
+Row size and encode/decode time of answers_given as JSON versus the compact encoding.
+
+Builds synthetic progress rows for a story with --exercises pre-reading exercises and
+--questions post-reading questions, every item answered, and prints the mean stored size
+and the time per row to write and read each form:
+
+    python benchmarks/answer_encoding.py --exercises 5 --questions 10 --rows 20000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _story(exercises, questions, first_id):
+    """Exercises and question ids as a story created after `first_id` other items would have them."""
+    pre_reading = [
+        SimpleNamespace(id=first_id + number, option_1=f'Option one of exercise {number}', option_2=f'Option two of exercise {number}')
+        for number in range(exercises)
+    ]
+    question_ids = [first_id + exercises + number for number in range(questions)]
+    return pre_reading, question_ids
+
+
+def _answers(pre_reading, question_ids, rng):
+    return {
+        'pre_reading': {str(exercise.id): getattr(exercise, f'option_{rng.randint(1, 2)}') for exercise in pre_reading},
+        'post_reading': {
+            str(question_id): {'selected_option': str(option), 'is_correct': option == 2}
+            for question_id, option in ((question_id, rng.randint(1, 4)) for question_id in question_ids)
+        },
+    }
+
+
+def _per_row_us(function, items):
+    started = time.perf_counter()
+    for item in items:
+        function(item)
+    return (time.perf_counter() - started) / len(items) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--exercises', type=int, default=5, help="Pre-reading exercises per story.")
+    parser.add_argument('--questions', type=int, default=10, help="Post-reading questions per story.")
+    parser.add_argument('--rows', type=int, default=20000, help="Progress rows to encode and decode.")
+    parser.add_argument('--first-id', type=int, default=50000, help="Id of the story's first item; larger ids take more bytes.")
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'vikes_project.settings')
+    sys.path.insert(0, ROOT)
+    import django
+    django.setup()
+    from vikes_reading_app.services import answer_codec
+
+    rng = random.Random(0)
+    pre_reading, question_ids = _story(args.exercises, args.questions, args.first_id)
+    rows = [_answers(pre_reading, question_ids, rng) for _ in range(args.rows)]
+
+    as_json = [json.dumps(answers).encode() for answers in rows]
+    packed = [answer_codec.encode(answers) for answers in rows]
+    assert all(answer_codec.decode(blob) == answers for blob, answers in zip(packed, rows))
+
+    results = {
+        'json': (
+            sum(map(len, as_json)) / len(rows),
+            _per_row_us(lambda answers: json.dumps(answers).encode(), rows),
+            _per_row_us(json.loads, as_json),
+        ),
+        'compact': (
+            sum(map(len, packed)) / len(rows),
+            _per_row_us(answer_codec.encode, rows),
+            _per_row_us(answer_codec.decode, packed),
+        ),
+    }
+    print(f"{args.rows} rows, {args.exercises} exercises + {args.questions} questions each")
+    for name, (size, encode_us, decode_us) in results.items():
+        print(f"{name:>8}: {size:7.1f} bytes/row  encode {encode_us:6.1f} us/row  decode {decode_us:6.1f} us/row")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Concurrent answer-submit benchmark for the SQLite database.
+
+Starts a pool of processes that each log in as their own student and post
+pre-reading answers as fast as they can, once against a default SQLite
+database and once with DJANGO_SQLITE_TUNING=True, then prints successful
+submits per second and how many failed with "database is locked".
+
+    python benchmarks/concurrent_submits.py --workers 8 --submits 200
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _setup_django(db_path, tuned):
+    os.environ.update({
+        'DJANGO_SETTINGS_MODULE': 'vikes_project.settings',
+        'DJANGO_ENV': 'development',
+        'DJANGO_ALLOWED_HOSTS': 'testserver',
+        'DATABASE_URL': f'sqlite:///{db_path}',
+        'DJANGO_SQLITE_TUNING': 'True' if tuned else 'False',
+    })
+    sys.path.insert(0, ROOT)
+    import django
+    django.setup()
+
+
+def _prepare(db_path, tuned, workers):
+    _setup_django(db_path, tuned)
+    from django.core.management import call_command
+    from vikes_reading_app.models import CustomUser, PreReadingExercise, Story
+
+    call_command('migrate', verbosity=0)
+    teacher = CustomUser.objects.create_user(username='teacher', password='pass', role='teacher')
+    story = Story.objects.create(title='Benchmark', content='Once upon a time...', author=teacher, status='published')
+    exercises = [
+        PreReadingExercise.objects.create(
+            story=story, question_text=f'Q{number}?', option_1='A', option_2='B', is_option_1_correct=True,
+        )
+        for number in range(5)
+    ]
+    for number in range(workers):
+        CustomUser.objects.create_user(username=f'student{number}', password='pass', role='student')
+    return story.id, [exercise.id for exercise in exercises]
+
+
+def _worker(db_path, tuned, number, story_id, exercise_ids, submits, barrier, results):
+    _setup_django(db_path, tuned)
+    from django.db import OperationalError
+    from django.test import Client
+    from django.urls import reverse
+    from vikes_reading_app.models import CustomUser
+
+    client = Client()
+    client.force_login(CustomUser.objects.get(username=f'student{number}'))
+    url = reverse('pre_reading_submit', args=[story_id])
+    ok = locked = 0
+
+    barrier.wait()
+    started = time.perf_counter()
+    for attempt in range(submits):
+        exercise_id = exercise_ids[attempt % len(exercise_ids)]
+        try:
+            response = client.post(url, {'exercise_id': exercise_id, 'selected_answer': 'A'})
+        except OperationalError:
+            locked += 1
+            continue
+        if response.status_code == 200:
+            ok += 1
+    results.put((ok, locked, time.perf_counter() - started))
+
+
+def run(tuned, workers, submits):
+    ctx = multiprocessing.get_context('spawn')  # Settings are read once per process
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, 'bench.sqlite3')
+        with ctx.Pool(1) as pool:
+            story_id, exercise_ids = pool.apply(_prepare, (db_path, tuned, workers))
+
+        barrier = ctx.Barrier(workers)
+        results = ctx.Queue()
+        processes = [
+            ctx.Process(target=_worker, args=(db_path, tuned, number, story_id, exercise_ids, submits, barrier, results))
+            for number in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        outcomes = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+    ok = sum(outcome[0] for outcome in outcomes)
+    locked = sum(outcome[1] for outcome in outcomes)
+    elapsed = max(outcome[2] for outcome in outcomes)
+    return ok, locked, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=8, help="Concurrent student processes.")
+    parser.add_argument('--submits', type=int, default=200, help="Answers each student posts.")
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers x {args.submits} submits")
+    for label, tuned in (('default', False), ('tuned', True)):
+        ok, locked, elapsed = run(tuned, args.workers, args.submits)
+        print(f"{label:>8}: {ok / elapsed:8.1f} submits/s  {ok:6d} ok  {locked:6d} locked  {elapsed:6.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+# gunicorn loads this file from the working directory (or pass -c gunicorn.conf.py).
+
+
+def post_worker_init(worker):
+    # Each worker, after the app is loaded and after the fork when running with --preload
+    from gunicorn.workers.sync import SyncWorker
+
+    from vikes_reading_app.warmup import warm_up_worker
+
+    warm_up_worker(serves_on_this_thread=isinstance(worker, SyncWorker))
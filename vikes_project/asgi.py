@@ -14,3 +14,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'vikes_project.settings')
 
 application = get_asgi_application()
+
+# Resolve URLs, compile templates and fill the story cache before the first request (needs
+# Django set up above). Database connections are opened later, by the worker-start hook in
+# gunicorn.conf.py, so none is shared across a --preload fork.
+from vikes_reading_app.warmup import warm_up_on_import  # noqa: E402
+
+warm_up_on_import()
@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 import os
 import dj_database_url
-from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
 
 from django.core.exceptions import ImproperlyConfigured
@@ -20,20 +20,15 @@ from django.core.exceptions import ImproperlyConfigured
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-try:
-    load_dotenv = import_module("dotenv").load_dotenv
-except ModuleNotFoundError:
-    load_dotenv = None
+# Optional packages are probed with find_spec rather than imported, so settings don't pay
+# their import time: python-dotenv is only imported when there's a .env file to read, and
+# whitenoise is imported later by its middleware.
+if (BASE_DIR / ".env").exists() and find_spec("dotenv") is not None:
+    from dotenv import load_dotenv
 
-if load_dotenv is not None:
     load_dotenv(BASE_DIR / ".env")
 
-try:
-    import_module("whitenoise")
-except ModuleNotFoundError:
-    WHITENOISE_INSTALLED = False
-else:
-    WHITENOISE_INSTALLED = True
+WHITENOISE_INSTALLED = find_spec("whitenoise") is not None
 
 
 def get_bool_env(name, default=False):
@@ -91,6 +86,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'vikes_reading_app.middleware.ReplicaPinningMiddleware',
+    'vikes_reading_app.middleware.IdentityMapMiddleware',
 ]
 
 if WHITENOISE_INSTALLED:
@@ -98,12 +95,22 @@ if WHITENOISE_INSTALLED:
 
 ROOT_URLCONF = 'vikes_project.urls'
 
+# Templates
+# Every template lives in an app's templates/ directory, so the app-directories loader
+# is the only search path (the app directory used to be listed in DIRS as well, which
+# made every lookup miss stat it twice). Production template mode keeps compiled
+# templates in memory behind the cached loader (the "templates" warm-up step below fills
+# it when a worker boots); DEBUG serves them straight from disk so edits show up without
+# a restart.
+TEMPLATE_LOADERS = ['django.template.loaders.app_directories.Loader']
+TEMPLATE_CACHE = get_bool_env("DJANGO_TEMPLATE_CACHE", default=not DEBUG)
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [BASE_DIR / "vikes_reading_app/templates"],
-        'APP_DIRS': True,
+        'DIRS': [],
         'OPTIONS': {
+            'loaders': [('django.template.loaders.cached.Loader', TEMPLATE_LOADERS)] if TEMPLATE_CACHE else TEMPLATE_LOADERS,
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -115,16 +122,145 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'vikes_project.wsgi.application'
+ASGI_APPLICATION = 'vikes_project.asgi.application'
+
+# Route the JSON submit/time-save endpoints to their async implementations.
+# Enable this when serving through ASGI; WSGI deployments keep the sync views.
+ASYNC_SUBMIT_VIEWS = get_bool_env("DJANGO_ASYNC_SUBMIT_VIEWS", default=False)
+
+# Store students' answers as a compact binary column instead of JSON. Rows are read in
+# either form, so switching this on or off only changes how rows are written from then on.
+COMPACT_ANSWERS = get_bool_env("DJANGO_COMPACT_ANSWERS", default=False)
+
+
+# Persistent connections are checked before reuse, so a connection the database or a proxy
+# dropped while the worker was idle is replaced instead of failing the next request.
+DB_CONN_MAX_AGE = int(os.environ.get("DJANGO_DB_CONN_MAX_AGE", "600"))
+DB_CONN_HEALTH_CHECKS = get_bool_env("DJANGO_DB_CONN_HEALTH_CHECKS", default=True)
+
+# Postgres connection pool (psycopg 3 with psycopg_pool). Threads of a worker share up to
+# DB_POOL_MAX_SIZE connections instead of each keeping its own, and a burst of submits
+# waits up to DB_POOL_TIMEOUT seconds for a free one rather than opening more.
+DB_POOL = get_bool_env("DJANGO_DB_POOL", default=False)
+DB_POOL_OPTIONS = {
+    'min_size': int(os.environ.get("DJANGO_DB_POOL_MIN_SIZE", "2")),
+    'max_size': int(os.environ.get("DJANGO_DB_POOL_MAX_SIZE", "10")),
+    'timeout': int(os.environ.get("DJANGO_DB_POOL_TIMEOUT", "10")),  # seconds
+}
 
 
+def configure_connections(database):
+    if not DB_POOL:
+        return database
+    if database['ENGINE'] != 'django.db.backends.postgresql':
+        raise ImproperlyConfigured("DJANGO_DB_POOL needs a PostgreSQL database.")
+    # The pool keeps the connections; Django rejects persistent connections on top of it
+    database['CONN_MAX_AGE'] = 0
+    database.setdefault('OPTIONS', {})['pool'] = dict(DB_POOL_OPTIONS)
+    return database
+
 
 DATABASES = {
-    'default': dj_database_url.config(
+    'default': configure_connections(dj_database_url.config(
         default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}",
-        conn_max_age=600
-    )
+        conn_max_age=DB_CONN_MAX_AGE,
+        conn_health_checks=DB_CONN_HEALTH_CHECKS,
+    ))
+}
+
+# SQLite tuning for small schools running on the default SQLite database.
+# WAL lets readers keep going while a student's answer is written; NORMAL sync is
+# safe with WAL; mmap and a larger page cache cut read syscalls. Each write
+# transaction takes the write lock at BEGIN (IMMEDIATE) and waits up to the busy
+# timeout for it, rather than failing with "database is locked" on lock upgrade.
+SQLITE_TUNING = get_bool_env("DJANGO_SQLITE_TUNING", default=False)
+SQLITE_TUNED_OPTIONS = {
+    'timeout': int(os.environ.get("DJANGO_SQLITE_BUSY_TIMEOUT", "20")),  # seconds
+    'transaction_mode': 'IMMEDIATE',
+    'init_command': (
+        'PRAGMA journal_mode=WAL;'
+        'PRAGMA synchronous=NORMAL;'
+        'PRAGMA mmap_size=134217728;'  # 128 MiB
+        'PRAGMA cache_size=-65536;'  # 64 MiB
+        'PRAGMA temp_store=MEMORY;'
+    ),
+}
+
+if SQLITE_TUNING and DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    DATABASES['default'].setdefault('OPTIONS', {}).update(SQLITE_TUNED_OPTIONS)
+
+# Optional read replica for teacher dashboards and listings.
+# Read-only repository methods use it; writes and migrations stay on the primary.
+# After a write the browser reads from the primary for REPLICA_PIN_SECONDS.
+REPLICA_DATABASE_URL = os.environ.get("DJANGO_REPLICA_DATABASE_URL")
+REPLICA_PIN_SECONDS = int(os.environ.get("DJANGO_REPLICA_PIN_SECONDS", "10"))
+
+if REPLICA_DATABASE_URL:
+    DATABASES['replica'] = configure_connections(dj_database_url.parse(
+        REPLICA_DATABASE_URL, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=DB_CONN_HEALTH_CHECKS,
+    ))
+    # Tests use one database; the replica alias reads the primary's test data
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+    DATABASE_ROUTERS = ['vikes_reading_app.db_routers.PrimaryReplicaRouter']
+
+
+# Cache
+# A shared cache (Redis) is required for the "cache" session mode with several workers;
+# without DJANGO_REDIS_URL each process gets its own local-memory cache.
+
+REDIS_URL = os.environ.get("DJANGO_REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Teacher question pages cache their exercise/question markup per story content version
+FRAGMENT_CACHE_SECONDS = int(os.environ.get("DJANGO_FRAGMENT_CACHE_SECONDS", str(24 * 60 * 60)))
+# Each story's exercises and questions (the answer keys), also per content version
+STORY_CACHE_SECONDS = int(os.environ.get("DJANGO_STORY_CACHE_SECONDS", str(24 * 60 * 60)))
+
+
+# Worker warm-up
+# Steps run before a new worker takes traffic, each timed in the log: "urls" builds the
+# URL resolver and reverses every named route, "templates" compiles the app's templates,
+# and "story_cache" loads published stories' exercises and questions into the cache, all
+# from wsgi.py/asgi.py; "database" opens each configured connection from gunicorn's
+# worker-start hook (gunicorn.conf.py). "none" disables it.
+WARMUP_STEPS = get_list_env("DJANGO_WARMUP_STEPS") or (
+    [] if DEBUG else ['urls', 'templates', 'database', 'story_cache']
+)
+if WARMUP_STEPS == ['none']:
+    WARMUP_STEPS = []
+
+
+# Sessions
+# "db" is Django's default. "cached_db" and "cache" keep session reads (and, for
+# "cache", writes) off the database; "signed_cookies" stores the session client-side.
+
+SESSION_ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
 }
 
+SESSION_MODE = os.environ.get("DJANGO_SESSION_ENGINE", "db").strip().lower()
+if SESSION_MODE not in SESSION_ENGINES:
+    raise ImproperlyConfigured(
+        f"DJANGO_SESSION_ENGINE must be one of: {', '.join(SESSION_ENGINES)}."
+    )
+SESSION_ENGINE = SESSION_ENGINES[SESSION_MODE]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
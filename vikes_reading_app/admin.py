@@ -1,10 +1,31 @@
 # Admin configuration for Vike's Reading App models
 from django.contrib import admin
-from .models import CustomUser
+from .models import ClassGroup, CustomUser, GroupMembership
+from .repositories.assignment_repository_impl import ORMAssignmentRepository
 
 # Customize admin interface for CustomUser to display username, email, and role
 @admin.register(CustomUser)
 class CustomUserAdmin(admin.ModelAdmin):
     list_display = ('username', 'email', 'role')
 
+# Class groups with their roster editable inline
+class GroupMembershipInline(admin.TabularInline):
+    model = GroupMembership
+    raw_id_fields = ('student',)
+    extra = 0
+
+
+@admin.register(ClassGroup)
+class ClassGroupAdmin(admin.ModelAdmin):
+    list_display = ('name', 'teacher')
+    list_select_related = ('teacher',)
+    inlines = [GroupMembershipInline]
+
+    def save_formset(self, request, form, formset, change):
+        super().save_formset(request, form, formset, change)
+        # Keep the assignment queues in step with roster edits made here
+        repo = ORMAssignmentRepository()
+        repo.enqueue_group_members(form.instance, [membership.student_id for membership in formset.new_objects])
+        repo.dequeue_group_members(form.instance, [membership.student_id for membership in formset.deleted_objects])
+
 # Register your models here.
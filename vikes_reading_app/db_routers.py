@@ -0,0 +1,66 @@
+# --- Primary/Replica Database Routing ---
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+
+REPLICA_ALIAS = 'replica'
+
+# True while the current request must read its own writes from the primary
+_pinned_to_primary = ContextVar('pinned_to_primary', default=False)
+
+
+def replica_configured():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def read_alias():
+    """
+    Database alias for read-only repository methods.
+    The replica when one is configured, unless this request is pinned to the primary.
+    """
+    if replica_configured() and not _pinned_to_primary.get():
+        return REPLICA_ALIAS
+    return 'default'
+
+
+def pin_to_primary(pinned=True):
+    """Pins (or unpins) the current context; returns a token for reset_pin."""
+    return _pinned_to_primary.set(pinned)
+
+
+def reset_pin(token):
+    _pinned_to_primary.reset(token)
+
+
+@contextmanager
+def primary_pin(pinned=True):
+    """Pins (or unpins) the current context for the duration of the block."""
+    token = pin_to_primary(pinned)
+    try:
+        yield
+    finally:
+        reset_pin(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Writes and migrations always go to the primary.
+    Reads are sent to the replica explicitly with `.using(read_alias())`,
+    so only the repository methods that opt in are affected by replication lag.
+    """
+
+    def db_for_read(self, model, **hints):
+        return None
+
+    def db_for_write(self, model, **hints):
+        # Rows loaded from the replica must still be saved to the primary
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return {obj1._state.db, obj2._state.db} <= {'default', REPLICA_ALIAS}
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
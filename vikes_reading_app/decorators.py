@@ -1,4 +1,5 @@
 
+from asgiref.sync import iscoroutinefunction
 from django.shortcuts import redirect, get_object_or_404
 from functools import wraps
 from django.http import HttpResponseForbidden
@@ -37,7 +38,7 @@ def teacher_is_author(view_func):
         if not user.is_authenticated or user.role != 'teacher':
             return redirect('login')
         story = repo.get_story_by_id(story_id)
-        if story.author != user:
+        if story.author_id != user.id:
             return HttpResponseForbidden("You are not allowed to view this story.")
         return view_func(request, story=story, *args, **kwargs)
     return _wrapped_view
@@ -50,7 +51,23 @@ def student_can_view_story(view_func):
     Allows access only to authenticated students for a specific story.
     Redirects unauthenticated users to login.
     Forbids access if the user is not a student.
+    Async views get an async wrapper that loads the user and story without blocking.
     """
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def _async_wrapped_view(request, story_id, *args, **kwargs):
+            repo = ORMStoryRepository()
+            user = await request.auser()
+            if not user.is_authenticated:
+                return redirect('login')
+            if user.role != 'student':
+                return HttpResponseForbidden("Access denied: Only students can view this page.")
+            story = await repo.aget_story_by_id(story_id)
+            if story.status != 'published':
+                return HttpResponseForbidden("Access denied: This story is not available.")
+            return await view_func(request, story=story, *args, **kwargs)
+        return _async_wrapped_view
+
     @wraps(view_func)
     def _wrapped_view(request, story_id, *args, **kwargs):
         repo = ORMStoryRepository()
@@ -1,17 +1,45 @@
 from dataclasses import dataclass, field
 
+from vikes_reading_app.models import empty_answers
+
 @dataclass
 class SessionProgressDTO:
     story_id: int
     score: float = 0.0
-    answers_given: dict = field(default_factory=dict)
+    answers_given: dict = field(default_factory=empty_answers)
     current_stage: str = "pre_reading"
     pre_reading_time: int = 0
     post_reading_time: int = 0
 
+    @classmethod
+    def from_model(cls, progress, story_id: int):
+        """
+        Builds the DTO from a Progress row, or an empty one when there is none yet.
+        """
+        if progress is None:
+            return cls(story_id=story_id)
+        return cls(
+            story_id=progress.read_story_id,
+            score=progress.score,
+            answers_given=progress.answers_given,
+            current_stage=progress.current_stage,
+            pre_reading_time=progress.pre_reading_time,
+            post_reading_time=progress.post_reading_time,
+        )
+
     @property
     def is_empty(self) -> bool:
         """
         Determines if this progress represents no real progress.
         """
-        return self.current_stage == "pre_reading" and not self.answers_given
\ No newline at end of file
+        return self.current_stage == "pre_reading" and not any(self.answers_given.values())
+
+@dataclass
+class StoryEntrySnapshotDTO:
+    """
+    What the story entry point decides on: the student's progress and how many
+    exercises and questions the story has, read together.
+    """
+    progress: SessionProgressDTO
+    pre_reading_total: int = 0
+    post_reading_total: int = 0
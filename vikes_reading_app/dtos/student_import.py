@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class StudentImportRowErrorDTO:
+    line: int
+    username: str
+    messages: list = field(default_factory=list)
+
+
+@dataclass
+class StudentImportResultDTO:
+    created: int = 0
+    errors: list = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
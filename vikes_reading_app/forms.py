@@ -3,7 +3,7 @@ from django.contrib.auth.forms import UserCreationForm  # Form for creating new
 from django import forms  # Django forms framework
 
 # --- App Imports ---
-from .models import CustomUser, Story, PreReadingExercise, PostReadingQuestion  # Import custom models
+from .models import ClassGroup, CustomUser, Story, PreReadingExercise, PostReadingQuestion  # Import custom models
 
 
 # --- User Registration Form ---
@@ -67,3 +67,85 @@ class PostReadingQuestionForm(forms.ModelForm):
             'correct_option',
             'explanation',
         ]
+
+
+# --- Story Bundle Import Form ---
+
+# Form for uploading a story bundle (.zip with audio, or a bare .json manifest)
+class StoryBundleImportForm(forms.Form):
+    bundle = forms.FileField(
+        help_text="A story bundle exported from Vike's Reading (.zip or .json).",
+        widget=forms.ClearableFileInput(attrs={'accept': '.zip,.json'}),
+    )
+
+
+# --- Student CSV Import Form ---
+
+# Form for uploading a CSV of students (username, password, optional first_name, last_name, email)
+class StudentImportForm(forms.Form):
+    csv_file = forms.FileField(
+        label="CSV file",
+        help_text="Columns: username, password, and optionally first_name, last_name, email.",
+        widget=forms.ClearableFileInput(attrs={'accept': '.csv'}),
+    )
+    group = forms.ModelChoiceField(
+        queryset=ClassGroup.objects.none(),
+        required=False,
+        help_text="Enrol the imported students in this class.",
+    )
+
+    def __init__(self, *args, teacher=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if teacher is not None:
+            self.fields['group'].queryset = ClassGroup.objects.filter(teacher=teacher).order_by('name')
+
+
+# --- Class Group Forms ---
+
+# Form for a teacher creating a new class group
+class ClassGroupForm(forms.ModelForm):
+    class Meta:
+        model = ClassGroup
+        fields = ['name']
+
+
+# Form for enrolling students in a class group by username
+class GroupStudentsForm(forms.Form):
+    usernames = forms.CharField(
+        widget=forms.Textarea(attrs={'rows': 4}),
+        help_text="Student usernames, separated by commas or new lines.",
+    )
+
+    def clean_usernames(self):
+        raw = self.cleaned_data['usernames'].replace(',', '\n')
+        return [name.strip() for name in raw.splitlines() if name.strip()]
+
+
+# Form behind a roster's Remove button; only students enrolled in `group` are valid choices
+class RemoveGroupStudentForm(forms.Form):
+    remove_student = forms.ModelChoiceField(queryset=CustomUser.objects.none())
+
+    def __init__(self, *args, group=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if group is not None:
+            self.fields['remove_student'].queryset = CustomUser.objects.filter(group_memberships__group=group)
+
+
+# --- Assignment Form ---
+
+# Form for assigning `story` to one of the teacher's class groups; drafts can't be assigned
+class AssignmentForm(forms.Form):
+    group = forms.ModelChoiceField(queryset=ClassGroup.objects.none(), label="Class")
+    due_date = forms.DateField(widget=forms.DateInput(attrs={'type': 'date'}))
+
+    def __init__(self, *args, teacher=None, story=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.story = story
+        if teacher is not None:
+            self.fields['group'].queryset = ClassGroup.objects.filter(teacher=teacher).order_by('name')
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if self.story is not None and self.story.status != 'published':
+            raise forms.ValidationError("Publish this story before assigning it.")
+        return cleaned_data
@@ -1,5 +1,25 @@
+from django.urls import reverse
+
+
 # --- User Role Helpers ---
 
 # ✅ Check if user is a teacher (for decorators, permissions)
 def is_teacher(user):
     return user.is_authenticated and user.role == 'teacher'
+
+
+# --- Story Link Helpers ---
+
+# Role-specific link for a story in listings (home page, search results)
+def get_story_url(user, story):
+    if not user.is_authenticated:
+        # Unauthenticated users are directed to login
+        return reverse('login')
+    if user.role == 'student':
+        # Students go to the student entry point
+        return reverse('story_entry_point', args=[story.id])
+    if user.role == 'teacher':
+        # Teachers go to the teacher reading view
+        return reverse('story_read_teacher', args=[story.id])
+    # Fallback for other roles
+    return "#"
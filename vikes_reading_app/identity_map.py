@@ -0,0 +1,112 @@
+# --- Request-Scoped Identity Map ---
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+# Rows already loaded by the current request, keyed by (kind, *ids); None outside a request
+_current_map = ContextVar('identity_map', default=None)
+
+_MISSING = object()
+
+
+class IdentityMap:
+    """
+    One loaded instance per row for the lifetime of a request.
+    Decorators, views and services each build their own repositories, so the
+    repositories keep the shared rows here rather than on themselves.
+    """
+
+    def __init__(self):
+        self._rows = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=_MISSING):
+        value = self._rows.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._rows[key] = value
+        return value
+
+    def discard(self, *keys):
+        for key in keys:
+            self._rows.pop(key, None)
+
+
+def open_identity_map():
+    """Starts an empty map for the current context; returns a token for close_identity_map."""
+    return _current_map.set(IdentityMap())
+
+
+def close_identity_map(token):
+    _current_map.reset(token)
+
+
+def current_identity_map():
+    return _current_map.get()
+
+
+@contextmanager
+def identity_map_scope():
+    """
+    One identity map for the duration of the block: a request (IdentityMapMiddleware),
+    or code running outside one (commands, tests).
+    """
+    token = open_identity_map()
+    try:
+        yield current_identity_map()
+    finally:
+        close_identity_map(token)
+
+
+def remember(key, load):
+    """
+    Returns the row stored under `key`, calling `load()` on the first lookup.
+    Without an open map every lookup loads, as before.
+    """
+    identity_map = _current_map.get()
+    if identity_map is None:
+        return load()
+    value = identity_map.get(key)
+    if value is _MISSING:
+        value = identity_map.put(key, load())
+    return value
+
+
+async def aremember(key, aload):
+    """Async variant of remember; `aload` is a coroutine function."""
+    identity_map = _current_map.get()
+    if identity_map is None:
+        return await aload()
+    value = identity_map.get(key)
+    if value is _MISSING:
+        value = identity_map.put(key, await aload())
+    return value
+
+
+def peek(key, default=None):
+    """The row stored under `key` without loading it, or `default`."""
+    identity_map = _current_map.get()
+    if identity_map is None:
+        return default
+    return identity_map.get(key, default)
+
+
+def store(key, value):
+    """Records a row the current request just wrote, so later lookups see it."""
+    identity_map = _current_map.get()
+    if identity_map is not None:
+        identity_map.put(key, value)
+    return value
+
+
+def forget(*keys):
+    identity_map = _current_map.get()
+    if identity_map is not None:
+        identity_map.discard(*keys)
@@ -0,0 +1,49 @@
+# --- Runtime Counters ---
+
+from django.core.cache import cache
+
+
+# Counters live in the default cache: with DJANGO_REDIS_URL every worker adds to the
+# same totals, with the local-memory fallback each process keeps its own.
+KEY_PREFIX = 'instrumentation:'
+
+COUNTERS = (
+    'fragment_cache.hits',
+    'fragment_cache.misses',
+)
+
+
+def increment(name, amount=1):
+    key = KEY_PREFIX + name
+    # add() is a no-op when the key exists, so concurrent first increments don't reset each other
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(key, amount, timeout=None)
+
+
+def counters():
+    values = cache.get_many([KEY_PREFIX + name for name in COUNTERS])
+    return {name: values.get(KEY_PREFIX + name, 0) for name in COUNTERS}
+
+
+def reset():
+    cache.delete_many([KEY_PREFIX + name for name in COUNTERS])
+
+
+def hit_rate(hits, misses):
+    total = hits + misses
+    return hits / total if total else None
+
+
+def report():
+    """
+    Counter totals plus derived rates, as plain data for the report view and command.
+    """
+    values = counters()
+    return {
+        'counters': values,
+        'fragment_cache_hit_rate': hit_rate(values['fragment_cache.hits'], values['fragment_cache.misses']),
+    }
@@ -0,0 +1,43 @@
+# --- Lazily Imported Views ---
+
+from functools import cache, partial
+
+from django.utils.module_loading import import_string
+
+
+VIEWS_PACKAGE = 'vikes_reading_app.views'
+
+
+def lazy_view(name, is_async=False):
+    """
+    A URL callback for `<module>.<view>` under vikes_reading_app.views that imports
+    the view module on its first request, so loading the URLconf (every management
+    command's system checks, a fresh worker) doesn't import every view and what they pull in.
+    `is_async` must match the view, since Django picks sync or async handling from the callback.
+    """
+    dotted_path = f'{VIEWS_PACKAGE}.{name}'
+    load = cache(partial(import_string, dotted_path))
+
+    if is_async:
+        async def view(request, *args, **kwargs):
+            return await load()(request, *args, **kwargs)
+    else:
+        def view(request, *args, **kwargs):
+            return load()(request, *args, **kwargs)
+
+    view.__module__, _, view.__name__ = dotted_path.rpartition('.')
+    view.__qualname__ = view.__name__
+    view.load = load
+    return view
+
+
+def load_lazy_views(patterns):
+    """Imports the view behind every lazy callback in `patterns` (worker warm-up). Returns how many."""
+    loaded = 0
+    for pattern in patterns:
+        if hasattr(pattern, 'url_patterns'):
+            loaded += load_lazy_views(pattern.url_patterns)
+        elif hasattr(pattern.callback, 'load'):
+            pattern.callback.load()
+            loaded += 1
+    return loaded
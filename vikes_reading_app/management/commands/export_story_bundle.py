@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from vikes_reading_app.models import Story
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.services.story_bundle import StoryBundleService
+
+
+class Command(BaseCommand):
+    help = "Export a story with its exercises, questions and audio as a bundle (.zip)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('story_id', type=int)
+        parser.add_argument('output', help="Path of the .zip file to write.")
+
+    def handle(self, *args, **options):
+        repo = ORMStoryRepository()
+        try:
+            story = Story.objects.get(pk=options['story_id'])
+        except Story.DoesNotExist:
+            raise CommandError(f"Story {options['story_id']} does not exist.")
+        archive = StoryBundleService.write_archive(
+            story,
+            repo.list_pre_reading_exercises(story),
+            repo.list_post_reading_questions(story),
+        )
+        with open(options['output'], 'wb') as handle:
+            handle.write(archive)
+        self.stdout.write(self.style.SUCCESS(f"Exported \"{story.title}\" to {options['output']}."))
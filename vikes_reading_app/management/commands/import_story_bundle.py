@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from vikes_reading_app.models import CustomUser
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.services.story_bundle import StoryBundleError, StoryBundleService
+
+
+class Command(BaseCommand):
+    help = "Import a story bundle (.zip or .json) in a single transaction."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Bundle file to import.")
+        parser.add_argument('--author', required=True, help="Username of the teacher who will own the story.")
+
+    def handle(self, *args, **options):
+        try:
+            author = CustomUser.objects.get(username=options['author'], role='teacher')
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No teacher named '{options['author']}'.")
+        try:
+            with open(options['path'], 'rb') as handle:
+                manifest, audio = StoryBundleService.read_bundle(handle)
+            story_data, exercises, questions = StoryBundleService.validate(manifest)
+        except (OSError, StoryBundleError) as error:
+            raise CommandError(str(error))
+        story = ORMStoryRepository().import_story_bundle(author.id, story_data, exercises, questions, audio)
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported \"{story.title}\" (id {story.id}) with {len(exercises)} pre-reading exercises "
+            f"and {len(questions)} post-reading questions."
+        ))
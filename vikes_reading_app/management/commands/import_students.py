@@ -0,0 +1,37 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vikes_reading_app.models import ClassGroup
+from vikes_reading_app.services.student_import import StudentImportService
+
+
+class Command(BaseCommand):
+    help = "Create student accounts from a CSV (username, password, optional first_name, last_name, email)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV file to import.")
+        parser.add_argument('--batch-size', type=int, default=StudentImportService.BATCH_SIZE)
+        parser.add_argument('--workers', type=int, default=None,
+                            help="Password hashing processes (default: one per CPU, 0 to hash in-process).")
+        parser.add_argument('--group', type=int, default=None, help="Id of the class group to enrol the students in.")
+
+    def handle(self, *args, **options):
+        group = None
+        if options['group'] is not None:
+            try:
+                group = ClassGroup.objects.get(pk=options['group'])
+            except ClassGroup.DoesNotExist:
+                raise CommandError(f"Class group {options['group']} does not exist.")
+        try:
+            with open(options['path'], encoding='utf-8-sig', newline='') as stream:
+                result = StudentImportService.import_csv(
+                    stream, batch_size=options['batch_size'], group=group,
+                    workers=os.cpu_count() if options['workers'] is None else options['workers'],
+                )
+        except (OSError, UnicodeDecodeError) as error:
+            raise CommandError(str(error))
+
+        for error in result.errors:
+            self.stderr.write(f"line {error.line} ({error.username or '-'}): {' '.join(error.messages)}")
+        self.stdout.write(self.style.SUCCESS(f"Created {result.created} students, skipped {result.failed} rows."))
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from vikes_reading_app import instrumentation
+
+
+class Command(BaseCommand):
+    help = "Print runtime counters (fragment cache hits and misses) collected in the shared cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help="Zero the counters after printing them.")
+
+    def handle(self, *args, **options):
+        if settings.CACHES['default']['BACKEND'].endswith('LocMemCache'):
+            self.stderr.write("Local-memory cache: counters are per process, so this only sees its own. "
+                              "Set DJANGO_REDIS_URL to collect them from every worker.")
+        report = instrumentation.report()
+        for name, value in report['counters'].items():
+            self.stdout.write(f"{name}: {value}")
+        rate = report['fragment_cache_hit_rate']
+        self.stdout.write(f"fragment_cache.hit_rate: {'n/a' if rate is None else f'{rate:.1%}'}")
+        if options['reset']:
+            instrumentation.reset()
@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# What a fresh interpreter imports for each kind of cold start
+TARGETS = {
+    'setup': "import django; django.setup()",
+    'urls': "import django; django.setup(); from django.urls import get_resolver; get_resolver().url_patterns",
+    'wsgi': "import vikes_project.wsgi",
+}
+
+
+def parse_importtime(output):
+    """
+    (module, self µs, cumulative µs) for each line `python -X importtime` writes to stderr,
+    in import order. Other stderr lines (warnings, log output) are skipped.
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():
+            continue  # Header
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def by_package(rows):
+    """Self time summed per top-level package, slowest first."""
+    totals = defaultdict(int)
+    for module, self_us, _ in rows:
+        totals[module.split('.')[0]] += self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+class Command(BaseCommand):
+    help = "Report import time per module for a cold start, as a digest of python -X importtime."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', choices=sorted(TARGETS), default='urls',
+                            help="Cold start to measure: Django setup, setup plus the URLconf (default), or a WSGI worker.")
+        parser.add_argument('--limit', type=int, default=15, help="Rows in each table.")
+        parser.add_argument('--sort', choices=('self', 'cumulative'), default='self',
+                            help="Order the module table by the module's own time or including what it imports.")
+
+    def handle(self, *args, **options):
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'vikes_project.settings')}
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', TARGETS[options['target']]],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if result.returncode:
+            raise CommandError(f"Cold start failed:\n{result.stderr[-2000:]}")
+
+        rows = parse_importtime(result.stderr)
+        total_us = sum(self_us for _, self_us, _ in rows)
+        limit = options['limit']
+        self.stdout.write(f"Cold start ({options['target']}): {total_us / 1000:.1f} ms importing {len(rows)} modules")
+
+        self.stdout.write("\nBy package (self time):")
+        for package, self_us in by_package(rows)[:limit]:
+            self.stdout.write(f"  {self_us / 1000:8.1f} ms  {package}")
+
+        column = 1 if options['sort'] == 'self' else 2
+        self.stdout.write(f"\nSlowest modules (by {options['sort']} time):")
+        self.stdout.write(f"  {'self':>8}     {'cumulative':>10}     module")
+        for module, self_us, cumulative_us in sorted(rows, key=lambda row: row[column], reverse=True)[:limit]:
+            self.stdout.write(f"  {self_us / 1000:8.1f} ms  {cumulative_us / 1000:10.1f} ms  {module}")
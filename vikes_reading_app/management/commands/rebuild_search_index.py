@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from vikes_reading_app.repositories.story_search_impl import get_story_search_repository
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text story search index from the story table."
+
+    def handle(self, *args, **options):
+        indexed = get_story_search_repository().rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} stories."))
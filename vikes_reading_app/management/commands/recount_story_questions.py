@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+
+
+class Command(BaseCommand):
+    help = "Recount every story's pre-reading exercises and post-reading questions and fix drifted counts."
+
+    def handle(self, *args, **options):
+        repaired = ORMStoryRepository().recount_question_counts()
+        self.stdout.write(self.style.SUCCESS(f"Repaired counts on {repaired} stories."))
@@ -0,0 +1,84 @@
+# --- Request Middleware ---
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from vikes_reading_app.db_routers import primary_pin, replica_configured
+from vikes_reading_app.identity_map import identity_map_scope
+
+
+class ReplicaPinningMiddleware:
+    """
+    Read-your-writes for replica reads.
+    A request that writes (any unsafe method) reads from the primary, and so does
+    every request from the same browser for REPLICA_PIN_SECONDS afterwards,
+    which covers the redirect that usually follows and the replica's lag.
+    The pin is set and reset in one call, for the same reason as IdentityMapMiddleware.
+    """
+    COOKIE_NAME = 'pin_primary'
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS', 'TRACE')
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not replica_configured():
+            return self.get_response(request)
+        with primary_pin(self._pinned(request)):
+            response = self.get_response(request)
+        return self._pin_browser(request, response)
+
+    async def __acall__(self, request):
+        if not replica_configured():
+            return await self.get_response(request)
+        with primary_pin(self._pinned(request)):
+            response = await self.get_response(request)
+        return self._pin_browser(request, response)
+
+    def _pinned(self, request):
+        return request.method not in self.SAFE_METHODS or self.COOKIE_NAME in request.COOKIES
+
+    def _pin_browser(self, request, response):
+        if request.method not in self.SAFE_METHODS:
+            response.set_cookie(
+                self.COOKIE_NAME, '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+
+class IdentityMapMiddleware:
+    """
+    Gives every request its own identity map, so repeated repository lookups of
+    the same story, exercise, question or progress row within it hit memory.
+    The map is opened and closed around the whole request in one call: under ASGI,
+    MiddlewareMixin's process_request and process_response run in separate contexts,
+    where the context variable token can't be reset.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with identity_map_scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with identity_map_scope():
+            return await self.get_response(request)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0016_progress_unique_student_story'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='progress',
+            name='telemetry_seq',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+MAX_LOOKUPS = 3
+
+
+def copy_progress_lookups(apps, schema_editor):
+    """
+    Moves the per-question counters out of Progress.post_reading_lookups.
+    Counters for questions that no longer exist are dropped.
+    """
+    Progress = apps.get_model('vikes_reading_app', 'Progress')
+    PostReadingQuestion = apps.get_model('vikes_reading_app', 'PostReadingQuestion')
+    PostReadingLookup = apps.get_model('vikes_reading_app', 'PostReadingLookup')
+
+    lookups = []
+    progress_rows = Progress.objects.exclude(post_reading_lookups={}).values_list(
+        'student_id', 'read_story_id', 'post_reading_lookups'
+    )
+    for student_id, story_id, counters in progress_rows.iterator():
+        question_ids = set(
+            PostReadingQuestion.objects
+            .filter(story_id=story_id, id__in=[int(key) for key in counters if str(key).isdigit()])
+            .values_list('id', flat=True)
+        )
+        for question_id, count in counters.items():
+            if str(question_id).isdigit() and int(question_id) in question_ids and count:
+                lookups.append(PostReadingLookup(
+                    student_id=student_id,
+                    story_id=story_id,
+                    question_id=int(question_id),
+                    lookup_count=min(int(count), MAX_LOOKUPS),
+                ))
+    PostReadingLookup.objects.bulk_create(lookups, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0017_progress_telemetry_seq'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostReadingLookup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('lookup_count', models.PositiveSmallIntegerField(default=0)),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='vikes_reading_app.postreadingquestion')),
+                ('story', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='vikes_reading_app.story')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['student', 'story'], name='vikes_readi_student_83eed5_idx')],
+                'constraints': [models.UniqueConstraint(fields=('student', 'question'), name='unique_lookup_per_student_question')],
+            },
+        ),
+        migrations.RunPython(copy_progress_lookups, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='progress',
+            name='post_reading_lookups',
+        ),
+    ]
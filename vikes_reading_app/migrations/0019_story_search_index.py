@@ -0,0 +1,55 @@
+from django.db import migrations
+
+
+SEARCH_TABLE = 'vikes_reading_app_story_search'
+STORY_TABLE = 'vikes_reading_app_story'
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Builds the engine-specific full-text index and fills it from existing stories.
+    Other engines fall back to unindexed matching and need nothing here.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+            f"title, description, content, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, title, description, content) "
+            f"SELECT id, title, description, content FROM {STORY_TABLE}"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            f"CREATE TABLE {SEARCH_TABLE} ("
+            f"story_id bigint PRIMARY KEY REFERENCES {STORY_TABLE} (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+            f"document tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX {SEARCH_TABLE}_document_gin ON {SEARCH_TABLE} USING GIN (document)"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (story_id, document) "
+            f"SELECT id, "
+            f"setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+            f"setweight(to_tsvector('english', coalesce(content, '')), 'C') "
+            f"FROM {STORY_TABLE}"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0018_postreadinglookup'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
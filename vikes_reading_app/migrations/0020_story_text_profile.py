@@ -0,0 +1,154 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:16
+
+import re
+from collections import Counter
+from html import unescape
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+
+# A frozen copy of TextAnalysisService.analyze as of this migration, so later changes to the
+# service can't change what the backfill writes or break it on a fresh database
+WORD_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?")
+SENTENCE_END_RE = re.compile(r"[.!?]+(?:\s|$)")
+VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+WORDS_PER_MINUTE = 150
+LONG_WORD_LENGTH = 7
+TOP_WORDS = 10
+STOPWORDS = frozenset("""
+    a an and are as at be but by for from had has have he her his i in is it its
+    of on or she so that the their them then there they this to was we were
+    what when which who will with you your not do did does been me my our us
+""".split())
+LEVELS = [
+    ('beginner', 3.0),
+    ('elementary', 6.0),
+    ('intermediate', 9.0),
+    ('advanced', None),
+]
+PROFILE_FIELDS = [
+    'word_count', 'sentence_count', 'flesch_reading_ease', 'flesch_kincaid_grade',
+    'reading_time_seconds', 'level', 'vocabulary_profile',
+]
+
+
+def _count_syllables(word):
+    word = word.lower().strip("'")
+    if len(word) <= 3:
+        return 1
+    if word.endswith('e') and not word.endswith(('le', 'ee')):
+        word = word[:-1]
+    return max(1, len(VOWEL_GROUP_RE.findall(word)))
+
+
+def _level_for_grade(grade):
+    for level, upper_bound in LEVELS:
+        if upper_bound is None or grade <= upper_bound:
+            return level
+    return ''
+
+
+def _analyze(content):
+    """The text profile field values for `content`."""
+    text = unescape(strip_tags((content or '').replace('>', '> ')))
+    words = WORD_RE.findall(text)
+    word_count = len(words)
+    if word_count == 0:
+        return {
+            'word_count': 0,
+            'sentence_count': 0,
+            'flesch_reading_ease': None,
+            'flesch_kincaid_grade': None,
+            'reading_time_seconds': 0,
+            'level': '',
+            'vocabulary_profile': {},
+        }
+
+    sentence_count = max(1, len(SENTENCE_END_RE.findall(text)))
+    syllables = sum(_count_syllables(word) for word in words)
+    words_per_sentence = word_count / sentence_count
+    syllables_per_word = syllables / word_count
+    reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    grade = max(0.0, 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59)
+
+    lowered = [word.lower() for word in words]
+    frequencies = Counter(word for word in lowered if word not in STOPWORDS)
+    return {
+        'word_count': word_count,
+        'sentence_count': sentence_count,
+        'flesch_reading_ease': round(reading_ease, 1),
+        'flesch_kincaid_grade': round(grade, 1),
+        'reading_time_seconds': round(word_count * 60 / WORDS_PER_MINUTE),
+        'level': _level_for_grade(grade),
+        'vocabulary_profile': {
+            'unique': len(set(lowered)),
+            'ttr': round(len(set(lowered)) / word_count, 3),
+            'long': round(sum(1 for word in lowered if len(word) >= LONG_WORD_LENGTH) / word_count, 3),
+            'top': frequencies.most_common(TOP_WORDS),
+        },
+    }
+
+
+def backfill_text_profile(apps, schema_editor):
+    Story = apps.get_model('vikes_reading_app', 'Story')
+    stories = []
+    for story in Story.objects.only('id', 'content').iterator():
+        for field, value in _analyze(story.content).items():
+            setattr(story, field, value)
+        stories.append(story)
+    Story.objects.bulk_update(stories, PROFILE_FIELDS, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0019_story_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='story',
+            name='flesch_kincaid_grade',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='flesch_reading_ease',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='level',
+            field=models.CharField(blank=True, choices=[('beginner', 'Beginner'), ('elementary', 'Elementary'), ('intermediate', 'Intermediate'), ('advanced', 'Advanced')], max_length=12),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='reading_time_seconds',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='sentence_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='vocabulary_profile',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['level'], name='vikes_readi_level_e8c6bb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['flesch_kincaid_grade'], name='vikes_readi_flesch__99854f_idx'),
+        ),
+        migrations.RunPython(backfill_text_profile, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_reading_stats(apps, schema_editor):
+    Progress = apps.get_model('vikes_reading_app', 'Progress')
+    StoryReadingStats = apps.get_model('vikes_reading_app', 'StoryReadingStats')
+    baselines = {}
+    rows = Progress.objects.filter(reading_time__gt=0).values_list('read_story_id', 'reading_time')
+    for story_id, value in rows.iterator():
+        count, mean, m2 = baselines.get(story_id, (0, 0.0, 0.0))
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+        baselines[story_id] = (count, mean, m2)
+    StoryReadingStats.objects.bulk_create([
+        StoryReadingStats(story_id=story_id, sample_count=count, mean=mean, m2=m2)
+        for story_id, (count, mean, m2) in baselines.items()
+    ], batch_size=500)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0020_story_text_profile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoryReadingStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sample_count', models.PositiveIntegerField(default=0)),
+                ('mean', models.FloatField(default=0)),
+                ('m2', models.FloatField(default=0)),
+                ('story', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='reading_stats', to='vikes_reading_app.story')),
+            ],
+        ),
+        migrations.RunPython(backfill_reading_stats, migrations.RunPython.noop),
+    ]
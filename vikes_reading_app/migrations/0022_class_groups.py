@@ -0,0 +1,68 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_default_groups(apps, schema_editor):
+    """
+    Rosters used to list every student; give each existing teacher one class
+    holding all existing students so their pages look the same after upgrading.
+    """
+    CustomUser = apps.get_model('vikes_reading_app', 'CustomUser')
+    ClassGroup = apps.get_model('vikes_reading_app', 'ClassGroup')
+    GroupMembership = apps.get_model('vikes_reading_app', 'GroupMembership')
+    student_ids = list(CustomUser.objects.filter(role='student').values_list('id', flat=True))
+    for teacher_id in CustomUser.objects.filter(role='teacher').values_list('id', flat=True):
+        group = ClassGroup.objects.create(teacher_id=teacher_id, name='All students')
+        GroupMembership.objects.bulk_create(
+            [GroupMembership(group=group, student_id=student_id) for student_id in student_ids],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0021_storyreadingstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClassGroup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('teacher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='class_groups', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='GroupMembership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('joined_at', models.DateTimeField(auto_now_add=True)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='vikes_reading_app.classgroup')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='group_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='classgroup',
+            name='students',
+            field=models.ManyToManyField(related_name='student_groups', through='vikes_reading_app.GroupMembership', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='groupmembership',
+            index=models.Index(fields=['student', 'group'], name='vikes_readi_student_c2c315_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='groupmembership',
+            constraint=models.UniqueConstraint(fields=('group', 'student'), name='unique_group_membership'),
+        ),
+        migrations.AddConstraint(
+            model_name='classgroup',
+            constraint=models.UniqueConstraint(fields=('teacher', 'name'), name='unique_class_group_name_per_teacher'),
+        ),
+        migrations.RunPython(create_default_groups, migrations.RunPython.noop),
+    ]
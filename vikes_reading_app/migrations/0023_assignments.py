@@ -0,0 +1,55 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0022_class_groups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Assignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('due_date', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='vikes_reading_app.classgroup')),
+                ('story', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='vikes_reading_app.story')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AssignmentQueueItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('due_date', models.DateField()),
+                ('stage', models.CharField(choices=[('not_started', 'Not started'), ('pre_reading', 'Pre-Reading'), ('reading', 'Reading'), ('post_reading', 'Post-Reading'), ('completed', 'Completed')], default='not_started', max_length=20)),
+                ('next_url', models.CharField(max_length=200)),
+                ('is_completed', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('assignment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='queue_items', to='vikes_reading_app.assignment')),
+                ('story', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='vikes_reading_app.story')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignment_queue', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='assignment',
+            constraint=models.UniqueConstraint(fields=('story', 'group'), name='unique_assignment_per_group'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmentqueueitem',
+            index=models.Index(fields=['student', 'is_completed', 'due_date'], name='vikes_readi_student_7c2220_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmentqueueitem',
+            index=models.Index(fields=['student', 'story'], name='vikes_readi_student_b40976_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='assignmentqueueitem',
+            constraint=models.UniqueConstraint(fields=('student', 'assignment'), name='unique_queue_item_per_assignment'),
+        ),
+    ]
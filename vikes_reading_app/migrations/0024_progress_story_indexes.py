@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0023_assignments'),
+    ]
+
+    operations = [
+        # Create the composite indexes before dropping the FK indexes they replace
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(fields=['read_story', 'current_stage'], name='vikes_readi_read_st_a86353_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['status', 'id'], name='vikes_readi_status_3130fb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['status', 'level'], name='vikes_readi_status_f9d3d2_idx'),
+        ),
+        migrations.AlterField(
+            model_name='progress',
+            name='read_story',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='vikes_reading_app.story'),
+        ),
+        migrations.AlterField(
+            model_name='progress',
+            name='student',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
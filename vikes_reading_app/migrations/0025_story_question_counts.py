@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:06
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count_for_story(model):
+    rows = model.objects.filter(story=OuterRef('pk')).order_by().values('story').annotate(total=Count('pk'))
+    return Coalesce(Subquery(rows.values('total'), output_field=IntegerField()), 0)
+
+
+def backfill_question_counts(apps, schema_editor):
+    Story = apps.get_model('vikes_reading_app', 'Story')
+    PreReadingExercise = apps.get_model('vikes_reading_app', 'PreReadingExercise')
+    PostReadingQuestion = apps.get_model('vikes_reading_app', 'PostReadingQuestion')
+    Story.objects.update(
+        pre_reading_count=_count_for_story(PreReadingExercise),
+        post_reading_count=_count_for_story(PostReadingQuestion),
+    )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0024_progress_story_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='story',
+            name='post_reading_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='pre_reading_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_question_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0025_story_question_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='story',
+            name='content_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:42
+
+from collections import Counter, defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def _tally(totals, option, is_correct):
+    totals['answer_count'] += 1
+    totals['correct_count'] += 1 if is_correct else 0
+    if option in (1, 2, 3, 4):
+        totals[f'option_{option}_count'] += 1
+
+
+def backfill_question_stats(apps, schema_editor):
+    """Counts every student's current answers and lookups once; submits keep them up to date after this."""
+    Progress = apps.get_model('vikes_reading_app', 'Progress')
+    PreReadingExercise = apps.get_model('vikes_reading_app', 'PreReadingExercise')
+    PostReadingQuestion = apps.get_model('vikes_reading_app', 'PostReadingQuestion')
+    PostReadingLookup = apps.get_model('vikes_reading_app', 'PostReadingLookup')
+    QuestionStats = apps.get_model('vikes_reading_app', 'QuestionStats')
+
+    exercises = {exercise.id: exercise for exercise in PreReadingExercise.objects.all()}
+    question_stories = dict(PostReadingQuestion.objects.values_list('id', 'story_id'))
+    totals = defaultdict(Counter)
+
+    for story_id, answers in Progress.objects.values_list('read_story_id', 'answers_given').iterator(chunk_size=2000):
+        answers = answers or {}
+        if 'pre_reading' in answers or 'post_reading' in answers:
+            pre_reading, post_reading = answers.get('pre_reading', {}), answers.get('post_reading', {})
+        else:
+            pre_reading, post_reading = {}, answers  # Older flat post-reading answers
+        for key, answer in pre_reading.items():
+            exercise = exercises.get(int(key)) if str(key).isdigit() else None
+            if exercise is None or exercise.story_id != story_id:
+                continue
+            option = 1 if answer == exercise.option_1 else 2 if answer == exercise.option_2 else None
+            _tally(totals[('exercise', exercise.id, story_id)], option,
+                   option is not None and getattr(exercise, f'is_option_{option}_correct'))
+        for key, answer in post_reading.items():
+            question_id = int(key) if str(key).isdigit() else None
+            if question_stories.get(question_id) != story_id:
+                continue
+            if isinstance(answer, dict):
+                selected = str(answer.get('selected_option', ''))
+                _tally(totals[('question', question_id, story_id)],
+                       int(selected) if selected.isdigit() else None, answer.get('is_correct'))
+            else:
+                _tally(totals[('question', question_id, story_id)], None, answer)
+
+    lookups = PostReadingLookup.objects.values('question_id', 'story_id').annotate(total=Sum('lookup_count'))
+    for row in lookups:
+        if row['total']:
+            totals[('question', row['question_id'], row['story_id'])]['lookup_count'] += row['total']
+
+    QuestionStats.objects.bulk_create(
+        [QuestionStats(story_id=story_id, **{f'{field}_id': item_id}, **counts)
+         for (field, item_id, story_id), counts in totals.items()],
+        batch_size=500,
+    )
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0026_story_content_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('answer_count', models.PositiveIntegerField(default=0)),
+                ('correct_count', models.PositiveIntegerField(default=0)),
+                ('option_1_count', models.PositiveIntegerField(default=0)),
+                ('option_2_count', models.PositiveIntegerField(default=0)),
+                ('option_3_count', models.PositiveIntegerField(default=0)),
+                ('option_4_count', models.PositiveIntegerField(default=0)),
+                ('lookup_count', models.PositiveIntegerField(default=0)),
+                ('exercise', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='vikes_reading_app.prereadingexercise')),
+                ('question', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='vikes_reading_app.postreadingquestion')),
+                ('story', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='question_stats', to='vikes_reading_app.story')),
+            ],
+            options={
+                'constraints': [models.CheckConstraint(condition=models.Q(('exercise__isnull', True), ('question__isnull', True), _connector='XOR'), name='question_stats_one_item')],
+            },
+        ),
+        migrations.RunPython(backfill_question_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:51
+
+import vikes_reading_app.models
+from django.db import migrations, models
+
+
+BATCH_SIZE = 500
+
+
+def _bucket(value):
+    return value if isinstance(value, dict) else {}
+
+
+def _nested(answers):
+    """
+    Schema 1 answers_given (flat post-reading answers, or a missing, null or malformed bucket)
+    in the two-bucket layout.
+    """
+    answers = answers if isinstance(answers, dict) else {}
+    if 'pre_reading' in answers or 'post_reading' in answers:
+        return {
+            'pre_reading': _bucket(answers.get('pre_reading')),
+            'post_reading': _bucket(answers.get('post_reading')),
+        }
+    return {'pre_reading': {}, 'post_reading': answers}
+
+
+def upgrade_answers(apps, schema_editor):
+    Progress = apps.get_model('vikes_reading_app', 'Progress')
+    # Every row is checked: having both keys doesn't mean both buckets are dicts
+    rows = Progress.objects.order_by('pk').values_list('pk', 'answers_given')
+
+    # Only rows already read are written, so the open cursor never meets a row it changed
+    batch = []
+    for pk, answers in rows.iterator(chunk_size=BATCH_SIZE):
+        nested = _nested(answers)
+        if nested == answers:
+            continue
+        batch.append(Progress(pk=pk, answers_given=nested, answers_schema=2))
+        if len(batch) == BATCH_SIZE:
+            Progress.objects.bulk_update(batch, ['answers_given', 'answers_schema'])
+            batch = []
+    if batch:
+        Progress.objects.bulk_update(batch, ['answers_given', 'answers_schema'])
+
+    # Everything else already had the layout and only needs the marker
+    Progress.objects.filter(answers_schema=1).update(answers_schema=2)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0027_question_stats'),
+    ]
+
+    operations = [
+        # Existing rows start at schema 1 and are upgraded below; new rows are written as schema 2
+        migrations.AddField(
+            model_name='progress',
+            name='answers_schema',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AlterField(
+            model_name='progress',
+            name='answers_given',
+            field=models.JSONField(default=vikes_reading_app.models.empty_answers),
+        ),
+        migrations.RunPython(upgrade_answers, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='progress',
+            name='answers_schema',
+            field=models.PositiveSmallIntegerField(default=2),
+        ),
+    ]
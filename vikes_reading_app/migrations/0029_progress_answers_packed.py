@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vikes_reading_app', '0028_progress_answers_schema'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='progress',
+            name='answers_packed',
+            field=models.BinaryField(null=True),
+        ),
+    ]
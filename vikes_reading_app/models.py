@@ -1,5 +1,7 @@
 # --- Imports ---
 
+import math
+
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -13,6 +15,16 @@ ROLE_CHOICES = [
 ]
 
 
+# --- Story Level Choices ---
+
+LEVEL_CHOICES = [
+    ('beginner', 'Beginner'),
+    ('elementary', 'Elementary'),
+    ('intermediate', 'Intermediate'),
+    ('advanced', 'Advanced'),
+]
+
+
 # --- Models ---
 
 # Custom User Model with roles to distinguish between teachers and students
@@ -46,24 +58,58 @@ class Story(models.Model):
         default='draft',
     )
 
+    # Text profile computed at save time by the story repository
+    word_count = models.PositiveIntegerField(default=0)  # Words in the story text
+    sentence_count = models.PositiveIntegerField(default=0)  # Sentences in the story text
+    flesch_reading_ease = models.FloatField(blank=True, null=True)  # Higher is easier
+    flesch_kincaid_grade = models.FloatField(blank=True, null=True)  # Approximate school grade
+    reading_time_seconds = models.PositiveIntegerField(default=0)  # Estimated reading time for a learner
+    level = models.CharField(max_length=12, choices=LEVEL_CHOICES, blank=True)  # Difficulty band derived from the grade
+    vocabulary_profile = models.JSONField(default=dict, blank=True)  # Compact vocabulary stats and top words
+
+    # Kept in step by the story repository; `recount_story_questions` repairs drift
+    pre_reading_count = models.PositiveIntegerField(default=0)  # Number of pre-reading exercises
+    post_reading_count = models.PositiveIntegerField(default=0)  # Number of post-reading questions
+    content_version = models.PositiveIntegerField(default=0)  # Bumped on any exercise/question change; keys cached fragments
+
     def __str__(self):
         return self.title
 
     class Meta:
         indexes = [
             models.Index(fields=['author']),
+            models.Index(fields=['level']),
+            models.Index(fields=['flesch_kincaid_grade']),
+            # Home page: published stories in id order, optionally narrowed by level
+            models.Index(fields=['status', 'id']),
+            models.Index(fields=['status', 'level']),
         ]
 
 
+# answers_given layout version. Schema 1 rows were a flat dict of post-reading answers;
+# migration 0028 rewrote them, so every row now has both stage buckets.
+ANSWERS_SCHEMA = 2
+# Rows saved with settings.COMPACT_ANSWERS keep their answers in answers_packed instead
+# (services/answer_codec.py) and leave answers_given empty.
+PACKED_ANSWERS_SCHEMA = 3
+
+
+def empty_answers():
+    return {'pre_reading': {}, 'post_reading': {}}
+
+
 # Model tracking the progress of a student reading a story
 class Progress(models.Model):
-    student = models.ForeignKey(CustomUser, on_delete=models.CASCADE)  # Student reading the story
-    read_story = models.ForeignKey(Story, on_delete=models.CASCADE)  # Story being read
+    # Single-column FK indexes are left out: (student, read_story) and (read_story, current_stage) lead with them
+    student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, db_index=False)  # Student reading the story
+    read_story = models.ForeignKey(Story, on_delete=models.CASCADE, db_index=False)  # Story being read
     score = models.FloatField(
         default=0,
         validators=[MinValueValidator(0.0), MaxValueValidator(100.0)]
     )  # Score achieved by the student
-    answers_given = models.JSONField(default=dict)  # Answers provided by the student in exercises
+    answers_given = models.JSONField(default=empty_answers)  # Answers provided by the student in exercises
+    answers_schema = models.PositiveSmallIntegerField(default=ANSWERS_SCHEMA)  # Layout version of answers_given
+    answers_packed = models.BinaryField(null=True, editable=False)  # Compact answers when answers_schema is PACKED_ANSWERS_SCHEMA
     current_stage = models.CharField(
         max_length=20,
         choices=[
@@ -77,23 +123,11 @@ class Progress(models.Model):
     reading_time = models.IntegerField(default=0, help_text="Time in seconds")  # Time spent reading
     pre_reading_time = models.IntegerField(default=0, help_text="Time in seconds")  # Time spent in pre-reading exercises
     post_reading_time = models.IntegerField(default=0, help_text="Time in seconds")  # Time spent in post-reading questions
-    post_reading_lookups = models.JSONField(default=dict)  # Additional data/lookups for post-reading phase
+    telemetry_seq = models.BigIntegerField(default=0)  # Highest stage-telemetry sequence number already applied
 
     def __str__(self):
         return f"{self.student.username} - {self.read_story.title} - {self.current_stage}"
 
-    def _normalized_answers(self):
-        answers = self.answers_given or {}
-        if 'pre_reading' in answers or 'post_reading' in answers:
-            return {
-                'pre_reading': answers.get('pre_reading', {}),
-                'post_reading': answers.get('post_reading', {}),
-            }
-        return {
-            'pre_reading': {},
-            'post_reading': answers,
-        }
-
     @staticmethod
     def _percentage(correct, total):
         if total == 0:
@@ -101,12 +135,12 @@ class Progress(models.Model):
         return round((correct / total) * 100)
 
     def get_pre_reading_stats(self):
-        answers = self._normalized_answers()['pre_reading']
-        exercises = self.read_story.pre_reading_exercises.all()
-        total = exercises.count()
+        answers = self.answers_given['pre_reading']
+        total = self.read_story.pre_reading_count
         correct = 0
 
-        for exercise in exercises:
+        # Nothing answered means nothing to grade, so the exercises are only read when needed
+        for exercise in (self.read_story.pre_reading_exercises.all() if answers else ()):
             selected = answers.get(str(exercise.id))
             correct_answer = exercise.option_1 if exercise.is_option_1_correct else exercise.option_2
             if selected == correct_answer:
@@ -120,12 +154,11 @@ class Progress(models.Model):
         }
 
     def get_post_reading_stats(self):
-        answers = self._normalized_answers()['post_reading']
-        questions = self.read_story.post_reading_questions.all()
-        total = questions.count()
+        answers = self.answers_given['post_reading']
+        total = self.read_story.post_reading_count
         correct = 0
 
-        for question in questions:
+        for question in (self.read_story.post_reading_questions.all() if answers else ()):
             answer_data = answers.get(str(question.id))
             if isinstance(answer_data, dict):
                 is_correct = answer_data.get('is_correct', False)
@@ -160,6 +193,10 @@ class Progress(models.Model):
                 name='unique_progress_per_student_story',
             ),
         ]
+        indexes = [
+            # Per-story class views: everyone on a story, or only those at a given stage
+            models.Index(fields=['read_story', 'current_stage']),
+        ]
 
 
 # Model holding pre-reading exercises linked to a story
@@ -196,3 +233,213 @@ class PostReadingQuestion(models.Model):
 
     def __str__(self):
         return f"{self.story.title} - {self.question_text}"
+
+
+# Model counting how often a student looked up the story for one post-reading question
+class PostReadingLookup(models.Model):
+    student = models.ForeignKey(CustomUser, on_delete=models.CASCADE)  # Student doing the lookup
+    story = models.ForeignKey(Story, on_delete=models.CASCADE)  # Story being looked up
+    question = models.ForeignKey(PostReadingQuestion, on_delete=models.CASCADE)  # Question the lookup is for
+    lookup_count = models.PositiveSmallIntegerField(default=0)  # Lookups used so far
+
+    def __str__(self):
+        return f"{self.student.username} - {self.question.question_text} - {self.lookup_count}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['student', 'question'],
+                name='unique_lookup_per_student_question',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['student', 'story']),
+        ]
+
+
+# Model holding the running class baseline of reading times for a story (Welford's algorithm)
+class StoryReadingStats(models.Model):
+    MIN_SAMPLES = 5  # Fewer readings than this is not a baseline yet
+    SKIM_Z_SCORE = -1.5  # This far below the mean counts as skimming
+    STALL_Z_SCORE = 2.0  # This far above the mean counts as stalling
+
+    story = models.OneToOneField(Story, on_delete=models.CASCADE, related_name='reading_stats')  # Story the baseline is for
+    sample_count = models.PositiveIntegerField(default=0)  # Number of reading times in the baseline
+    mean = models.FloatField(default=0)  # Running mean of reading_time (seconds)
+    m2 = models.FloatField(default=0)  # Running sum of squared differences from the mean
+
+    def __str__(self):
+        return f"{self.story.title} - {self.sample_count} readings"
+
+    def add_sample(self, value):
+        self.sample_count += 1
+        delta = value - self.mean
+        self.mean += delta / self.sample_count
+        self.m2 += delta * (value - self.mean)
+
+    def remove_sample(self, value):
+        if self.sample_count <= 1:
+            self.sample_count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        old_mean = self.mean
+        self.sample_count -= 1
+        self.mean = (old_mean * (self.sample_count + 1) - value) / self.sample_count
+        self.m2 = max(0.0, self.m2 - (value - old_mean) * (value - self.mean))
+
+    @property
+    def stddev(self):
+        if self.sample_count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.sample_count - 1))
+
+    def classify(self, value):
+        """
+        Returns 'skimmed', 'stalled' or 'typical' for a reading time compared with the
+        class baseline, or None while there are too few readings to judge.
+        """
+        if not value or self.sample_count < self.MIN_SAMPLES or self.stddev == 0:
+            return None
+        z_score = (value - self.mean) / self.stddev
+        if z_score <= self.SKIM_Z_SCORE:
+            return 'skimmed'
+        if z_score >= self.STALL_Z_SCORE:
+            return 'stalled'
+        return 'typical'
+
+
+# Model holding running answer counts for one exercise or question (teacher item analysis).
+# Submits, lookups and progress resets adjust it in place, so reading it never touches Progress.
+class QuestionStats(models.Model):
+    story = models.ForeignKey(Story, on_delete=models.CASCADE, related_name='question_stats')  # Story the item belongs to
+    exercise = models.OneToOneField(
+        PreReadingExercise, on_delete=models.CASCADE, null=True, blank=True, related_name='stats',
+    )  # Set for a pre-reading exercise
+    question = models.OneToOneField(
+        PostReadingQuestion, on_delete=models.CASCADE, null=True, blank=True, related_name='stats',
+    )  # Set for a post-reading question
+    answer_count = models.PositiveIntegerField(default=0)  # Students with an answer on record
+    correct_count = models.PositiveIntegerField(default=0)  # Of those, how many are correct
+    option_1_count = models.PositiveIntegerField(default=0)  # Answers choosing each option
+    option_2_count = models.PositiveIntegerField(default=0)
+    option_3_count = models.PositiveIntegerField(default=0)
+    option_4_count = models.PositiveIntegerField(default=0)
+    lookup_count = models.PositiveIntegerField(default=0)  # Story lookups used for this question
+
+    def __str__(self):
+        item = self.exercise or self.question
+        return f"{item.question_text} - {self.answer_count} answers"
+
+    @property
+    def option_counts(self):
+        counts = [self.option_1_count, self.option_2_count, self.option_3_count, self.option_4_count]
+        return counts[:2] if self.exercise_id else counts
+
+    @property
+    def correct_percentage(self):
+        if not self.answer_count:
+            return None
+        return round(self.correct_count / self.answer_count * 100)
+
+    @property
+    def average_lookups(self):
+        if not self.answer_count:
+            return None
+        return self.lookup_count / self.answer_count
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(exercise__isnull=True) ^ models.Q(question__isnull=True),
+                name='question_stats_one_item',
+            ),
+        ]
+
+
+# Model representing a teacher's class; rosters and analytics pages are scoped to these
+class ClassGroup(models.Model):
+    name = models.CharField(max_length=100)  # Class name shown to the teacher
+    teacher = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='class_groups')  # Teacher who owns the class
+    students = models.ManyToManyField(
+        CustomUser,
+        through='GroupMembership',
+        related_name='student_groups',
+    )  # Students enrolled in the class
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.teacher.username})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['teacher', 'name'], name='unique_class_group_name_per_teacher'),
+        ]
+
+
+# Model linking a student to a class group
+class GroupMembership(models.Model):
+    group = models.ForeignKey(ClassGroup, on_delete=models.CASCADE, related_name='memberships')  # Class the student is in
+    student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='group_memberships')  # Enrolled student
+    joined_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.student.username} in {self.group.name}"
+
+    class Meta:
+        constraints = [
+            # Also serves group -> students lookups
+            models.UniqueConstraint(fields=['group', 'student'], name='unique_group_membership'),
+        ]
+        indexes = [
+            # student -> groups lookups (which teachers can see this student)
+            models.Index(fields=['student', 'group']),
+        ]
+
+
+# Model representing a story assigned to a class group with a due date
+class Assignment(models.Model):
+    story = models.ForeignKey(Story, on_delete=models.CASCADE, related_name='assignments')  # Story to read
+    group = models.ForeignKey(ClassGroup, on_delete=models.CASCADE, related_name='assignments')  # Class it is assigned to
+    due_date = models.DateField()  # Day the reading should be finished by
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.story.title} for {self.group.name} (due {self.due_date})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['story', 'group'], name='unique_assignment_per_group'),
+        ]
+
+
+# Materialized to-do entry per student and assignment, kept in step by the reading flow
+class AssignmentQueueItem(models.Model):
+    STAGE_CHOICES = [
+        ('not_started', 'Not started'),
+        ('pre_reading', 'Pre-Reading'),
+        ('reading', 'Reading'),
+        ('post_reading', 'Post-Reading'),
+        ('completed', 'Completed'),
+    ]
+
+    student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='assignment_queue')  # Student the entry is for
+    assignment = models.ForeignKey(Assignment, on_delete=models.CASCADE, related_name='queue_items')  # Assignment it came from
+    story = models.ForeignKey(Story, on_delete=models.CASCADE)  # Copied from the assignment so flow updates need no join
+    due_date = models.DateField()  # Copied from the assignment for ordering
+    stage = models.CharField(max_length=20, choices=STAGE_CHOICES, default='not_started')  # Where the student is in the story
+    next_url = models.CharField(max_length=200)  # Where the student continues from
+    is_completed = models.BooleanField(default=False)  # True once the post-reading questions are all answered
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.student.username}: {self.story.title} ({self.stage})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['student', 'assignment'], name='unique_queue_item_per_assignment'),
+        ]
+        indexes = [
+            # The student's to-do list: open items by due date
+            models.Index(fields=['student', 'is_completed', 'due_date']),
+            # Flow endpoints update by (student, story)
+            models.Index(fields=['student', 'story']),
+        ]
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+
+
+class AssignmentRepository(ABC):
+    """
+    Interface (contract) for story assignments and the per-student to-do queue.
+    """
+
+    @abstractmethod
+    def assign_story(self, group, story, due_date):
+        """
+        Assign a published story to a class group and queue it for every member.
+        Raises ValueError for a draft.
+        """
+        pass
+
+    @abstractmethod
+    def list_group_assignments(self, group) -> list:
+        pass
+
+    @abstractmethod
+    def list_student_queue(self, student) -> list:
+        """
+        The student's open assignments of published stories, soonest due first.
+        """
+        pass
+
+    @abstractmethod
+    def enqueue_group_members(self, group, student_ids) -> None:
+        pass
+
+    @abstractmethod
+    def dequeue_group_members(self, group, student_ids) -> None:
+        pass
+
+    @abstractmethod
+    def sync_progress(self, student_id: int, story_id: int) -> None:
+        """
+        Bring the student's queue entries for a story in line with their progress.
+        """
+        pass
@@ -0,0 +1,97 @@
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from vikes_reading_app.db_routers import read_alias
+from vikes_reading_app.dtos.progress_session import SessionProgressDTO
+from vikes_reading_app.models import Assignment, AssignmentQueueItem, GroupMembership, Progress, Story
+from vikes_reading_app.services.reading_flow import ReadingFlowService
+from .assignment_repository import AssignmentRepository
+
+
+class ORMAssignmentRepository(AssignmentRepository):
+    """
+    Assignments plus a materialized to-do queue (one row per student and assignment).
+    The queue is written by the reading flow, so reading it is a single indexed query.
+    """
+
+    def assign_story(self, group, story, due_date):
+        # Students can't open drafts, so a queued draft would only lead them to a 403
+        if story.status != 'published':
+            raise ValueError("Only published stories can be assigned.")
+        with transaction.atomic():
+            assignment, created = Assignment.objects.update_or_create(
+                story=story, group=group, defaults={'due_date': due_date},
+            )
+            if not created:
+                assignment.queue_items.update(due_date=due_date)
+            student_ids = GroupMembership.objects.filter(group=group).values_list('student_id', flat=True)
+            self._enqueue(assignment, list(student_ids))
+        return assignment
+
+    def list_group_assignments(self, group) -> list:
+        return (
+            Assignment.objects.using(read_alias()).filter(group=group)
+            .select_related('story')
+            .annotate(
+                student_count=Count('queue_items'),
+                completed_count=Count('queue_items', filter=Q(queue_items__is_completed=True)),
+            )
+            .order_by('due_date', 'id')
+        )
+
+    def list_student_queue(self, student) -> list:
+        return (
+            AssignmentQueueItem.objects.using(read_alias())
+            # A story moved back to draft after it was assigned stays out of the queue until republished
+            .filter(student=student, is_completed=False, story__status='published')
+            .select_related('story')
+            .order_by('due_date', 'id')
+        )
+
+    def _enqueue(self, assignment, student_ids) -> None:
+        """
+        Creates queue entries for students, starting from whatever progress they already have.
+        """
+        if not student_ids:
+            return
+        story = assignment.story
+        progress_by_student = {
+            progress.student_id: ReadingFlowService.unpack_answers(progress)
+            for progress in Progress.objects.filter(read_story=story, student_id__in=student_ids)
+        }
+        AssignmentQueueItem.objects.bulk_create(
+            [
+                AssignmentQueueItem(
+                    student_id=student_id,
+                    assignment=assignment,
+                    story=story,
+                    due_date=assignment.due_date,
+                    **ReadingFlowService.get_queue_entry(
+                        SessionProgressDTO.from_model(progress_by_student.get(student_id), story.id), story,
+                    ),
+                )
+                for student_id in student_ids
+            ],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+
+    def enqueue_group_members(self, group, student_ids) -> None:
+        for assignment in Assignment.objects.filter(group=group).select_related('story'):
+            self._enqueue(assignment, list(student_ids))
+
+    def dequeue_group_members(self, group, student_ids) -> None:
+        AssignmentQueueItem.objects.filter(assignment__group=group, student_id__in=student_ids).delete()
+
+    def sync_progress(self, student_id: int, story_id: int) -> None:
+        items = AssignmentQueueItem.objects.filter(student_id=student_id, story_id=story_id)
+        # Most progress writes are for unassigned stories; keep those to one indexed lookup
+        if not items.exists():
+            return
+        story = Story.objects.get(pk=story_id)
+        progress = ReadingFlowService.unpack_answers(
+            Progress.objects.filter(student_id=student_id, read_story_id=story_id).first(),
+        )
+        entry = ReadingFlowService.get_queue_entry(SessionProgressDTO.from_model(progress, story_id), story)
+        items.update(updated_at=timezone.now(), **entry)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from vikes_reading_app.dtos.progress_session import SessionProgressDTO
+from vikes_reading_app.dtos.progress_session import SessionProgressDTO, StoryEntrySnapshotDTO
 
 class ProgressRepository(ABC):
 
@@ -12,6 +12,10 @@ class ProgressRepository(ABC):
     def get_progress_model(self, student, story):
         pass
 
+    @abstractmethod
+    def get_story_entry_snapshot(self, student_id: int, story_id: int) -> StoryEntrySnapshotDTO:
+        pass
+
     @abstractmethod
     def get_or_create_progress(self, student, story):
         pass
@@ -20,18 +24,59 @@ class ProgressRepository(ABC):
     def save_progress(self, progress):
         pass
 
+    @abstractmethod
+    def update_progress(self, student, story, mutate):
+        """
+        Read-modify-write of one Progress row as a single serialized write.
+        """
+        pass
+
     @abstractmethod
     def save_time(self, student, story, time_field: str, current_stage: str, time_spent: int):
         pass
 
+    @abstractmethod
+    def apply_stage_timings(self, progress, updates: dict, seq: int) -> bool:
+        pass
+
     @abstractmethod
     def delete_progress(self, student, story) -> None:
         pass
 
+    @abstractmethod
+    def record_lookup(self, student, story, question_id: int, limit: int):
+        pass
+
+    @abstractmethod
+    def get_lookup_count(self, student, question_id: int) -> int:
+        pass
+
     @abstractmethod
     def list_story_titles_for_student(self, student) -> list:
         pass
 
+    @abstractmethod
+    def list_story_titles_by_student(self, students) -> dict:
+        pass
+
     @abstractmethod
     def list_progress_records(self, student, stories) -> list:
         pass
+
+    # --- Async variants (used by the ASGI submit endpoints) ---
+
+    @abstractmethod
+    async def aget_or_create_progress(self, student, story):
+        pass
+
+    @abstractmethod
+    async def asave_progress(self, progress):
+        pass
+
+    @abstractmethod
+    async def aupdate_progress(self, student, story, mutate):
+        pass
+
+    @abstractmethod
+    async def asave_time(self, student, story, time_field: str, current_stage: str, time_spent: int):
+        pass
@@ -1,54 +1,259 @@
+from asgiref.sync import sync_to_async
+from django.db import connections, router, transaction
+from django.db.models import F, FilteredRelation, Q
+
+from vikes_reading_app.db_routers import read_alias
+from vikes_reading_app.identity_map import forget, peek, remember, store
+from .assignment_repository_impl import ORMAssignmentRepository
 from .progress_repository import ProgressRepository
-from vikes_reading_app.models import Progress
-from vikes_reading_app.dtos.progress_session import SessionProgressDTO
+from .question_stats_repository_impl import ORMQuestionStatsRepository
+from .story_repository_impl import ORMStoryRepository
+from vikes_reading_app.models import Progress, PostReadingLookup, Story, StoryReadingStats, empty_answers
+from vikes_reading_app.dtos.progress_session import SessionProgressDTO, StoryEntrySnapshotDTO
+from vikes_reading_app.services import answer_codec
+from vikes_reading_app.services.reading_flow import ReadingFlowService
 
 class ORMProgressRepository(ProgressRepository):
-    def get_progress(self, student_id: int, story_id: int) -> SessionProgressDTO:
+    # Progress writes keep the students' assignment queues and the item statistics in step
+    assignment_repo = ORMAssignmentRepository()
+    question_stats_repo = ORMQuestionStatsRepository()
+    story_repo = ORMStoryRepository()
 
-        progress_model = Progress.objects.filter(student_id=student_id, read_story_id=story_id).first()
+    @staticmethod
+    def _key(student_id, story_id):
+        # Identity map key; writes store the saved row (or forget it) under the same key
+        return ('progress', student_id, story_id)
 
-        if not progress_model:
-            return SessionProgressDTO(
-                story_id=story_id,
-                score=0.0,
-                answers_given={},
-                current_stage="pre_reading",
-                pre_reading_time=0,
-                post_reading_time=0,
-                )
-        
-        return SessionProgressDTO(
-            story_id=progress_model.read_story_id,
-            score=progress_model.score,
-            answers_given=progress_model.answers_given,
-            current_stage=progress_model.current_stage,
-            pre_reading_time=progress_model.pre_reading_time,
-            post_reading_time=progress_model.post_reading_time,
+    def get_progress(self, student_id: int, story_id: int) -> SessionProgressDTO:
+        progress_model = remember(
+            self._key(student_id, story_id),
+            lambda: ReadingFlowService.unpack_answers(
+                Progress.objects.filter(student_id=student_id, read_story_id=story_id).first(),
+            ),
         )
+        return SessionProgressDTO.from_model(progress_model, story_id)
 
     def get_progress_model(self, student, story):
-        return Progress.objects.filter(student=student, read_story=story).first()
+        return remember(
+            self._key(student.id, story.id),
+            lambda: ReadingFlowService.unpack_answers(
+                Progress.objects.filter(student=student, read_story=story).first(),
+            ),
+        )
+
+    def get_story_entry_snapshot(self, student_id: int, story_id: int) -> StoryEntrySnapshotDTO:
+        """
+        The student's progress and the story's exercise and question counts in one query:
+        the story row, with its denormalized counts, left-joined to this student's progress.
+        """
+        row = (
+            Story.objects
+            .filter(pk=story_id)
+            .annotate(mine=FilteredRelation('progress', condition=Q(progress__student_id=student_id)))
+            .values(
+                'pre_reading_count', 'post_reading_count', 'mine__id', 'mine__score', 'mine__answers_given',
+                'mine__answers_schema', 'mine__answers_packed', 'mine__current_stage', 'mine__pre_reading_time', 'mine__post_reading_time',
+            )
+            .first()
+        ) or {}
+        progress = SessionProgressDTO(story_id=story_id)
+        if row.get('mine__id') is not None:
+            progress = SessionProgressDTO(
+                story_id=story_id,
+                score=row['mine__score'],
+                answers_given=answer_codec.stored(
+                    row['mine__answers_given'], row['mine__answers_schema'], row['mine__answers_packed'],
+                ),
+                current_stage=row['mine__current_stage'],
+                pre_reading_time=row['mine__pre_reading_time'],
+                post_reading_time=row['mine__post_reading_time'],
+            )
+        return StoryEntrySnapshotDTO(
+            progress=progress,
+            pre_reading_total=row.get('pre_reading_count', 0),
+            post_reading_total=row.get('post_reading_count', 0),
+        )
 
     def get_or_create_progress(self, student, story):
-        return Progress.objects.get_or_create(student=student, read_story=story)
+        progress = peek(self._key(student.id, story.id))
+        if progress is not None:
+            return progress, False
+        progress, created = Progress.objects.get_or_create(student=student, read_story=story)
+        ReadingFlowService.unpack_answers(progress)
+        return store(self._key(student.id, story.id), progress), created
 
     def save_progress(self, progress):
-        progress.save()
-        return progress
+        with ReadingFlowService.packed_answers(progress):
+            progress.save()
+        self.assignment_repo.sync_progress(progress.student_id, progress.read_story_id)
+        return store(self._key(progress.student_id, progress.read_story_id), progress)
 
-    def save_time(self, student, story, time_field: str, current_stage: str, time_spent: int):
-        progress, _ = Progress.objects.update_or_create(
-            student=student,
-            read_story=story,
-            defaults={
-                time_field: time_spent,
-                'current_stage': current_stage,
-            }
+    def update_progress(self, student, story, mutate):
+        """
+        Applies `mutate(progress)` and saves it in one transaction holding the write lock.
+        Two tabs submitting at once are serialized instead of overwriting each other's
+        answers: PostgreSQL locks the row, and SQLite in tuned mode takes the database
+        write lock at BEGIN IMMEDIATE, so the busy timeout applies instead of failing
+        with "database is locked" when a read transaction tries to upgrade.
+        """
+        with transaction.atomic():
+            progress, _ = Progress.objects.select_for_update().get_or_create(
+                student=student,
+                read_story=story,
+            )
+            ReadingFlowService.unpack_answers(progress)
+            before = self._answers(progress.answers_given)
+            mutate(progress)
+            with ReadingFlowService.packed_answers(progress):
+                progress.save()
+            self._record_answer_stats(story, before, progress.answers_given)
+            self.assignment_repo.sync_progress(student.id, story.id)
+        return store(self._key(student.id, story.id), progress)
+
+    @staticmethod
+    def _answers(answers_given):
+        # A copy: the mutators write into the stored buckets
+        return {kind: dict(answers) for kind, answers in answers_given.items()}
+
+    def _record_answer_stats(self, story, before, after):
+        """Moves the student's contribution to the item statistics. Must run inside the caller's transaction."""
+        self.question_stats_repo.record_answer_changes(
+            story, before, after, lambda: self.story_repo.list_pre_reading_exercises(story),
         )
-        return progress
+
+    def save_time(self, student, story, time_field: str, current_stage: str, time_spent: int):
+        with transaction.atomic():
+            progress, _ = Progress.objects.select_for_update().get_or_create(
+                student=student,
+                read_story=story,
+            )
+            previous = getattr(progress, time_field)
+            setattr(progress, time_field, time_spent)
+            progress.current_stage = current_stage
+            progress.save(update_fields=[time_field, 'current_stage'])
+            if time_field == 'reading_time':
+                self._record_reading_time(story.id, previous, time_spent)
+            self.assignment_repo.sync_progress(student.id, story.id)
+        ReadingFlowService.unpack_answers(progress)
+        return store(self._key(student.id, story.id), progress)
+
+    def apply_stage_timings(self, progress, updates: dict, seq: int) -> bool:
+        """
+        Writes folded stage telemetry in a single UPDATE.
+        The sequence guard turns replayed or out-of-order batches into no-ops.
+        """
+        # The UPDATE bypasses the instance, so a later lookup in this request reloads it
+        forget(self._key(progress.student_id, progress.read_story_id))
+        if 'reading_time' not in updates:
+            updated = Progress.objects.filter(pk=progress.pk, telemetry_seq__lt=seq).update(
+                telemetry_seq=seq,
+                **updates,
+            )
+            if updated and 'current_stage' in updates:
+                self.assignment_repo.sync_progress(progress.student_id, progress.read_story_id)
+            return updated == 1
+
+        with transaction.atomic():
+            previous = Progress.objects.select_for_update().filter(
+                pk=progress.pk, telemetry_seq__lt=seq
+            ).values_list('reading_time', flat=True).first()
+            if previous is None:
+                return False
+            Progress.objects.filter(pk=progress.pk).update(telemetry_seq=seq, **updates)
+            self._record_reading_time(progress.read_story_id, previous, updates['reading_time'])
+            if 'current_stage' in updates:
+                self.assignment_repo.sync_progress(progress.student_id, progress.read_story_id)
+        return True
 
     def delete_progress(self, student, story) -> None:
-        Progress.objects.filter(student=student, read_story=story).delete()
+        forget(self._key(student.id, story.id))
+        with transaction.atomic():
+            previous = Progress.objects.select_for_update().filter(
+                student=student, read_story=story
+            ).values('reading_time', 'answers_given', 'answers_schema', 'answers_packed').first()
+            lookups = PostReadingLookup.objects.filter(student=student, story=story)
+            removed_lookups = {question_id: -count for question_id, count in lookups.values_list('question_id', 'lookup_count')}
+            Progress.objects.filter(student=student, read_story=story).delete()
+            lookups.delete()
+            if previous:
+                answers = answer_codec.stored(
+                    previous['answers_given'], previous['answers_schema'], previous['answers_packed'],
+                )
+                self._record_answer_stats(story, answers, empty_answers())
+            if previous and previous['reading_time']:
+                self._record_reading_time(story.id, previous['reading_time'], 0)
+            self.question_stats_repo.record_lookups(story.id, removed_lookups)
+            self.assignment_repo.sync_progress(student.id, story.id)
+
+    def _record_reading_time(self, story_id: int, previous: int, current: int) -> None:
+        """
+        Moves one student's reading time in the story baseline from previous to current.
+        Only positive times are samples, so 0 means "not in the baseline".
+        Must run inside the caller's transaction.
+        """
+        if previous == current:
+            return
+        stats, _ = StoryReadingStats.objects.select_for_update().get_or_create(story_id=story_id)
+        if previous:
+            stats.remove_sample(previous)
+        if current:
+            stats.add_sample(current)
+        stats.save()
+
+    def record_lookup(self, student, story, question_id: int, limit: int):
+        """
+        Atomically records one lookup unless the limit is already used up.
+        Returns the new count, or None when no lookups are left.
+
+        On SQLite and PostgreSQL this is a single upsert statement, so the
+        limit check and the increment cannot interleave across tabs.
+        The question's item statistics count the lookup in the same transaction.
+        """
+        with transaction.atomic():
+            count = self._increment_lookup(student, story, question_id, limit)
+            if count is not None:
+                self.question_stats_repo.record_lookups(story.id, {int(question_id): 1})
+        return count
+
+    def _increment_lookup(self, student, story, question_id: int, limit: int):
+        connection = connections[router.db_for_write(PostReadingLookup)]
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            return self._record_lookup_fallback(student, story, question_id, limit)
+
+        qn = connection.ops.quote_name
+        table = qn(PostReadingLookup._meta.db_table)
+        count = qn('lookup_count')
+        sql = (
+            f"INSERT INTO {table} ({qn('student_id')}, {qn('story_id')}, {qn('question_id')}, {count}) "
+            f"VALUES (%s, %s, %s, 1) "
+            f"ON CONFLICT ({qn('student_id')}, {qn('question_id')}) "
+            f"DO UPDATE SET {count} = {table}.{count} + 1 WHERE {table}.{count} < %s "
+            f"RETURNING {count}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [student.id, story.id, question_id, limit])
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _record_lookup_fallback(self, student, story, question_id: int, limit: int):
+        lookup, _ = PostReadingLookup.objects.get_or_create(
+            student=student, story=story, question_id=question_id,
+        )
+        updated = PostReadingLookup.objects.filter(pk=lookup.pk, lookup_count__lt=limit).update(
+            lookup_count=F('lookup_count') + 1,
+        )
+        if not updated:
+            return None
+        lookup.refresh_from_db(fields=['lookup_count'])
+        return lookup.lookup_count
+
+    def get_lookup_count(self, student, question_id: int) -> int:
+        return (
+            PostReadingLookup.objects
+            .filter(student=student, question_id=question_id)
+            .values_list('lookup_count', flat=True)
+            .first()
+        ) or 0
 
     def list_story_titles_for_student(self, student) -> list:
         return list(
@@ -59,11 +264,52 @@ class ORMProgressRepository(ProgressRepository):
             .distinct()
         )
 
+    def list_story_titles_by_student(self, students) -> dict:
+        """
+        Distinct story titles started by each student, for a whole roster in one query.
+        """
+        titles = {}
+        rows = (
+            Progress.objects.using(read_alias())
+            .filter(student__in=students)
+            .values_list('student_id', 'read_story__title')
+            .distinct()
+            .order_by('student_id', 'read_story__title')
+        )
+        for student_id, title in rows:
+            titles.setdefault(student_id, []).append(title)
+        return titles
+
     def list_progress_records(self, student, stories) -> list:
-        return Progress.objects.filter(
+        # Rows saved compact still need ReadingFlowService.unpack_answers before their stats are read
+        return Progress.objects.using(read_alias()).filter(
             student=student,
             read_story__in=stories
-        ).select_related('read_story').prefetch_related(
+        ).select_related('read_story', 'read_story__reading_stats').prefetch_related(
             'read_story__pre_reading_exercises',
             'read_story__post_reading_questions',
         )
+
+    # --- Async variants (Django async ORM) ---
+
+    async def aget_or_create_progress(self, student, story):
+        progress = peek(self._key(student.id, story.id))
+        if progress is not None:
+            return progress, False
+        progress, created = await Progress.objects.aget_or_create(student=student, read_story=story)
+        ReadingFlowService.unpack_answers(progress)
+        return store(self._key(student.id, story.id), progress), created
+
+    async def asave_progress(self, progress):
+        with ReadingFlowService.packed_answers(progress):
+            await progress.asave()
+        await sync_to_async(self.assignment_repo.sync_progress)(progress.student_id, progress.read_story_id)
+        return store(self._key(progress.student_id, progress.read_story_id), progress)
+
+    async def aupdate_progress(self, student, story, mutate):
+        # The write lock needs a transaction, which the async ORM cannot hold open
+        return await sync_to_async(self.update_progress)(student, story, mutate)
+
+    async def asave_time(self, student, story, time_field: str, current_stage: str, time_spent: int):
+        # The baseline update needs a transaction, which the async ORM cannot hold open
+        return await sync_to_async(self.save_time)(student, story, time_field, current_stage, time_spent)
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+
+
+class QuestionStatsRepository(ABC):
+    """
+    Interface (contract) for per-question answer statistics (teacher item analysis).
+    """
+
+    @abstractmethod
+    def record_answer_changes(self, story, before: dict, after: dict, load_exercises) -> None:
+        """
+        Move the counters from one student's previous answers to their current ones.
+        `before`/`after` are normalized answers; `load_exercises()` returns the story's
+        pre-reading exercises and is only called when a pre-reading answer changed.
+        """
+        pass
+
+    @abstractmethod
+    def record_lookups(self, story_id: int, lookups: dict) -> None:
+        """
+        Add (or with negative counts, remove) story lookups per post-reading question id.
+        """
+        pass
+
+    @abstractmethod
+    def get_story_stats(self, story) -> dict:
+        """
+        Stats rows for the story's items, keyed by ('pre_reading', exercise_id) or ('post_reading', question_id).
+        """
+        pass
+
+    @abstractmethod
+    def rebuild_item_stats(self, story, kind: str, item) -> None:
+        """
+        Recount one item from every student's answers, after its options or answer key changed.
+        """
+        pass
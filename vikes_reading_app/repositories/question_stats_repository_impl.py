@@ -0,0 +1,115 @@
+from collections import Counter
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from vikes_reading_app.models import PostReadingLookup, Progress, QuestionStats
+from vikes_reading_app.services import answer_codec
+from .question_stats_repository import QuestionStatsRepository
+
+
+class ORMQuestionStatsRepository(QuestionStatsRepository):
+    """
+    One QuestionStats row per answered item, adjusted by deltas as answers change.
+    Item analysis then reads O(questions) rows instead of every student's answers.
+    """
+    # Stats row field pointing at the item, per answer kind
+    ITEM_FIELDS = {
+        'pre_reading': 'exercise_id',
+        'post_reading': 'question_id',
+    }
+
+    @staticmethod
+    def _pre_reading_tally(answer, exercise):
+        """(option number or None, is_correct) for a stored pre-reading answer (the option text)."""
+        for option in (1, 2):
+            if answer == getattr(exercise, f'option_{option}'):
+                return option, getattr(exercise, f'is_option_{option}_correct')
+        return None, False
+
+    @staticmethod
+    def _post_reading_tally(answer):
+        """(option number or None, is_correct) for a stored post-reading answer."""
+        if not isinstance(answer, dict):
+            return None, bool(answer)  # Legacy answers only kept correctness
+        try:
+            option = int(answer.get('selected_option'))
+        except (TypeError, ValueError):
+            option = None
+        return (option if option in (1, 2, 3, 4) else None), bool(answer.get('is_correct'))
+
+    def _tally(self, kind, item_id, answer, exercises):
+        if kind == 'pre_reading':
+            exercise = exercises.get(int(item_id))
+            if exercise is None:
+                return None  # Answer to a deleted exercise
+            return self._pre_reading_tally(answer, exercise)
+        return self._post_reading_tally(answer)
+
+    @staticmethod
+    def _add(deltas, tally, sign):
+        option, is_correct = tally
+        deltas['answer_count'] += sign
+        deltas['correct_count'] += sign if is_correct else 0
+        if option is not None:
+            deltas[f'option_{option}_count'] += sign
+
+    def _apply(self, story_id, kind, item_id, deltas):
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        item = {self.ITEM_FIELDS[kind]: item_id}
+        stats, _ = QuestionStats.objects.get_or_create(story_id=story_id, **item)
+        QuestionStats.objects.filter(pk=stats.pk).update(**{
+            field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()
+        })
+
+    def record_answer_changes(self, story, before: dict, after: dict, load_exercises) -> None:
+        exercises = None
+        for kind in self.ITEM_FIELDS:
+            old_answers, new_answers = before.get(kind, {}), after.get(kind, {})
+            for item_id in old_answers.keys() | new_answers.keys():
+                old, new = old_answers.get(item_id), new_answers.get(item_id)
+                if old == new:
+                    continue
+                if kind == 'pre_reading' and exercises is None:
+                    exercises = {exercise.id: exercise for exercise in load_exercises()}
+                deltas = Counter()
+                for answer, sign in ((old, -1), (new, 1)):
+                    tally = None if answer is None else self._tally(kind, item_id, answer, exercises)
+                    if tally is not None:
+                        self._add(deltas, tally, sign)
+                self._apply(story.id, kind, int(item_id), deltas)
+
+    def record_lookups(self, story_id: int, lookups: dict) -> None:
+        for question_id, count in lookups.items():
+            self._apply(story_id, 'post_reading', question_id, {'lookup_count': count})
+
+    def get_story_stats(self, story) -> dict:
+        stats = {}
+        for row in QuestionStats.objects.filter(story=story):
+            if row.exercise_id:
+                stats[('pre_reading', row.exercise_id)] = row
+            else:
+                stats[('post_reading', row.question_id)] = row
+        return stats
+
+    def rebuild_item_stats(self, story, kind: str, item) -> None:
+        key = str(item.id)
+        exercises = {item.id: item} if kind == 'pre_reading' else None
+        totals = Counter()
+        rows = Progress.objects.filter(read_story=story).values_list('answers_given', 'answers_schema', 'answers_packed')
+        for answers_given, answers_schema, answers_packed in rows.iterator():
+            answers = answer_codec.stored(answers_given, answers_schema, answers_packed)
+            answer = answers[kind].get(key)
+            if answer is not None:
+                self._add(totals, self._tally(kind, key, answer, exercises), 1)
+        if kind == 'post_reading':
+            totals['lookup_count'] = sum(
+                PostReadingLookup.objects.filter(question=item).values_list('lookup_count', flat=True)
+            )
+
+        item_filter = {self.ITEM_FIELDS[kind]: item.id}
+        QuestionStats.objects.filter(**item_filter).delete()
+        if totals:
+            QuestionStats.objects.create(story=story, **item_filter, **totals)
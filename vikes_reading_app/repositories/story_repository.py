@@ -27,11 +27,25 @@ class StoryRepository(ABC):
         pass
 
     @abstractmethod
-    def list_home_stories(self, user) -> list:
+    def import_story_bundle(self, author_id: int, story_data: dict, exercises: list, questions: list, audio: dict) -> object:
+        """
+        Create a story with all its exercises and questions from a validated bundle.
+        """
+        pass
+
+    @abstractmethod
+    def list_home_stories(self, user, level=None, sort=None) -> list:
         pass
 
     @abstractmethod
-    def list_author_stories(self, user) -> list:
+    def list_author_stories(self, user, level=None, sort=None) -> list:
+        pass
+
+    @abstractmethod
+    def search_stories(self, user, query: str, mine: bool = False):
+        """
+        Ranked full-text search over the stories visible to the user.
+        """
         pass
 
     @abstractmethod
@@ -85,3 +99,39 @@ class StoryRepository(ABC):
     @abstractmethod
     def delete_post_reading_question(self, question) -> None:
         pass
+
+    @abstractmethod
+    def recount_question_counts(self) -> int:
+        """
+        Repair the denormalized exercise/question counts on every story.
+        """
+        pass
+
+    @abstractmethod
+    def cache_published_story_rows(self) -> int:
+        """
+        Preload every published story's exercises and questions into the cache.
+        """
+        pass
+
+    # --- Async variants (used by the ASGI submit endpoints) ---
+
+    @abstractmethod
+    async def aget_story_by_id(self, story_id: int):
+        pass
+
+    @abstractmethod
+    async def alist_pre_reading_exercises(self, story) -> list:
+        pass
+
+    @abstractmethod
+    async def aget_pre_reading_exercise(self, exercise_id: int):
+        pass
+
+    @abstractmethod
+    async def alist_post_reading_questions(self, story) -> list:
+        pass
+
+    @abstractmethod
+    async def aget_post_reading_question(self, question_id: int, story=None):
+        pass
@@ -1,12 +1,140 @@
+import os
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
+from vikes_reading_app.db_routers import read_alias
+from vikes_reading_app.identity_map import aremember, forget, remember, store
 from vikes_reading_app.models import Story, PreReadingExercise, PostReadingQuestion, CustomUser
+from vikes_reading_app.services.text_analysis import TextAnalysisService
+from .question_stats_repository_impl import ORMQuestionStatsRepository
 from .story_repository import StoryRepository
+from .story_search_impl import get_story_search_repository
 
 class ORMStoryRepository(StoryRepository):
     """
     Concrete implementation of StoryRepository using Django ORM.
+    Single-story reads go through the request's identity map, so the access
+    decorators, views and services share one instance of each row.
     """
+    question_stats_repo = ORMQuestionStatsRepository()
+
+    STORY_SORTS = {
+        'easiest': ('flesch_kincaid_grade', 'id'),
+        'hardest': ('-flesch_kincaid_grade', 'id'),
+        'shortest': ('reading_time_seconds', 'id'),
+        'longest': ('-reading_time_seconds', 'id'),
+    }
+
+    def _filter_by_profile(self, stories, level=None, sort=None):
+        """
+        Level filter and difficulty/length ordering on the precomputed text profile columns.
+        """
+        if level:
+            stories = stories.filter(level=level)
+        if sort in self.STORY_SORTS:
+            return stories.order_by(*self.STORY_SORTS[sort])
+        # Stable default order; (status, id) serves it for the published listing without a sort step
+        return stories.order_by('id')
+
+    @staticmethod
+    def _attach_story(rows, story):
+        # Rows of one story point at the same story instance instead of loading it again
+        rows = list(rows)
+        for row in rows:
+            row.story = story
+        return rows
+
+    # Exercises and questions per story, shared across requests and workers through the
+    # cache under the story's content version (the answer keys the submit views grade with)
+    STORY_ROWS = {
+        'pre_reading_exercise': PreReadingExercise,
+        'post_reading_question': PostReadingQuestion,
+    }
+
+    @staticmethod
+    def story_rows_key(kind, story_id, content_version):
+        return f'story_rows:{kind}:{story_id}:{content_version}'
+
+    def _story_rows_query(self, kind, story):
+        # Primary, not the replica: a lagging replica would cache old rows under the new version
+        return self.STORY_ROWS[kind].objects.using('default').filter(story=story).order_by('id')
+
+    def _load_story_rows(self, kind, story):
+        key = self.story_rows_key(kind, story.id, story.content_version)
+        rows = cache.get(key)
+        if rows is None:
+            rows = list(self._story_rows_query(kind, story))
+            cache.set(key, rows, settings.STORY_CACHE_SECONDS)
+        return self._remember_children(kind, self._attach_story(rows, story))
+
+    async def _aload_story_rows(self, kind, story):
+        key = self.story_rows_key(kind, story.id, story.content_version)
+        rows = await cache.aget(key)
+        if rows is None:
+            rows = [row async for row in self._story_rows_query(kind, story)]
+            await cache.aset(key, rows, settings.STORY_CACHE_SECONDS)
+        return self._remember_children(kind, self._attach_story(rows, story))
+
+    def cache_published_story_rows(self) -> int:
+        """
+        Fills the shared cache with every published story's exercises and questions,
+        two queries in total. Used by worker warm-up; returns the number of stories.
+        """
+        stories = dict(Story.objects.using('default').filter(status='published').values_list('id', 'content_version'))
+        entries = {}
+        for kind, model in self.STORY_ROWS.items():
+            grouped = {story_id: [] for story_id in stories}
+            for row in model.objects.using('default').filter(story_id__in=stories).order_by('id'):
+                grouped[row.story_id].append(row)
+            entries.update({
+                self.story_rows_key(kind, story_id, stories[story_id]): rows
+                for story_id, rows in grouped.items()
+            })
+        cache.set_many(entries, settings.STORY_CACHE_SECONDS)
+        return len(stories)
+
+    def _remember_children(self, kind, rows):
+        for row in rows:
+            store((kind, row.id), row)
+        return rows
+
+    @staticmethod
+    def _forget_story(story_id):
+        forget(
+            ('story', story_id),
+            ('pre_reading_exercises', story_id),
+            ('post_reading_questions', story_id),
+        )
+
+    @staticmethod
+    def _adjust_question_count(story, field, delta):
+        """
+        Moves a story's denormalized exercise/question count by `delta` and bumps its
+        content version, in one UPDATE. The F-expressions let concurrent edits stack
+        instead of overwriting each other; the story instance is refreshed so the
+        rest of the request sees the new values.
+        """
+        Story.objects.filter(pk=story.pk).update(**{
+            # A drifted count stays at 0 rather than failing the positive check
+            field: Greatest(F(field) + delta, 0),
+            'content_version': F('content_version') + 1,
+        })
+        story.refresh_from_db(fields=[field, 'content_version'])
+
+    @staticmethod
+    def _bump_content_version(story_id):
+        """
+        Invalidates the story's cached exercise/question fragments after an edit.
+        """
+        Story.objects.filter(pk=story_id).update(content_version=F('content_version') + 1)
+        forget(('story', story_id))
 
     def delete_story_with_related(self, story_id: int) -> None:
         """
@@ -16,75 +144,233 @@ class ORMStoryRepository(StoryRepository):
         PreReadingExercise.objects.filter(story=story).delete()
         PostReadingQuestion.objects.filter(story=story).delete()
         story.delete()
+        self._forget_story(story_id)
+        get_story_search_repository().remove_story(story_id)
 
     def create_story(self, author_id: int, data: dict) -> Story:
         """
         Creates a new story with given author and data.
         """
         author = CustomUser.objects.get(id=author_id)
-        story = Story.objects.create(author=author, **data)
-        return story
+        profile = TextAnalysisService.analyze(data.get('content'))
+        story = Story.objects.create(author=author, **{**data, **profile})
+        get_story_search_repository().index_story(story)
+        return store(('story', story.id), story)
 
     def edit_story(self, story_id: int, data: dict) -> Story:
         story = Story.objects.get(id=story_id)
+        if 'content' in data:
+            data = {**data, **TextAnalysisService.analyze(data['content'])}
         for key, value in data.items():
             setattr(story, key, value)
         story.save()
+        self._forget_story(story_id)
+        get_story_search_repository().index_story(story)
+        return store(('story', story.id), story)
+
+    def import_story_bundle(self, author_id: int, story_data: dict, exercises: list, questions: list, audio: dict) -> Story:
+        """
+        Creates a story with all its exercises and questions in one transaction.
+        Exercises and questions go in with one bulk insert each; the story itself
+        goes through create_story so its text profile and search entry are kept.
+        Audio fields hold bundle entry names and are resolved against `audio`.
+        """
+        saved_files = []
+
+        def attach(field_file, entry):
+            if entry:
+                field_file.save(os.path.basename(entry), ContentFile(audio[entry]), save=False)
+                saved_files.append(field_file)
+
+        story_data = dict(story_data)
+        narration = story_data.pop('narration_audio', None)
+        try:
+            with transaction.atomic():
+                story = self.create_story(author_id, story_data)
+                if narration:
+                    attach(story.narration_audio, narration)
+                    story.save(update_fields=['narration_audio'])
+
+                exercise_rows = []
+                for data in exercises:
+                    data = dict(data)
+                    audio_entry = data.pop('audio_file', None)
+                    exercise = PreReadingExercise(story=story, **data)
+                    attach(exercise.audio_file, audio_entry)
+                    exercise_rows.append(exercise)
+                PreReadingExercise.objects.bulk_create(exercise_rows)
+                PostReadingQuestion.objects.bulk_create(
+                    [PostReadingQuestion(story=story, **data) for data in questions]
+                )
+                self._adjust_question_count(story, 'pre_reading_count', len(exercise_rows))
+                self._adjust_question_count(story, 'post_reading_count', len(questions))
+        except Exception:
+            # Storage writes are outside the transaction, so undo them by hand
+            for field_file in saved_files:
+                field_file.storage.delete(field_file.name)
+            raise
         return story
 
-    def list_home_stories(self, user) -> list:
+    def list_home_stories(self, user, level=None, sort=None) -> list:
         if not user.is_authenticated or user.role == 'student':
-            return Story.objects.filter(status='published')
+            return self._filter_by_profile(Story.objects.using(read_alias()).filter(status='published'), level, sort)
         if user.role == 'teacher':
-            return Story.objects.all()
+            return self._filter_by_profile(Story.objects.using(read_alias()), level, sort)
         return Story.objects.none()
 
-    def list_author_stories(self, user) -> list:
-        return Story.objects.filter(author=user)
+    def list_author_stories(self, user, level=None, sort=None) -> list:
+        return self._filter_by_profile(Story.objects.using(read_alias()).filter(author=user), level, sort)
+
+    def search_stories(self, user, query: str, mine: bool = False):
+        """
+        Ranked full-text search, scoped like the home page:
+        students and anonymous users only see published stories,
+        teachers see everything (or only their own with `mine`).
+        """
+        search_repo = get_story_search_repository()
+        if not user.is_authenticated or user.role == 'student':
+            return search_repo.search(query, status='published')
+        if user.role == 'teacher':
+            return search_repo.search(query, author=user if mine else None)
+        return Story.objects.none()
 
     def get_story_by_id(self, story_id: int):
-        return get_object_or_404(Story, id=story_id)
+        return remember(('story', int(story_id)), lambda: get_object_or_404(Story, id=story_id))
 
     def list_pre_reading_exercises(self, story) -> list:
-        return list(PreReadingExercise.objects.filter(story=story).order_by('id'))
+        return remember(('pre_reading_exercises', story.id), lambda: self._load_story_rows('pre_reading_exercise', story))
 
     def count_pre_reading_exercises(self, story) -> int:
-        return PreReadingExercise.objects.filter(story=story).count()
+        return story.pre_reading_count
 
     def get_pre_reading_exercise(self, exercise_id: int):
-        return get_object_or_404(PreReadingExercise, id=exercise_id)
+        return remember(
+            ('pre_reading_exercise', int(exercise_id)),
+            lambda: get_object_or_404(PreReadingExercise, id=exercise_id),
+        )
 
     def create_pre_reading_exercise(self, story, data: dict):
-        return PreReadingExercise.objects.create(story=story, **data)
+        with transaction.atomic():
+            exercise = PreReadingExercise.objects.create(story=story, **data)
+            self._adjust_question_count(story, 'pre_reading_count', 1)
+        forget(('pre_reading_exercises', story.id))
+        return store(('pre_reading_exercise', exercise.id), exercise)
 
     def update_pre_reading_exercise(self, exercise, data: dict):
         for key, value in data.items():
             setattr(exercise, key, value)
-        exercise.save()
-        return exercise
+        with transaction.atomic():
+            exercise.save()
+            self._bump_content_version(exercise.story_id)
+            # Stored pre-reading answers are option text, so new options or a new key regrade them.
+            # Post-reading answers keep the correctness they were given, so their stats stand.
+            self.question_stats_repo.rebuild_item_stats(exercise.story, 'pre_reading', exercise)
+        forget(('pre_reading_exercises', exercise.story_id))
+        return store(('pre_reading_exercise', exercise.id), exercise)
 
     def delete_pre_reading_exercise(self, exercise) -> None:
-        exercise.delete()
+        forget(('pre_reading_exercises', exercise.story_id), ('pre_reading_exercise', exercise.id))
+        with transaction.atomic():
+            exercise.delete()
+            self._adjust_question_count(exercise.story, 'pre_reading_count', -1)
 
     def list_post_reading_questions(self, story) -> list:
-        return list(PostReadingQuestion.objects.filter(story=story).order_by('id'))
+        return remember(('post_reading_questions', story.id), lambda: self._load_story_rows('post_reading_question', story))
 
     def count_post_reading_questions(self, story) -> int:
-        return PostReadingQuestion.objects.filter(story=story).count()
+        return story.post_reading_count
 
     def get_post_reading_question(self, question_id: int, story=None):
-        if story is None:
-            return get_object_or_404(PostReadingQuestion, id=question_id)
-        return get_object_or_404(PostReadingQuestion, id=question_id, story=story)
+        question = remember(
+            ('post_reading_question', int(question_id)),
+            lambda: get_object_or_404(PostReadingQuestion, id=question_id),
+        )
+        if story is not None and question.story_id != story.id:
+            raise Http404("No PostReadingQuestion matches the given query.")
+        return question
 
     def create_post_reading_question(self, story, data: dict):
-        return PostReadingQuestion.objects.create(story=story, **data)
+        with transaction.atomic():
+            question = PostReadingQuestion.objects.create(story=story, **data)
+            self._adjust_question_count(story, 'post_reading_count', 1)
+        forget(('post_reading_questions', story.id))
+        return store(('post_reading_question', question.id), question)
 
     def update_post_reading_question(self, question, data: dict):
         for key, value in data.items():
             setattr(question, key, value)
-        question.save()
-        return question
+        with transaction.atomic():
+            question.save()
+            self._bump_content_version(question.story_id)
+        forget(('post_reading_questions', question.story_id))
+        return store(('post_reading_question', question.id), question)
 
     def delete_post_reading_question(self, question) -> None:
-        question.delete()
+        forget(('post_reading_questions', question.story_id), ('post_reading_question', question.id))
+        with transaction.atomic():
+            question.delete()
+            self._adjust_question_count(question.story, 'post_reading_count', -1)
+
+    @staticmethod
+    def _count_for_story(model):
+        rows = model.objects.filter(story=OuterRef('pk')).order_by().values('story').annotate(total=Count('pk'))
+        return Coalesce(Subquery(rows.values('total'), output_field=IntegerField()), 0)
+
+    def recount_question_counts(self) -> int:
+        """
+        Recomputes every story's exercise and question counts from the rows themselves.
+        Returns how many stories had drifted (e.g. after edits through the admin or raw SQL).
+        """
+        with transaction.atomic():
+            stories = Story.objects.annotate(
+                actual_pre=self._count_for_story(PreReadingExercise),
+                actual_post=self._count_for_story(PostReadingQuestion),
+            )
+            drifted = stories.exclude(pre_reading_count=F('actual_pre'), post_reading_count=F('actual_post'))
+            repaired = Story.objects.filter(pk__in=list(drifted.values_list('pk', flat=True))).update(
+                pre_reading_count=self._count_for_story(PreReadingExercise),
+                post_reading_count=self._count_for_story(PostReadingQuestion),
+            )
+        return repaired
+
+    # --- Async variants (Django async ORM) ---
+
+    @staticmethod
+    async def _aget_or_404(queryset, **lookup):
+        try:
+            return await queryset.aget(**lookup)
+        except queryset.model.DoesNotExist:
+            raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+
+    async def aget_story_by_id(self, story_id: int):
+        return await aremember(
+            ('story', int(story_id)),
+            lambda: self._aget_or_404(Story.objects.all(), id=story_id),
+        )
+
+    async def alist_pre_reading_exercises(self, story) -> list:
+        return await aremember(
+            ('pre_reading_exercises', story.id),
+            lambda: self._aload_story_rows('pre_reading_exercise', story),
+        )
+
+    async def aget_pre_reading_exercise(self, exercise_id: int):
+        return await aremember(
+            ('pre_reading_exercise', int(exercise_id)),
+            lambda: self._aget_or_404(PreReadingExercise.objects.all(), id=exercise_id),
+        )
+
+    async def alist_post_reading_questions(self, story) -> list:
+        return await aremember(
+            ('post_reading_questions', story.id),
+            lambda: self._aload_story_rows('post_reading_question', story),
+        )
+
+    async def aget_post_reading_question(self, question_id: int, story=None):
+        question = await aremember(
+            ('post_reading_question', int(question_id)),
+            lambda: self._aget_or_404(PostReadingQuestion.objects.all(), id=question_id),
+        )
+        if story is not None and question.story_id != story.id:
+            raise Http404("No PostReadingQuestion matches the given query.")
+        return question
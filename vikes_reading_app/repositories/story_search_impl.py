@@ -0,0 +1,223 @@
+import re
+
+from django.db import connections, router
+from django.db.models import Q
+
+from vikes_reading_app.models import Story
+from .story_search_repository import StorySearchRepository
+
+SEARCH_TABLE = 'vikes_reading_app_story_search'
+STORY_TABLE = Story._meta.db_table
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def search_tokens(query: str) -> list:
+    """
+    Split user input into plain word tokens so no search syntax reaches the engine.
+    """
+    return TOKEN_RE.findall((query or '').lower())[:10]
+
+
+class RankedSearchResults:
+    """
+    Lazily evaluated ranked result set.
+    Slicing runs one LIMIT/OFFSET query for the page and count() runs one COUNT query,
+    so Django's Paginator never loads more than one page of stories.
+    """
+    def __init__(self, repo, tokens, status=None, author=None):
+        self.repo = repo
+        self.tokens = tokens
+        self.status = status
+        self.author = author
+        self._count = None
+
+    def count(self) -> int:
+        if self._count is None:
+            self._count = self.repo._count(self.tokens, self.status, self.author) if self.tokens else 0
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self[item:item + 1][0]
+        if not self.tokens:
+            return []
+        offset = item.start or 0
+        limit = (item.stop - offset) if item.stop is not None else self.count() - offset
+        story_ids = self.repo._ranked_ids(self.tokens, self.status, self.author, max(limit, 0), offset)
+        stories = Story.objects.select_related('author').in_bulk(story_ids)
+        return [stories[story_id] for story_id in story_ids if story_id in stories]
+
+
+class _SQLSearchRepository(StorySearchRepository):
+    """
+    Shared plumbing for the engine-specific implementations.
+    Index rows are keyed by story id; rows of stories deleted outside the repository
+    are harmless because every query joins back to the story table.
+    """
+    def _connection(self, write=False):
+        alias = router.db_for_write(Story) if write else router.db_for_read(Story)
+        return connections[alias]
+
+    def _filters(self, status, author):
+        clauses, params = [], []
+        if status is not None:
+            clauses.append('s.status = %s')
+            params.append(status)
+        if author is not None:
+            clauses.append('s.author_id = %s')
+            params.append(author.id)
+        return ''.join(f' AND {clause}' for clause in clauses), params
+
+    def search(self, query: str, status: str = None, author=None):
+        return RankedSearchResults(self, search_tokens(query), status, author)
+
+    def rebuild(self) -> int:
+        with self._connection(write=True).cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        indexed = 0
+        for story in Story.objects.only('id', 'title', 'description', 'content').iterator():
+            self.index_story(story)
+            indexed += 1
+        return indexed
+
+    def remove_story(self, story_id: int) -> None:
+        with self._connection(write=True).cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE {self.key_column} = %s', [story_id])
+
+
+class SQLiteStorySearchRepository(_SQLSearchRepository):
+    """
+    SQLite FTS5 virtual table; the rowid is the story id and bm25 ranks the matches
+    with title weighted above description above content.
+    """
+    key_column = 'rowid'
+    RANK = f'bm25({SEARCH_TABLE}, 10.0, 4.0, 1.0)'
+
+    @staticmethod
+    def _match_expression(tokens):
+        # Quoted tokens are literal; the last one is a prefix so partial words match while typing.
+        quoted = [f'"{token}"' for token in tokens]
+        quoted[-1] += '*'
+        return ' '.join(quoted)
+
+    def index_story(self, story) -> None:
+        with self._connection(write=True).cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [story.id])
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (rowid, title, description, content) VALUES (%s, %s, %s, %s)',
+                [story.id, story.title, story.description, story.content],
+            )
+
+    def _count(self, tokens, status, author):
+        extra, params = self._filters(status, author)
+        with self._connection().cursor() as cursor:
+            cursor.execute(
+                f'SELECT COUNT(*) FROM {SEARCH_TABLE} JOIN {STORY_TABLE} s ON s.id = {SEARCH_TABLE}.rowid '
+                f'WHERE {SEARCH_TABLE} MATCH %s{extra}',
+                [self._match_expression(tokens), *params],
+            )
+            return cursor.fetchone()[0]
+
+    def _ranked_ids(self, tokens, status, author, limit, offset):
+        extra, params = self._filters(status, author)
+        with self._connection().cursor() as cursor:
+            cursor.execute(
+                f'SELECT s.id FROM {SEARCH_TABLE} JOIN {STORY_TABLE} s ON s.id = {SEARCH_TABLE}.rowid '
+                f'WHERE {SEARCH_TABLE} MATCH %s{extra} ORDER BY {self.RANK}, s.id LIMIT %s OFFSET %s',
+                [self._match_expression(tokens), *params, limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgresStorySearchRepository(_SQLSearchRepository):
+    """
+    PostgreSQL tsvector documents in a side table with a GIN index, ranked by ts_rank
+    with title (A) weighted above description (B) above content (C).
+    """
+    key_column = 'story_id'
+    DOCUMENT = (
+        "setweight(to_tsvector('english', coalesce(%s, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(%s, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(%s, '')), 'C')"
+    )
+
+    @staticmethod
+    def _tsquery(tokens):
+        return ' & '.join(f'{token}:*' for token in tokens)
+
+    def index_story(self, story) -> None:
+        with self._connection(write=True).cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (story_id, document) VALUES (%s, {self.DOCUMENT}) '
+                f'ON CONFLICT (story_id) DO UPDATE SET document = EXCLUDED.document',
+                [story.id, story.title, story.description, story.content],
+            )
+
+    def _count(self, tokens, status, author):
+        extra, params = self._filters(status, author)
+        with self._connection().cursor() as cursor:
+            cursor.execute(
+                f'SELECT COUNT(*) FROM {SEARCH_TABLE} ss JOIN {STORY_TABLE} s ON s.id = ss.story_id '
+                f"WHERE ss.document @@ to_tsquery('english', %s){extra}",
+                [self._tsquery(tokens), *params],
+            )
+            return cursor.fetchone()[0]
+
+    def _ranked_ids(self, tokens, status, author, limit, offset):
+        extra, params = self._filters(status, author)
+        with self._connection().cursor() as cursor:
+            cursor.execute(
+                f"SELECT s.id FROM {SEARCH_TABLE} ss JOIN {STORY_TABLE} s ON s.id = ss.story_id, "
+                f"to_tsquery('english', %s) query "
+                f'WHERE ss.document @@ query{extra} '
+                f'ORDER BY ts_rank(ss.document, query) DESC, s.id LIMIT %s OFFSET %s',
+                [self._tsquery(tokens), *params, limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class ORMStorySearchRepository(StorySearchRepository):
+    """
+    Fallback for database engines without a supported full-text index.
+    Unranked icontains matching; indexing is a no-op.
+    """
+    def index_story(self, story) -> None:
+        pass
+
+    def remove_story(self, story_id: int) -> None:
+        pass
+
+    def rebuild(self) -> int:
+        return 0
+
+    def search(self, query: str, status: str = None, author=None):
+        tokens = search_tokens(query)
+        if not tokens:
+            return Story.objects.none()
+        stories = Story.objects.select_related('author').order_by('id')
+        for token in tokens:
+            stories = stories.filter(
+                Q(title__icontains=token) | Q(description__icontains=token) | Q(content__icontains=token)
+            )
+        if status is not None:
+            stories = stories.filter(status=status)
+        if author is not None:
+            stories = stories.filter(author=author)
+        return stories
+
+
+SEARCH_BACKENDS = {
+    'sqlite': SQLiteStorySearchRepository,
+    'postgresql': PostgresStorySearchRepository,
+}
+
+
+def get_story_search_repository() -> StorySearchRepository:
+    """
+    Pick the search implementation matching the database that stores stories.
+    """
+    vendor = connections[router.db_for_write(Story)].vendor
+    return SEARCH_BACKENDS.get(vendor, ORMStorySearchRepository)()
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+
+
+class StorySearchRepository(ABC):
+    """
+    Interface (contract) for the full-text index over Story title, description and content.
+    """
+
+    @abstractmethod
+    def index_story(self, story) -> None:
+        """
+        Add or refresh the index entry for a story.
+        """
+        pass
+
+    @abstractmethod
+    def remove_story(self, story_id: int) -> None:
+        """
+        Drop the index entry for a story.
+        """
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """
+        Re-index every story and return how many were indexed.
+        """
+        pass
+
+    @abstractmethod
+    def search(self, query: str, status: str = None, author=None):
+        """
+        Return ranked search results (best match first).
+        The result supports count() and slicing, so it can be paginated lazily.
+        """
+        pass
@@ -3,13 +3,51 @@ from abc import ABC, abstractmethod
 
 class UserRepository(ABC):
     @abstractmethod
-    def list_students(self) -> list:
+    def list_students(self, teacher=None) -> list:
         pass
 
     @abstractmethod
-    def get_student(self, student_id: int):
+    def get_student(self, student_id: int, teacher=None):
         pass
 
     @abstractmethod
     def update_bio(self, user, bio: str):
         pass
+
+    @abstractmethod
+    def existing_usernames(self, usernames) -> set:
+        pass
+
+    @abstractmethod
+    def bulk_create_students(self, users: list) -> list:
+        pass
+
+    # --- Class groups ---
+
+    @abstractmethod
+    def list_groups(self, teacher) -> list:
+        pass
+
+    @abstractmethod
+    def create_group(self, teacher, name: str):
+        pass
+
+    @abstractmethod
+    def get_group(self, group_id: int, teacher):
+        pass
+
+    @abstractmethod
+    def list_group_students(self, group) -> list:
+        pass
+
+    @abstractmethod
+    def add_students_to_group(self, group, usernames) -> tuple:
+        pass
+
+    @abstractmethod
+    def add_student_ids_to_group(self, group, student_ids) -> None:
+        pass
+
+    @abstractmethod
+    def remove_student_from_group(self, group, student_id: int) -> None:
+        pass
@@ -1,17 +1,111 @@
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import Lower
 from django.shortcuts import get_object_or_404
 
-from vikes_reading_app.models import CustomUser
+from vikes_reading_app.db_routers import read_alias
+from vikes_reading_app.models import ClassGroup, CustomUser, GroupMembership
+from .assignment_repository_impl import ORMAssignmentRepository
 from .user_repository import UserRepository
 
 
 class ORMUserRepository(UserRepository):
-    def list_students(self) -> list:
-        return CustomUser.objects.filter(role='student')
+    assignment_repo = ORMAssignmentRepository()
 
-    def get_student(self, student_id: int):
-        return get_object_or_404(CustomUser, id=student_id, role='student')
+    def _students(self, teacher=None):
+        """
+        Students, optionally limited to those in one of the teacher's class groups.
+        The membership (student, group) index keeps this a join on the teacher's rows only.
+        """
+        students = CustomUser.objects.using(read_alias()).filter(role='student')
+        if teacher is None:
+            return students
+        return students.filter(group_memberships__group__teacher=teacher).distinct()
+
+    def list_students(self, teacher=None) -> list:
+        return self._students(teacher).order_by('username')
+
+    def get_student(self, student_id: int, teacher=None):
+        return get_object_or_404(self._students(teacher), id=student_id)
 
     def update_bio(self, user, bio: str):
         user.bio = bio
         user.save()
         return user
+
+    def existing_usernames(self, usernames) -> set:
+        """
+        Returns the lower-cased usernames already taken, in one query.
+        Matches case-insensitively like the registration form does.
+        """
+        lowered = {name.lower() for name in usernames}
+        if not lowered:
+            return set()
+        return set(
+            CustomUser.objects.annotate(username_lower=Lower('username'))
+            .filter(username_lower__in=lowered)
+            .values_list('username_lower', flat=True)
+        )
+
+    def bulk_create_students(self, users: list) -> list:
+        """
+        Inserts already-hashed student accounts in one statement per batch.
+        """
+        for user in users:
+            user.role = 'student'
+        with transaction.atomic():
+            return CustomUser.objects.bulk_create(users)
+
+    # --- Class groups ---
+
+    def list_groups(self, teacher) -> list:
+        return ClassGroup.objects.using(read_alias()).filter(teacher=teacher).annotate(
+            student_count=Count('memberships')
+        ).order_by('name')
+
+    def create_group(self, teacher, name: str):
+        # Savepoint so a duplicate name leaves the caller's transaction usable
+        with transaction.atomic():
+            return ClassGroup.objects.create(teacher=teacher, name=name)
+
+    def get_group(self, group_id: int, teacher):
+        return get_object_or_404(ClassGroup, id=group_id, teacher=teacher)
+
+    def list_group_students(self, group) -> list:
+        return CustomUser.objects.using(read_alias()).filter(group_memberships__group=group).order_by('username')
+
+    def add_students_to_group(self, group, usernames) -> tuple:
+        """
+        Enrols students by username. Returns (added count, usernames that are not students).
+        """
+        wanted = {name.lower(): name for name in usernames if name}
+        found = dict(
+            CustomUser.objects.filter(role='student')
+            .annotate(username_lower=Lower('username'))
+            .filter(username_lower__in=wanted)
+            .values_list('username_lower', 'id')
+        )
+        already = set(
+            GroupMembership.objects.filter(group=group, student_id__in=found.values())
+            .values_list('student_id', flat=True)
+        )
+        self.add_student_ids_to_group(group, [pk for pk in found.values() if pk not in already])
+        unknown = sorted(name for lowered, name in wanted.items() if lowered not in found)
+        return len(set(found.values()) - already), unknown
+
+    def add_student_ids_to_group(self, group, student_ids) -> None:
+        """
+        Enrols students and queues the class's existing assignments for them.
+        """
+        with transaction.atomic():
+            GroupMembership.objects.bulk_create(
+                [GroupMembership(group=group, student_id=student_id) for student_id in student_ids],
+                ignore_conflicts=True,
+                batch_size=500,
+            )
+            self.assignment_repo.enqueue_group_members(group, student_ids)
+
+    def remove_student_from_group(self, group, student_id: int) -> None:
+        with transaction.atomic():
+            GroupMembership.objects.filter(group=group, student_id=student_id).delete()
+            self.assignment_repo.dequeue_group_members(group, [student_id])
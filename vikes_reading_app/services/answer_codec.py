@@ -0,0 +1,140 @@
+# --- Compact answers_given Encoding ---
+#
+# Layout (all integers are unsigned LEB128 varints unless noted):
+#   version byte
+#   pre-reading:  count, exercise ids as ascending deltas, then each answer's option text
+#                 as a byte length and UTF-8
+#   post-reading: count, question ids as ascending deltas, one 4-bit option number (1-4)
+#                 per answer, then a correctness bitset with one bit per answer
+# The encoding is exact: decode(encode(answers)) == answers. Pre-reading answers keep the
+# text the student chose, like the JSON form, so editing an exercise's options regrades both
+# forms the same way. Answers it can't represent raise ValueError and the row stays JSON.
+
+from vikes_reading_app.models import PACKED_ANSWERS_SCHEMA
+
+
+FORMAT_VERSION = 1
+
+POST_READING_KEYS = {'selected_option', 'is_correct'}
+POST_READING_OPTIONS = ('1', '2', '3', '4')
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _write_ids(out, ids):
+    _write_varint(out, len(ids))
+    previous = 0
+    for item_id in ids:
+        _write_varint(out, item_id - previous)
+        previous = item_id
+
+
+def _read_ids(data, pos):
+    count, pos = _read_varint(data, pos)
+    ids, previous = [], 0
+    for _ in range(count):
+        delta, pos = _read_varint(data, pos)
+        previous += delta
+        ids.append(previous)
+    return ids, pos
+
+
+def _write_small(out, values, bits):
+    """Packs each value into `bits` bits, lowest bits first."""
+    packed = 0
+    for index, value in enumerate(values):
+        packed |= value << (index * bits)
+    out += packed.to_bytes((len(values) * bits + 7) // 8, 'little')
+
+
+def _read_small(data, pos, count, bits):
+    size = (count * bits + 7) // 8
+    packed = int.from_bytes(data[pos:pos + size], 'little')
+    mask = (1 << bits) - 1
+    return [(packed >> (index * bits)) & mask for index in range(count)], pos + size
+
+
+def _sorted_items(answers):
+    items = []
+    for key, value in answers.items():
+        if not key.isdigit() or str(int(key)) != key:
+            raise ValueError(f"Answer key {key!r} is not an item id")
+        items.append((int(key), value))
+    return sorted(items)
+
+
+def _post_reading_fields(answer):
+    if (
+        not isinstance(answer, dict) or answer.keys() != POST_READING_KEYS
+        or answer['selected_option'] not in POST_READING_OPTIONS or not isinstance(answer['is_correct'], bool)
+    ):
+        raise ValueError(f"Post-reading answer {answer!r} has no compact form")
+    return int(answer['selected_option']), int(answer['is_correct'])
+
+
+def encode(answers):
+    """Two-bucket answers as bytes. Raises ValueError when they can't be stored exactly."""
+    out = bytearray([FORMAT_VERSION])
+
+    pre_reading = _sorted_items(answers['pre_reading'])
+    _write_ids(out, [exercise_id for exercise_id, _ in pre_reading])
+    for _, text in pre_reading:
+        if not isinstance(text, str):
+            raise ValueError(f"Pre-reading answer {text!r} is not text")
+        encoded = text.encode('utf-8')
+        _write_varint(out, len(encoded))
+        out += encoded
+
+    post_reading = _sorted_items(answers['post_reading'])
+    _write_ids(out, [question_id for question_id, _ in post_reading])
+    fields = [_post_reading_fields(answer) for _, answer in post_reading]
+    _write_small(out, [option for option, _ in fields], 4)
+    _write_small(out, [correct for _, correct in fields], 1)
+    return bytes(out)
+
+
+def decode(data):
+    """The two-bucket answers dict back from encode()."""
+    data = bytes(data)
+    if data[0] != FORMAT_VERSION:
+        raise ValueError(f"Unknown answers encoding version {data[0]}")
+    pos = 1
+
+    pre_ids, pos = _read_ids(data, pos)
+    pre_reading = {}
+    for exercise_id in pre_ids:
+        size, pos = _read_varint(data, pos)
+        pre_reading[str(exercise_id)] = data[pos:pos + size].decode('utf-8')
+        pos += size
+
+    post_ids, pos = _read_ids(data, pos)
+    post_options, pos = _read_small(data, pos, len(post_ids), 4)
+    correct, pos = _read_small(data, pos, len(post_ids), 1)
+    post_reading = {
+        str(question_id): {'selected_option': str(option), 'is_correct': bool(flag)}
+        for question_id, option, flag in zip(post_ids, post_options, correct)
+    }
+    return {'pre_reading': pre_reading, 'post_reading': post_reading}
+
+
+def stored(answers_given, answers_schema, answers_packed):
+    """A row's answers from its columns, whichever form it was saved in."""
+    if answers_schema == PACKED_ANSWERS_SCHEMA:
+        return decode(answers_packed)
+    return answers_given
@@ -1,4 +1,11 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.urls import reverse
+
+from vikes_reading_app.models import ANSWERS_SCHEMA, PACKED_ANSWERS_SCHEMA, empty_answers
 from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.services import answer_codec
 
 
 class ReadingFlowService:
@@ -8,59 +15,101 @@ class ReadingFlowService:
         'reading_time': 'reading',
         'post_reading_time': 'completed',
     }
+    STAGE_TIME_FIELDS = {
+        'pre_reading': 'pre_reading_time',
+        'reading': 'reading_time',
+        'post_reading': 'post_reading_time',
+    }
+    # Where an assignment queue entry sends the student for each stage
+    QUEUE_NEXT_VIEWS = {
+        'not_started': 'story_entry_point',
+        'pre_reading': 'pre_reading_read',
+        'reading': 'story_read_student',
+        'post_reading': 'story_entry_point',
+        'completed': 'post_reading_summary',
+    }
+    MAX_TELEMETRY_EVENTS = 100
+    MAX_STAGE_SECONDS = 6 * 60 * 60
 
+    # answers_given always holds both stage buckets (schema 2, see models.ANSWERS_SCHEMA),
+    # so answers are read and written in place
     @staticmethod
-    def _normalized_answers(progress):
-        if not progress or not progress.answers_given:
-            return {'pre_reading': {}, 'post_reading': {}}
+    def get_pre_reading_answers(progress):
+        return progress.answers_given['pre_reading'] if progress else {}
 
-        answers = progress.answers_given
-        if 'pre_reading' in answers or 'post_reading' in answers:
-            return {
-                'pre_reading': answers.get('pre_reading', {}),
-                'post_reading': answers.get('post_reading', {}),
-            }
+    @staticmethod
+    def get_post_reading_answers(progress):
+        return progress.answers_given['post_reading'] if progress else {}
 
-        # Backward compatibility for older flat post-reading answers.
-        return {
-            'pre_reading': {},
-            'post_reading': answers,
+    @staticmethod
+    def set_pre_reading_answer(progress, exercise_id, selected_answer):
+        progress.answers_given['pre_reading'][str(exercise_id)] = selected_answer
+
+    @staticmethod
+    def set_post_reading_answer(progress, question_id, selected_option, is_correct):
+        progress.answers_given['post_reading'][str(question_id)] = {
+            'selected_option': selected_option,
+            'is_correct': is_correct,
         }
 
-    @classmethod
-    def get_pre_reading_answers(cls, progress):
-        return cls._normalized_answers(progress)['pre_reading']
+    # --- Answer storage ---
+    # Everything above reads answers_given. Rows saved compact (settings.COMPACT_ANSWERS) are
+    # decoded into it when the repositories load them and encoded only for the save itself.
 
-    @classmethod
-    def get_post_reading_answers(cls, progress):
-        return cls._normalized_answers(progress)['post_reading']
+    @staticmethod
+    def unpack_answers(progress):
+        """Fills answers_given of a row loaded from the database. Returns the progress."""
+        if progress is not None and progress.answers_schema == PACKED_ANSWERS_SCHEMA:
+            progress.answers_given = answer_codec.decode(progress.answers_packed)
+        return progress
 
-    @classmethod
-    def set_pre_reading_answer(cls, progress, exercise_id, selected_answer):
-        answers = cls._normalized_answers(progress)
-        answers['pre_reading'][str(exercise_id)] = selected_answer
-        progress.answers_given = answers
+    @staticmethod
+    @contextmanager
+    def packed_answers(progress):
+        """
+        Puts the answers in the form settings.COMPACT_ANSWERS asks for while the caller saves
+        the progress, then gives answers_given back its dict. Answers the compact form can't
+        hold exactly are saved as JSON.
+        """
+        answers = progress.answers_given
+        packed = None
+        if settings.COMPACT_ANSWERS:
+            try:
+                packed = answer_codec.encode(answers)
+            except ValueError:
+                packed = None
+        if packed is None:
+            progress.answers_schema, progress.answers_packed = ANSWERS_SCHEMA, None
+        else:
+            progress.answers_schema, progress.answers_packed = PACKED_ANSWERS_SCHEMA, packed
+            progress.answers_given = empty_answers()
+        try:
+            yield progress
+        finally:
+            progress.answers_given = answers
 
     @classmethod
-    def set_post_reading_answer(cls, progress, question_id, selected_option, is_correct):
-        answers = cls._normalized_answers(progress)
-        answers['post_reading'][str(question_id)] = {
-            'selected_option': selected_option,
-            'is_correct': is_correct,
-        }
-        progress.answers_given = answers
+    def get_resume_target(cls, progress, story):
+        if not progress or progress.is_empty:
+            return 'pre_reading_read'
+        return cls.resolve_resume_target(
+            progress,
+            cls.story_repo.count_pre_reading_exercises(story),
+            cls.story_repo.count_post_reading_questions(story),
+        )
 
     @classmethod
-    def get_resume_target(cls, progress, story):
+    def resolve_resume_target(cls, progress, pre_total, post_total):
+        """
+        Resume decision from counts the caller already has, e.g. a StoryEntrySnapshotDTO.
+        """
         if not progress or progress.is_empty:
             return 'pre_reading_read'
 
-        pre_total = cls.story_repo.count_pre_reading_exercises(story)
         pre_answers = cls.get_pre_reading_answers(progress)
         if pre_total > 0 and len(pre_answers) < pre_total:
             return 'pre_reading_read'
 
-        post_total = cls.story_repo.count_post_reading_questions(story)
         post_answers = cls.get_post_reading_answers(progress)
         if post_total > 0 and len(post_answers) == post_total:
             return 'post_reading_summary'
@@ -68,9 +117,38 @@ class ReadingFlowService:
         return None
 
     @classmethod
-    def get_pre_reading_score(cls, progress, story):
-        exercises = cls.story_repo.list_pre_reading_exercises(story)
+    def get_queue_entry(cls, progress, story):
+        """
+        Stage and continue link for a student's assignment queue entry.
+        Computed when progress is written so the to-do list never has to.
+        """
+        resume_target = cls.get_resume_target(progress, story)
+        if not progress or progress.is_empty:
+            stage = 'not_started'
+        elif resume_target == 'pre_reading_read':
+            stage = 'pre_reading'
+        elif resume_target == 'post_reading_summary' or progress.current_stage == 'completed':
+            stage = 'completed'
+        elif cls.get_post_reading_answers(progress) or progress.current_stage == 'post_reading':
+            stage = 'post_reading'
+        else:
+            stage = 'reading'
+        return {
+            'stage': stage,
+            'next_url': reverse(cls.QUEUE_NEXT_VIEWS[stage], args=[story.id]),
+            'is_completed': stage == 'completed',
+        }
+
+    @classmethod
+    def get_pre_reading_score(cls, progress, story, total=None):
+        """
+        (correct, total) for the pre-reading answers. With `total` known and nothing
+        answered there is nothing to grade, so the answer key is not loaded.
+        """
         answers = cls.get_pre_reading_answers(progress)
+        if total is not None and not answers:
+            return 0, total
+        exercises = cls.story_repo.list_pre_reading_exercises(story)
         total = len(exercises)
         correct = 0
 
@@ -98,3 +176,37 @@ class ReadingFlowService:
     @classmethod
     def get_next_stage(cls, time_field):
         return cls.STAGE_TRANSITIONS[time_field]
+
+    @classmethod
+    def fold_stage_events(cls, events, last_seq):
+        """
+        Folds a batch of stage-timing events into Progress field updates.
+
+        Each event is {"seq": int, "stage": str, "elapsed": int, "final": bool}.
+        Events at or below `last_seq` were already applied and are skipped.
+        `elapsed` is cumulative for the page view, so the newest event per stage wins;
+        a final event also advances `current_stage` like the per-stage endpoints do.
+        Returns (updates, max_seq); `updates` is empty when nothing new arrived.
+        """
+        latest = {}
+        max_seq = last_seq
+        for event in events[:cls.MAX_TELEMETRY_EVENTS]:
+            if not isinstance(event, dict):
+                continue
+            try:
+                seq = int(event.get('seq'))
+                elapsed = int(event.get('elapsed'))
+            except (TypeError, ValueError):
+                continue
+            time_field = cls.STAGE_TIME_FIELDS.get(event.get('stage'))
+            if time_field is None or seq <= last_seq or not 0 <= elapsed <= cls.MAX_STAGE_SECONDS:
+                continue
+            if time_field not in latest or seq > latest[time_field][0]:
+                latest[time_field] = (seq, elapsed, bool(event.get('final')))
+            max_seq = max(max_seq, seq)
+
+        updates = {time_field: elapsed for time_field, (_, elapsed, _) in latest.items()}
+        finals = [(seq, time_field) for time_field, (seq, _, final) in latest.items() if final]
+        if finals:
+            updates['current_stage'] = cls.get_next_stage(max(finals)[1])
+        return updates, max_seq
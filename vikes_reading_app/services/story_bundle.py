@@ -0,0 +1,175 @@
+import io
+import json
+import os
+import zipfile
+
+from vikes_reading_app.forms import PostReadingQuestionForm, PreReadingExerciseForm, StoryForm
+
+
+class StoryBundleError(ValueError):
+    """Raised when an uploaded story bundle cannot be read or fails validation."""
+
+
+class StoryBundleService:
+    """
+    Portable story bundles: one zip holding the story, its exercises, its questions
+    and the audio they reference, or a plain JSON manifest when there is no audio.
+    """
+    FORMAT = 'vikes-story-bundle'
+    VERSION = 1
+    MANIFEST_NAME = 'story.json'
+    MAX_ARCHIVE_BYTES = 50 * 1024 * 1024  # Uncompressed size cap, guards against zip bombs
+    STORY_FIELDS = ('title', 'description', 'content', 'status')
+    EXERCISE_FIELDS = ('question_text', 'option_1', 'option_2', 'is_option_1_correct', 'is_option_2_correct')
+    QUESTION_FIELDS = ('question_text', 'option_1', 'option_2', 'option_3', 'option_4', 'correct_option', 'explanation')
+
+    # --- Export ---
+
+    @staticmethod
+    def _audio_entry(prefix, index, field_file):
+        if not field_file:
+            return None
+        return f"audio/{prefix}/{index}_{os.path.basename(field_file.name)}"
+
+    @classmethod
+    def build_manifest(cls, story, exercises, questions):
+        return {
+            'format': cls.FORMAT,
+            'version': cls.VERSION,
+            'story': {
+                **{field: getattr(story, field) for field in cls.STORY_FIELDS},
+                'narration_audio': cls._audio_entry('story', 0, story.narration_audio),
+            },
+            'pre_reading_exercises': [
+                {
+                    **{field: getattr(exercise, field) for field in cls.EXERCISE_FIELDS},
+                    'audio_file': cls._audio_entry('pre_reading', index, exercise.audio_file),
+                }
+                for index, exercise in enumerate(exercises)
+            ],
+            'post_reading_questions': [
+                {field: getattr(question, field) for field in cls.QUESTION_FIELDS}
+                for question in questions
+            ],
+        }
+
+    @classmethod
+    def write_archive(cls, story, exercises, questions) -> bytes:
+        manifest = cls.build_manifest(story, exercises, questions)
+        audio = [(manifest['story']['narration_audio'], story.narration_audio)] + [
+            (entry['audio_file'], exercise.audio_file)
+            for entry, exercise in zip(manifest['pre_reading_exercises'], exercises)
+        ]
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(cls.MANIFEST_NAME, json.dumps(manifest, indent=2))
+            for name, field_file in audio:
+                if name:
+                    with field_file.open('rb') as handle:
+                        # Audio is already compressed; storing it saves CPU on both ends
+                        archive.writestr(name, handle.read(), compress_type=zipfile.ZIP_STORED)
+        return buffer.getvalue()
+
+    # --- Import ---
+
+    @classmethod
+    def read_bundle(cls, fileobj):
+        """
+        Reads a zip or JSON bundle.
+        Returns (manifest, audio) where audio maps archive entry names to bytes.
+        A JSON bundle has nowhere to hold audio, so it may not reference any.
+        """
+        if not zipfile.is_zipfile(fileobj):
+            fileobj.seek(0)
+            manifest = cls._load_manifest(fileobj.read())
+            cls._check_audio(manifest, set())
+            return manifest, {}
+
+        fileobj.seek(0)
+        try:
+            with zipfile.ZipFile(fileobj) as archive:
+                infos = archive.infolist()
+                if sum(info.file_size for info in infos) > cls.MAX_ARCHIVE_BYTES:
+                    raise StoryBundleError("The bundle is too large.")
+                names = {info.filename for info in infos}
+                if cls.MANIFEST_NAME not in names:
+                    raise StoryBundleError(f"The bundle has no {cls.MANIFEST_NAME}.")
+                manifest = cls._load_manifest(archive.read(cls.MANIFEST_NAME))
+                referenced = cls._check_audio(manifest, names)
+                audio = {name: archive.read(name) for name in referenced}
+        except zipfile.BadZipFile:
+            raise StoryBundleError("The bundle is not a valid zip archive.")
+        return manifest, audio
+
+    @classmethod
+    def _load_manifest(cls, raw):
+        try:
+            manifest = json.loads(raw)
+        except (UnicodeDecodeError, ValueError):
+            raise StoryBundleError("The bundle manifest is not valid JSON.")
+        if not isinstance(manifest, dict) or manifest.get('format') != cls.FORMAT:
+            raise StoryBundleError("This file is not a story bundle.")
+        if manifest.get('version') != cls.VERSION:
+            raise StoryBundleError(f"Unsupported bundle version: {manifest.get('version')}")
+        if not isinstance(manifest.get('story'), dict):
+            raise StoryBundleError("The bundle has no story.")
+        for key in ('pre_reading_exercises', 'post_reading_questions'):
+            items = manifest.setdefault(key, [])
+            if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+                raise StoryBundleError(f"'{key}' must be a list of objects.")
+        return manifest
+
+    @staticmethod
+    def _audio_references(manifest):
+        names = [manifest['story'].get('narration_audio')]
+        names += [entry.get('audio_file') for entry in manifest['pre_reading_exercises']]
+        if not all(name is None or isinstance(name, str) for name in names):
+            raise StoryBundleError("Audio references must be file names.")
+        return {name for name in names if name}
+
+    @classmethod
+    def _check_audio(cls, manifest, names):
+        """The manifest's audio references, once every one of them is among the bundle's `names`."""
+        referenced = cls._audio_references(manifest)
+        missing = sorted(referenced - names)
+        if missing:
+            raise StoryBundleError(f"The bundle is missing audio files: {', '.join(missing)}")
+        return referenced
+
+    @staticmethod
+    def _clean(form_class, data, label):
+        form = form_class(data)
+        if not form.is_valid():
+            problems = '; '.join(
+                f"{field}: {' '.join(errors)}" if field != '__all__' else ' '.join(errors)
+                for field, errors in form.errors.items()
+            )
+            raise StoryBundleError(f"{label}: {problems}")
+        return form.cleaned_data
+
+    @classmethod
+    def validate(cls, manifest):
+        """
+        Runs every item through the same forms teachers use, so a bundle can't
+        create anything the UI would have rejected.
+        Returns cleaned (story, exercises, questions) dicts with audio entry names kept aside.
+        """
+        story_data = manifest['story']
+        story = cls._clean(StoryForm, story_data, "Story")
+        status = story_data.get('status', 'published')
+        if status not in ('draft', 'published'):
+            raise StoryBundleError(f"Story: unknown status '{status}'.")
+        story['status'] = status
+        story['narration_audio'] = story_data.get('narration_audio')
+
+        exercises = []
+        for number, item in enumerate(manifest['pre_reading_exercises'], start=1):
+            cleaned = cls._clean(PreReadingExerciseForm, item, f"Pre-reading exercise {number}")
+            cleaned['audio_file'] = item.get('audio_file')
+            exercises.append(cleaned)
+
+        questions = [
+            cls._clean(PostReadingQuestionForm, item, f"Post-reading question {number}")
+            for number, item in enumerate(manifest['post_reading_questions'], start=1)
+        ]
+        return story, exercises, questions
@@ -0,0 +1,167 @@
+import csv
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from vikes_reading_app.dtos.student_import import StudentImportResultDTO, StudentImportRowErrorDTO
+from vikes_reading_app.models import CustomUser
+from vikes_reading_app.repositories.user_repository_impl import ORMUserRepository
+
+
+def _init_hash_worker():
+    # Spawned workers (macOS, Windows) start without Django; forked ones already have it
+    if not apps.ready:
+        django.setup()
+
+
+def _hash_passwords(passwords):
+    return [make_password(password) for password in passwords]
+
+
+class StudentImportService:
+    """
+    Streams a CSV of students, validates each row, hashes passwords (optionally in a
+    process pool) and inserts accounts with one bulk insert per batch.
+    """
+    REQUIRED_COLUMNS = ('username', 'password')
+    OPTIONAL_COLUMNS = ('first_name', 'last_name', 'email')
+    BATCH_SIZE = 500
+    HASH_CHUNK_SIZE = 25  # Passwords per task sent to a worker process
+    # Rows an upload may import. Every password is hashed on the request thread at about half a
+    # second each (PBKDF2, 1M iterations), so this keeps an upload well inside gunicorn's 30s
+    # timeout; larger classes go through `manage.py import_students`
+    WEB_MAX_ROWS = 30
+    USERNAME_TAKEN = "A user with that username already exists."
+    user_repo = ORMUserRepository()
+    username_validator = UnicodeUsernameValidator()
+
+    @classmethod
+    def _validate_row(cls, row, seen):
+        username = (row.get('username') or '').strip()
+        password = row.get('password') or ''
+        problems = []
+        if not username:
+            problems.append("Username is required.")
+        elif len(username) > CustomUser._meta.get_field('username').max_length:
+            problems.append("Username is too long.")
+        else:
+            try:
+                cls.username_validator(username)
+            except ValidationError as error:
+                problems.extend(error.messages)
+            if username.lower() in seen:
+                problems.append("Username appears more than once in the file.")
+        email = (row.get('email') or '').strip()
+        if email:
+            try:
+                validate_email(email)
+            except ValidationError as error:
+                problems.extend(error.messages)
+        if not password:
+            problems.append("Password is required.")
+        else:
+            try:
+                validate_password(password, CustomUser(username=username, email=email))
+            except ValidationError as error:
+                problems.extend(error.messages)
+        return username, problems
+
+    @classmethod
+    def import_csv(cls, stream, batch_size=None, workers=0, group=None, max_rows=None) -> StudentImportResultDTO:
+        """
+        Imports students from a text stream, optionally enrolling them in a class group.
+        Passwords are hashed in-process unless `workers` asks for a process pool; only the
+        import_students command does, since forking from a threaded web worker that holds
+        database connections is unsafe. Rows after the first `max_rows` are reported, not imported.
+        """
+        reader = csv.DictReader(stream)
+        result = StudentImportResultDTO()
+        missing = [column for column in cls.REQUIRED_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            result.errors.append(StudentImportRowErrorDTO(
+                line=1, username='', messages=[f"Missing column(s): {', '.join(missing)}."],
+            ))
+            return result
+
+        batch_size = batch_size or cls.BATCH_SIZE
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_hash_worker) if workers else None
+        seen = set()
+        batch = []
+        try:
+            for count, row in enumerate(reader, start=1):
+                if max_rows is not None and count > max_rows:
+                    result.errors.append(StudentImportRowErrorDTO(reader.line_num, '', [
+                        f"Only {max_rows} rows can be imported at once; this row and the rest were skipped."
+                        " Split the file or use the import_students management command.",
+                    ]))
+                    break
+                username, problems = cls._validate_row(row, seen)
+                if username:
+                    seen.add(username.lower())
+                if problems:
+                    result.errors.append(StudentImportRowErrorDTO(reader.line_num, username, problems))
+                    continue
+                batch.append((reader.line_num, username, row))
+                if len(batch) >= batch_size:
+                    cls._flush(batch, result, pool, group)
+                    batch = []
+            if batch:
+                cls._flush(batch, result, pool, group)
+        finally:
+            if pool:
+                pool.shutdown()
+        result.errors.sort(key=lambda error: error.line)
+        return result
+
+    @classmethod
+    def _flush(cls, batch, result, pool, group=None):
+        taken = cls.user_repo.existing_usernames(username for _, username, _ in batch)
+        rows = []
+        for line, username, row in batch:
+            if username.lower() in taken:
+                result.errors.append(StudentImportRowErrorDTO(line, username, [cls.USERNAME_TAKEN]))
+            else:
+                rows.append((line, username, row))
+        if not rows:
+            return
+
+        passwords = [row['password'] for _, _, row in rows]
+        if pool:
+            chunks = [passwords[i:i + cls.HASH_CHUNK_SIZE] for i in range(0, len(passwords), cls.HASH_CHUNK_SIZE)]
+            hashes = [digest for chunk in pool.map(_hash_passwords, chunks) for digest in chunk]
+        else:
+            hashes = _hash_passwords(passwords)
+
+        users = [
+            (line, CustomUser(
+                username=username,
+                password=digest,
+                **{column: (row.get(column) or '').strip() for column in cls.OPTIONAL_COLUMNS},
+            ))
+            for (line, username, row), digest in zip(rows, hashes)
+        ]
+        try:
+            result.created += cls._insert([user for _, user in users], group)
+        except IntegrityError:
+            # A signup took one of the names after existing_usernames(); find it row by row
+            for line, user in users:
+                try:
+                    result.created += cls._insert([user], group)
+                except IntegrityError:
+                    result.errors.append(StudentImportRowErrorDTO(line, user.username, [cls.USERNAME_TAKEN]))
+
+    @classmethod
+    def _insert(cls, users, group):
+        """Creates the accounts and their group memberships together, or neither. Returns how many."""
+        with transaction.atomic():
+            created = cls.user_repo.bulk_create_students(users)
+            if group is not None:
+                cls.user_repo.add_student_ids_to_group(group, [user.pk for user in created])
+        return len(created)
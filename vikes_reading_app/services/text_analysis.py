@@ -0,0 +1,98 @@
+import re
+from collections import Counter
+from html import unescape
+
+from django.utils.html import strip_tags
+
+
+class TextAnalysisService:
+    """
+    Save-time analysis of story text: size, readability and vocabulary.
+    Runs once when a story is written so listing pages can filter and sort in SQL.
+    """
+    WORD_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?")
+    SENTENCE_END_RE = re.compile(r"[.!?]+(?:\s|$)")
+    VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+    WORDS_PER_MINUTE = 150  # Unhurried pace for language learners
+    LONG_WORD_LENGTH = 7
+    TOP_WORDS = 10
+    STOPWORDS = frozenset("""
+        a an and are as at be but by for from had has have he her his i in is it its
+        of on or she so that the their them then there they this to was we were
+        what when which who will with you your not do did does been me my our us
+    """.split())
+    # Flesch-Kincaid grade upper bounds per level, checked in order
+    LEVELS = [
+        ('beginner', 3.0),
+        ('elementary', 6.0),
+        ('intermediate', 9.0),
+        ('advanced', None),
+    ]
+
+    @classmethod
+    def plain_text(cls, content):
+        # Pad tags with a space so adjacent block elements don't glue words together
+        return unescape(strip_tags((content or '').replace('>', '> ')))
+
+    @classmethod
+    def count_syllables(cls, word):
+        word = word.lower().strip("'")
+        if len(word) <= 3:
+            return 1
+        if word.endswith('e') and not word.endswith(('le', 'ee')):
+            word = word[:-1]
+        return max(1, len(cls.VOWEL_GROUP_RE.findall(word)))
+
+    @classmethod
+    def level_for_grade(cls, grade):
+        if grade is None:
+            return ''
+        for level, upper_bound in cls.LEVELS:
+            if upper_bound is None or grade <= upper_bound:
+                return level
+        return ''
+
+    @classmethod
+    def analyze(cls, content):
+        """
+        Returns the Story field values describing `content` (HTML allowed).
+        """
+        text = cls.plain_text(content)
+        words = cls.WORD_RE.findall(text)
+        word_count = len(words)
+        if word_count == 0:
+            return {
+                'word_count': 0,
+                'sentence_count': 0,
+                'flesch_reading_ease': None,
+                'flesch_kincaid_grade': None,
+                'reading_time_seconds': 0,
+                'level': '',
+                'vocabulary_profile': {},
+            }
+
+        sentence_count = max(1, len(cls.SENTENCE_END_RE.findall(text)))
+        syllables = sum(cls.count_syllables(word) for word in words)
+        words_per_sentence = word_count / sentence_count
+        syllables_per_word = syllables / word_count
+        reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        grade = max(0.0, 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59)
+
+        lowered = [word.lower() for word in words]
+        frequencies = Counter(word for word in lowered if word not in cls.STOPWORDS)
+        vocabulary_profile = {
+            'unique': len(set(lowered)),
+            'ttr': round(len(set(lowered)) / word_count, 3),
+            'long': round(sum(1 for word in lowered if len(word) >= cls.LONG_WORD_LENGTH) / word_count, 3),
+            'top': frequencies.most_common(cls.TOP_WORDS),
+        }
+
+        return {
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'flesch_reading_ease': round(reading_ease, 1),
+            'flesch_kincaid_grade': round(grade, 1),
+            'reading_time_seconds': round(word_count * 60 / cls.WORDS_PER_MINUTE),
+            'level': cls.level_for_grade(grade),
+            'vocabulary_profile': vocabulary_profile,
+        }
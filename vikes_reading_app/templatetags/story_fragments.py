@@ -0,0 +1,49 @@
+from django import template
+from django.conf import settings
+from django.core.cache import cache
+
+from vikes_reading_app import instrumentation
+
+
+register = template.Library()
+
+
+def story_fragment_key(name, story):
+    # The content version is part of the key, so an edit makes old fragments unreachable
+    return f'story_fragment:{name}:{story.id}:{story.content_version}'
+
+
+class StoryFragmentNode(template.Node):
+    def __init__(self, nodelist, name, story):
+        self.nodelist = nodelist
+        self.name = name
+        self.story = story
+
+    def render(self, context):
+        key = story_fragment_key(self.name.resolve(context), self.story.resolve(context))
+        fragment = cache.get(key)
+        if fragment is not None:
+            instrumentation.increment('fragment_cache.hits')
+            return fragment
+        instrumentation.increment('fragment_cache.misses')
+        fragment = self.nodelist.render(context)
+        cache.set(key, fragment, settings.FRAGMENT_CACHE_SECONDS)
+        return fragment
+
+
+@register.tag
+def story_fragment(parser, token):
+    """
+    Caches the enclosed markup per story and content version:
+
+        {% story_fragment "manage_questions" story %} ... {% endstory_fragment %}
+
+    Only wrap markup that depends on the story's exercises and questions;
+    the story repository bumps the version whenever one of them changes.
+    """
+    bits = token.split_contents()
+    if len(bits) != 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' takes a fragment name and a story.")
+    nodelist = parser.parse(('endstory_fragment',))
+    parser.delete_first_token()
+    return StoryFragmentNode(nodelist, parser.compile_filter(bits[1]), parser.compile_filter(bits[2]))
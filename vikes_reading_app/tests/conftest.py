@@ -1,9 +1,20 @@
 import pytest
 from django.contrib.auth import get_user_model
-from vikes_reading_app.models import Story, PostReadingQuestion, PreReadingExercise
+from django.core.cache import cache
+from vikes_reading_app.models import ClassGroup, Story
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
 
 User = get_user_model()
 
+# --- Cache Isolation ---
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Story ids are reused across tests, so cached fragments and counters must not carry over."""
+    cache.clear()
+    yield
+    cache.clear()
+
 # --- User Fixtures ---
 
 @pytest.fixture
@@ -16,6 +27,13 @@ def student_user(db):
     """Creates a student user."""
     return User.objects.create_user(username='student', password='pass', role='student')
 
+@pytest.fixture
+def class_group(teacher_user, student_user):
+    """Creates the teacher's class with the student enrolled."""
+    group = ClassGroup.objects.create(teacher=teacher_user, name='Class 1')
+    group.students.add(student_user)
+    return group
+
 @pytest.fixture
 def published_story(teacher_user) -> Story:
     """Creates a published story visible to students."""
@@ -29,9 +47,8 @@ def published_story(teacher_user) -> Story:
 
 @pytest.fixture
 def post_reading_question(published_story):
-    """Creates one post-reading question for a story."""
-    return PostReadingQuestion.objects.create(
-        story=published_story,
+    """Creates one post-reading question for a story (through the repository, so the story's count follows)."""
+    return ORMStoryRepository().create_post_reading_question(published_story, dict(
         question_text='What happened at the end?',
         option_1='They fought a dragon.',
         option_2='They lived happily ever after.',
@@ -39,25 +56,24 @@ def post_reading_question(published_story):
         option_4='They went to bed.',
         correct_option=2,
         explanation='Classic fairy tale ending.'
-    )
+    ))
 
 @pytest.fixture
 def two_pre_reading_exercises(published_story):
-    """Creates two pre-reading exercises for a story."""
-    ex1 = PreReadingExercise.objects.create(
-        story=published_story,
+    """Creates two pre-reading exercises for a story (through the repository, so the story's count follows)."""
+    repo = ORMStoryRepository()
+    ex1 = repo.create_pre_reading_exercise(published_story, dict(
         question_text="Q1?",
         option_1="A",
         option_2="B",
         is_option_1_correct=True
-    )
-    ex2 = PreReadingExercise.objects.create(
-        story=published_story,
+    ))
+    ex2 = repo.create_pre_reading_exercise(published_story, dict(
         question_text="Q2?",
         option_1="C",
         option_2="D",
         is_option_2_correct=True
-    )
+    ))
     return ex1, ex2
 
 @pytest.fixture
@@ -0,0 +1,163 @@
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from vikes_reading_app.models import ANSWERS_SCHEMA, PACKED_ANSWERS_SCHEMA, Progress, QuestionStats
+from vikes_reading_app.repositories.progress_repository_impl import ORMProgressRepository
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.services import answer_codec
+from vikes_reading_app.services.reading_flow import ReadingFlowService
+
+
+# --- Helpers ---
+
+def _answers():
+    return {
+        'pre_reading': {'3': 'dog', '140': 'yes', '141': 'Ünïcode text, not one of the options'},
+        'post_reading': {
+            '7': {'selected_option': '2', 'is_correct': True},
+            '9': {'selected_option': '4', 'is_correct': False},
+            '1000': {'selected_option': '1', 'is_correct': True},
+        },
+    }
+
+
+def _set_pre_reading(student, story, exercise_id, text):
+    ORMProgressRepository().update_progress(
+        student, story, lambda progress: ReadingFlowService.set_pre_reading_answer(progress, exercise_id, text),
+    )
+
+
+# ========================
+# 🗜️ Codec
+# ========================
+
+def test_round_trip_is_exact_and_smaller_than_json():
+    answers = _answers()
+    packed = answer_codec.encode(answers)
+
+    assert answer_codec.decode(packed) == answers
+    assert len(packed) < len(json.dumps(answers)) / 2
+
+    empty = {'pre_reading': {}, 'post_reading': {}}
+    assert answer_codec.decode(answer_codec.encode(empty)) == empty
+
+
+@pytest.mark.parametrize('answers', [
+    # Older post-reading answers that only kept their correctness
+    {'pre_reading': {}, 'post_reading': {'7': True}},
+    {'pre_reading': {}, 'post_reading': {'7': {'selected_option': None, 'is_correct': False}}},
+    {'pre_reading': {}, 'post_reading': {'7': {'selected_option': '5', 'is_correct': False}}},
+    {'pre_reading': {}, 'post_reading': {'7': {'selected_option': '1', 'is_correct': True, 'extra': 1}}},
+    {'pre_reading': {'3': None}, 'post_reading': {}},
+    {'pre_reading': {}, 'post_reading': {'q1': {'selected_option': '1', 'is_correct': True}}},
+    {'pre_reading': {'03': 'dog'}, 'post_reading': {}},
+])
+def test_answers_without_an_exact_compact_form_are_rejected(answers):
+    with pytest.raises(ValueError):
+        answer_codec.encode(answers)
+
+
+# ========================
+# 💾 Compact Storage
+# ========================
+
+@pytest.mark.django_db
+def test_compact_rows_read_back_through_the_repositories(
+    settings, logged_in_client_student, student_user, published_story, two_pre_reading_exercises, post_reading_question,
+):
+    settings.COMPACT_ANSWERS = True
+    ex1, _ = two_pre_reading_exercises
+    logged_in_client_student.post(
+        reverse('pre_reading_submit', args=[published_story.id]),
+        {'exercise_id': ex1.id, 'selected_answer': ex1.option_1},
+    )
+    logged_in_client_student.post(
+        reverse('post_reading_submit', args=[published_story.id, post_reading_question.id]),
+        {'answer': '2'},
+    )
+
+    row = Progress.objects.get(student=student_user, read_story=published_story)
+    assert row.answers_schema == PACKED_ANSWERS_SCHEMA
+    assert row.answers_given == {'pre_reading': {}, 'post_reading': {}}
+
+    expected = {
+        'pre_reading': {str(ex1.id): ex1.option_1},
+        'post_reading': {str(post_reading_question.id): {'selected_option': '2', 'is_correct': True}},
+    }
+    repo = ORMProgressRepository()
+    assert repo.get_progress(student_user.id, published_story.id).answers_given == expected
+    assert repo.get_story_entry_snapshot(student_user.id, published_story.id).progress.answers_given == expected
+    assert repo.get_progress_model(student_user, published_story).get_pre_reading_stats()['correct'] == 1
+
+
+@pytest.mark.django_db
+def test_switching_back_rewrites_rows_as_json(settings, student_user, published_story, post_reading_question):
+    repo = ORMProgressRepository()
+
+    def answer(option):
+        repo.update_progress(student_user, published_story, lambda progress: ReadingFlowService.set_post_reading_answer(
+            progress, post_reading_question.id, option, option == '2',
+        ))
+
+    settings.COMPACT_ANSWERS = True
+    answer('1')
+    settings.COMPACT_ANSWERS = False
+    answer('2')
+
+    row = Progress.objects.get(student=student_user, read_story=published_story)
+    assert (row.answers_schema, row.answers_packed) == (ANSWERS_SCHEMA, None)
+    assert row.answers_given['post_reading'] == {
+        str(post_reading_question.id): {'selected_option': '2', 'is_correct': True},
+    }
+
+
+@pytest.mark.django_db
+def test_item_stats_rebuild_reads_compact_rows(settings, student_user, published_story, two_pre_reading_exercises):
+    settings.COMPACT_ANSWERS = True
+    ex1, _ = two_pre_reading_exercises
+    ORMProgressRepository().update_progress(
+        student_user, published_story, lambda progress: ReadingFlowService.set_pre_reading_answer(progress, ex1.id, 'B'),
+    )
+
+    # Making B the correct option rebuilds the exercise's counters from the stored answers
+    ORMStoryRepository().update_pre_reading_exercise(ex1, {'is_option_1_correct': False, 'is_option_2_correct': True})
+
+    stats = QuestionStats.objects.get(exercise=ex1)
+    assert (stats.answer_count, stats.correct_count, stats.option_counts) == (1, 1, [0, 1])
+
+
+@pytest.mark.django_db
+def test_rows_that_cant_be_packed_stay_json(settings, student_user, published_story, post_reading_question):
+    settings.COMPACT_ANSWERS = True
+    legacy = {str(post_reading_question.id): True}
+
+    ORMProgressRepository().update_progress(
+        student_user, published_story, lambda progress: progress.answers_given['post_reading'].update(legacy),
+    )
+
+    row = Progress.objects.get(student=student_user, read_story=published_story)
+    assert (row.answers_schema, row.answers_packed) == (ANSWERS_SCHEMA, None)
+    assert row.answers_given['post_reading'] == legacy
+
+
+@pytest.mark.django_db
+def test_edited_options_grade_compact_and_json_rows_alike(settings, student_user, published_story, two_pre_reading_exercises):
+    ex1, _ = two_pre_reading_exercises
+    json_student = get_user_model().objects.create_user(username='json_student', password='pass', role='student')
+    settings.COMPACT_ANSWERS = True
+    _set_pre_reading(student_user, published_story, ex1.id, 'A')
+    settings.COMPACT_ANSWERS = False
+    _set_pre_reading(json_student, published_story, ex1.id, 'A')
+
+    ORMStoryRepository().update_pre_reading_exercise(ex1, {'option_1': 'Alpha'})
+
+    repo = ORMProgressRepository()
+    compact = repo.get_progress_model(student_user, published_story)
+    plain = repo.get_progress_model(json_student, published_story)
+    assert compact.answers_schema == PACKED_ANSWERS_SCHEMA
+    # Both keep the text the student chose, which no longer matches either option
+    assert compact.answers_given['pre_reading'] == plain.answers_given['pre_reading'] == {str(ex1.id): 'A'}
+    assert compact.get_pre_reading_stats() == plain.get_pre_reading_stats()
@@ -0,0 +1,131 @@
+import datetime
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from vikes_reading_app.models import AssignmentQueueItem, Progress, Story
+from vikes_reading_app.repositories.assignment_repository_impl import ORMAssignmentRepository
+from vikes_reading_app.repositories.user_repository_impl import ORMUserRepository
+
+
+pytestmark = pytest.mark.django_db
+
+User = get_user_model()
+
+DUE = datetime.date(2030, 1, 15)
+
+
+# --- Helpers ---
+
+def _queue_item(student, story):
+    return AssignmentQueueItem.objects.get(student=student, story=story)
+
+
+# ========================
+# 📋 Assignments & To-Do Queue
+# ========================
+
+def test_teacher_assigns_story_and_members_are_queued(logged_in_client_teacher, class_group, student_user, published_story):
+    response = logged_in_client_teacher.post(
+        reverse('assign_story', args=[published_story.id]),
+        {'group': class_group.id, 'due_date': DUE.isoformat()},
+    )
+
+    assert response.url == reverse('class_group_detail', args=[class_group.id])
+    item = _queue_item(student_user, published_story)
+    assert item.stage == 'not_started'
+    assert item.due_date == DUE
+    assert item.next_url == reverse('story_entry_point', args=[published_story.id])
+
+
+def test_assign_form_only_offers_own_classes(logged_in_client_intruder, class_group, published_story):
+    response = logged_in_client_intruder.post(
+        reverse('assign_story', args=[published_story.id]),
+        {'group': class_group.id, 'due_date': DUE.isoformat()},
+    )
+
+    assert response.status_code == 403
+    assert not AssignmentQueueItem.objects.exists()
+
+
+def test_queue_follows_the_reading_flow(
+    logged_in_client_student, student_user, class_group, published_story, two_pre_reading_exercises, post_reading_question
+):
+    ORMAssignmentRepository().assign_story(class_group, published_story, DUE)
+    ex1, ex2 = two_pre_reading_exercises
+
+    logged_in_client_student.post(reverse('pre_reading_submit', args=[published_story.id]),
+                                  {'exercise_id': ex1.id, 'selected_answer': ex1.option_1})
+    assert _queue_item(student_user, published_story).stage == 'pre_reading'
+
+    logged_in_client_student.post(reverse('pre_reading_submit', args=[published_story.id]),
+                                  {'exercise_id': ex2.id, 'selected_answer': ex2.option_2})
+    logged_in_client_student.post(reverse('save_reading_time', args=[published_story.id]),
+                                  data=json.dumps({'time_spent': 30}), content_type='application/json')
+    item = _queue_item(student_user, published_story)
+    assert item.stage == 'reading'
+    assert item.next_url == reverse('story_read_student', args=[published_story.id])
+
+    logged_in_client_student.post(reverse('post_reading_submit', args=[published_story.id, post_reading_question.id]),
+                                  {'answer': '2'})
+    item = _queue_item(student_user, published_story)
+    assert item.stage == 'completed'
+    assert item.is_completed
+
+    logged_in_client_student.get(reverse('reset_progress', args=[published_story.id]))
+    assert _queue_item(student_user, published_story).stage == 'not_started'
+
+
+def test_student_home_lists_open_assignments_from_one_query(
+    logged_in_client_student, student_user, teacher_user, class_group, published_story, django_assert_num_queries
+):
+    finished = Story.objects.create(title='Finished Story', content='Done.', author=teacher_user, status='published')
+    repo = ORMAssignmentRepository()
+    repo.assign_story(class_group, published_story, DUE)
+    repo.assign_story(class_group, finished, DUE - datetime.timedelta(days=3))
+    Progress.objects.create(student=student_user, read_story=finished, current_stage='completed')
+    repo.sync_progress(student_user.id, finished.id)
+
+    with django_assert_num_queries(1):
+        titles = [item.story.title for item in repo.list_student_queue(student_user)]
+    assert titles == ['Published Story']
+
+    response = logged_in_client_student.get(reverse('home'))
+    assert 'My Assignments' in response.content.decode()
+
+
+
+def test_draft_stories_cannot_be_assigned(logged_in_client_teacher, class_group, draft_story):
+    response = logged_in_client_teacher.post(
+        reverse('assign_story', args=[draft_story.id]),
+        {'group': class_group.id, 'due_date': DUE.isoformat()},
+    )
+
+    assert response.status_code == 200
+    assert 'Publish this story before assigning it.' in response.content.decode()
+    assert not AssignmentQueueItem.objects.exists()
+    with pytest.raises(ValueError):
+        ORMAssignmentRepository().assign_story(class_group, draft_story, DUE)
+
+
+def test_story_moved_back_to_draft_leaves_the_queue(student_user, class_group, published_story):
+    repo = ORMAssignmentRepository()
+    repo.assign_story(class_group, published_story, DUE)
+
+    Story.objects.filter(id=published_story.id).update(status='draft')
+
+    assert not repo.list_student_queue(student_user).exists()
+
+def test_roster_changes_update_the_queue(teacher_user, class_group, student_user, published_story):
+    ORMAssignmentRepository().assign_story(class_group, published_story, DUE)
+    newcomer = User.objects.create_user(username='newcomer', password='pass', role='student')
+    Progress.objects.create(student=newcomer, read_story=published_story, current_stage='reading')
+    user_repo = ORMUserRepository()
+
+    user_repo.add_students_to_group(class_group, ['newcomer'])
+    assert _queue_item(newcomer, published_story).stage == 'reading'
+
+    user_repo.remove_student_from_group(class_group, student_user.id)
+    assert not AssignmentQueueItem.objects.filter(student=student_user).exists()
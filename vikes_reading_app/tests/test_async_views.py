@@ -0,0 +1,97 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from django.urls import reverse
+
+from vikes_reading_app.models import Progress
+from vikes_reading_app.views.post_reading import post_reading_submit_async
+from vikes_reading_app.views.pre_reading import pre_reading_submit_async
+from vikes_reading_app.views.progress import save_reading_time_async
+
+
+pytestmark = pytest.mark.django_db
+
+
+# --- Helpers ---
+
+def _as_user(request, user):
+    """Attach the user the way AuthenticationMiddleware does for async views."""
+    async def auser():
+        return user
+    request.user = user
+    request.auser = auser
+    return request
+
+
+# ========================
+# ⚡ Async Submit Endpoints
+# ========================
+
+def test_pre_reading_submit_async_saves_answer_and_returns_next_url(
+    student_user, published_story, two_pre_reading_exercises
+):
+    ex1, ex2 = two_pre_reading_exercises
+    request = _as_user(RequestFactory().post(
+        reverse('pre_reading_submit', args=[published_story.id]),
+        {'exercise_id': ex1.id, 'selected_answer': ex1.option_1},
+    ), student_user)
+
+    response = async_to_sync(pre_reading_submit_async)(request, story_id=published_story.id)
+
+    assert response.status_code == 200
+    data = json.loads(response.content)
+    assert data['correct'] is True
+    assert data['next_url'] == reverse('pre_reading_read', args=[published_story.id])
+    progress = Progress.objects.get(student=student_user, read_story=published_story)
+    assert progress.answers_given['pre_reading'] == {str(ex1.id): ex1.option_1}
+
+
+def test_post_reading_submit_async_records_answer_and_redirects_to_summary(
+    student_user, published_story, post_reading_question
+):
+    request = _as_user(RequestFactory().post(
+        reverse('post_reading_submit', args=[published_story.id, post_reading_question.id]),
+        {'answer': '2'},
+    ), student_user)
+
+    response = async_to_sync(post_reading_submit_async)(
+        request, story_id=published_story.id, question_id=post_reading_question.id
+    )
+
+    assert response.status_code == 302
+    assert response.url == reverse('post_reading_summary', args=[published_story.id])
+    progress = Progress.objects.get(student=student_user, read_story=published_story)
+    assert progress.answers_given['post_reading'][str(post_reading_question.id)] == {
+        'selected_option': '2',
+        'is_correct': True,
+    }
+
+
+def test_save_reading_time_async_updates_progress(student_user, published_story):
+    request = _as_user(RequestFactory().post(
+        reverse('save_reading_time', args=[published_story.id]),
+        data=json.dumps({'time_spent': 42}),
+        content_type='application/json',
+    ), student_user)
+
+    response = async_to_sync(save_reading_time_async)(request, story_id=published_story.id)
+
+    assert response.status_code == 200
+    progress = Progress.objects.get(student=student_user, read_story=published_story)
+    assert progress.reading_time == 42
+    assert progress.current_stage == 'reading'
+
+
+def test_async_submit_rejects_teacher(teacher_user, published_story, two_pre_reading_exercises):
+    ex1, _ = two_pre_reading_exercises
+    request = _as_user(RequestFactory().post(
+        reverse('pre_reading_submit', args=[published_story.id]),
+        {'exercise_id': ex1.id, 'selected_answer': ex1.option_1},
+    ), teacher_user)
+
+    response = async_to_sync(pre_reading_submit_async)(request, story_id=published_story.id)
+
+    assert response.status_code == 403
+    assert not Progress.objects.exists()
@@ -0,0 +1,106 @@
+import io
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from vikes_reading_app.models import ClassGroup, GroupMembership, Progress
+from vikes_reading_app.repositories.progress_repository_impl import ORMProgressRepository
+from vikes_reading_app.repositories.user_repository_impl import ORMUserRepository
+from vikes_reading_app.services.student_import import StudentImportService
+
+
+pytestmark = pytest.mark.django_db
+
+User = get_user_model()
+
+
+# ========================
+# 🏫 Class Groups
+# ========================
+
+def test_teacher_creates_class_and_enrols_students_by_username(logged_in_client_teacher, teacher_user, student_user):
+    response = logged_in_client_teacher.post(reverse('class_groups'), {'name': 'Year 5'})
+    group = ClassGroup.objects.get(teacher=teacher_user, name='Year 5')
+    assert response.url == reverse('class_group_detail', args=[group.id])
+
+    response = logged_in_client_teacher.post(
+        reverse('class_group_detail', args=[group.id]),
+        {'usernames': 'STUDENT, nobody'},
+        follow=True,
+    )
+
+    assert list(group.students.all()) == [student_user]
+    assert 'No student accounts for: nobody' in response.content.decode()
+
+    logged_in_client_teacher.post(reverse('class_group_detail', args=[group.id]), {'remove_student': student_user.id})
+    assert not group.students.exists()
+
+
+
+@pytest.mark.parametrize('value', ['abc', ''])
+def test_removing_a_bad_student_id_shows_a_message(logged_in_client_teacher, class_group, student_user, value):
+    response = logged_in_client_teacher.post(
+        reverse('class_group_detail', args=[class_group.id]), {'remove_student': value}, follow=True,
+    )
+
+    assert response.status_code == 200
+    assert 'That student is not in this class.' in response.content.decode()
+    assert list(class_group.students.all()) == [student_user]
+
+
+def test_removing_a_student_from_another_class_changes_nothing(logged_in_client_teacher, teacher_user, class_group):
+    outsider = User.objects.create_user(username='outsider', password='pass', role='student')
+    other = ClassGroup.objects.create(teacher=teacher_user, name='Club')
+    other.students.add(outsider)
+
+    response = logged_in_client_teacher.post(
+        reverse('class_group_detail', args=[class_group.id]), {'remove_student': outsider.id}, follow=True,
+    )
+
+    assert 'That student is not in this class.' in response.content.decode()
+    assert list(other.students.all()) == [outsider]
+
+def test_duplicate_class_name_is_rejected(logged_in_client_teacher, class_group):
+    response = logged_in_client_teacher.post(reverse('class_groups'), {'name': class_group.name})
+
+    assert response.status_code == 200
+    assert 'You already have a class with this name.' in response.content.decode()
+
+
+def test_class_group_detail_is_owner_only(logged_in_client_intruder, class_group):
+    response = logged_in_client_intruder.get(reverse('class_group_detail', args=[class_group.id]))
+
+    assert response.status_code == 404
+
+
+def test_list_students_is_scoped_to_teacher_groups(teacher_user, student_user, class_group):
+    other_teacher = User.objects.create_user(username='other_teacher', password='pass', role='teacher')
+    outsider = User.objects.create_user(username='outsider', password='pass', role='student')
+    ClassGroup.objects.create(teacher=other_teacher, name='Other').students.add(outsider, student_user)
+    # Being in two of the teacher's classes must not list the student twice
+    ClassGroup.objects.create(teacher=teacher_user, name='Club').students.add(student_user)
+
+    repo = ORMUserRepository()
+
+    assert list(repo.list_students(teacher_user)) == [student_user]
+    assert set(repo.list_students(other_teacher)) == {outsider, student_user}
+
+
+def test_story_titles_for_a_roster_come_from_one_query(student_user, published_story, draft_story, django_assert_num_queries):
+    second = User.objects.create_user(username='second', password='pass', role='student')
+    Progress.objects.create(student=student_user, read_story=published_story)
+    Progress.objects.create(student=student_user, read_story=draft_story)
+
+    with django_assert_num_queries(1):
+        titles = ORMProgressRepository().list_story_titles_by_student([student_user, second])
+
+    assert titles == {student_user.id: ['Draft Story', 'Published Story']}
+
+
+def test_csv_import_enrols_students_in_group(settings, class_group):
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+    StudentImportService.import_csv(io.StringIO("username,password\nnewbie,Fresh-Start-42\n"), workers=0, group=class_group)
+
+    assert GroupMembership.objects.filter(group=class_group, student__username='newbie').exists()
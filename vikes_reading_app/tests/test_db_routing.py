@@ -0,0 +1,125 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import AsyncClient, RequestFactory
+from django.urls import reverse
+
+from vikes_reading_app import db_routers, middleware
+from vikes_reading_app.db_routers import PrimaryReplicaRouter, pin_to_primary, read_alias, reset_pin
+from vikes_reading_app.middleware import ReplicaPinningMiddleware
+from vikes_reading_app.models import Progress
+from vikes_reading_app.repositories.progress_repository_impl import ORMProgressRepository
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.repositories.user_repository_impl import ORMUserRepository
+
+
+# --- Fixtures ---
+
+@pytest.fixture
+def with_replica(monkeypatch):
+    """Behave as if DJANGO_REPLICA_DATABASE_URL were set, without opening a second database."""
+    monkeypatch.setattr(db_routers, 'replica_configured', lambda: True)
+    monkeypatch.setattr(middleware, 'replica_configured', lambda: True)
+
+
+def _run_middleware(request):
+    seen = {}
+
+    def get_response(request):
+        seen['alias'] = read_alias()
+        return HttpResponse()
+
+    response = ReplicaPinningMiddleware(get_response)(request)
+    return seen['alias'], response
+
+
+def _run_async_middleware(request):
+    seen = {}
+
+    async def get_response(request):
+        seen['alias'] = read_alias()
+        return HttpResponse()
+
+    response = async_to_sync(ReplicaPinningMiddleware(get_response))(request)
+    return seen['alias'], response
+
+
+# ========================
+# 🔀 Read Replica Routing
+# ========================
+
+def test_reads_stay_on_primary_without_replica():
+    assert read_alias() == 'default'
+
+
+@pytest.mark.django_db
+def test_dashboard_reads_use_replica_unless_pinned(with_replica, teacher_user, student_user):
+    stories = ORMStoryRepository().list_author_stories(teacher_user)
+
+    assert stories.db == 'replica'
+    assert ORMProgressRepository().list_progress_records(student_user, stories).db == 'replica'
+    assert ORMUserRepository().list_students(teacher_user).db == 'replica'
+
+    token = pin_to_primary()
+    try:
+        assert ORMStoryRepository().list_author_stories(teacher_user).db == 'default'
+    finally:
+        reset_pin(token)
+
+
+def test_router_sends_writes_and_migrations_to_primary():
+    router = PrimaryReplicaRouter()
+    replica_row = Progress()
+    replica_row._state.db = 'replica'
+    primary_row = Progress()
+    primary_row._state.db = 'default'
+
+    assert router.db_for_write(Progress, instance=replica_row) == 'default'
+    assert router.allow_relation(replica_row, primary_row)
+    assert router.allow_migrate('default', 'vikes_reading_app')
+    assert not router.allow_migrate('replica', 'vikes_reading_app')
+
+
+def test_write_pins_request_and_following_requests_to_primary(with_replica, settings):
+    factory = RequestFactory()
+
+    alias, response = _run_middleware(factory.post('/pre-reading/1/submit/'))
+    assert alias == 'default'
+    cookie = response.cookies[ReplicaPinningMiddleware.COOKIE_NAME]
+    assert cookie['max-age'] == settings.REPLICA_PIN_SECONDS
+
+    follow_up = factory.get('/pre-reading/1/read/')
+    follow_up.COOKIES[ReplicaPinningMiddleware.COOKIE_NAME] = '1'
+    assert _run_middleware(follow_up)[0] == 'default'
+
+    alias, response = _run_middleware(factory.get('/profile/'))
+    assert alias == 'replica'
+    assert ReplicaPinningMiddleware.COOKIE_NAME not in response.cookies
+    # The pin never leaks out of the request it was set for
+    assert read_alias() == 'replica'
+
+
+def test_async_middleware_pins_within_the_request(with_replica):
+    factory = RequestFactory()
+
+    alias, response = _run_async_middleware(factory.post('/pre-reading/1/submit/'))
+    assert alias == 'default'
+    assert ReplicaPinningMiddleware.COOKIE_NAME in response.cookies
+
+    assert _run_async_middleware(factory.get('/profile/'))[0] == 'replica'
+    assert read_alias() == 'replica'
+
+
+@pytest.mark.django_db
+def test_submit_through_the_asgi_stack_with_replica(with_replica, student_user, published_story, two_pre_reading_exercises):
+    ex1, _ = two_pre_reading_exercises
+    client = AsyncClient()
+    async_to_sync(client.aforce_login)(student_user)
+
+    response = async_to_sync(client.post)(
+        reverse('pre_reading_submit', args=[published_story.id]),
+        {'exercise_id': ex1.id, 'selected_answer': ex1.option_1},
+    )
+
+    assert response.status_code == 200
+    assert response.cookies[ReplicaPinningMiddleware.COOKIE_NAME].value == '1'
@@ -0,0 +1,69 @@
+import io
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from vikes_reading_app import instrumentation
+from vikes_reading_app.models import PreReadingExercise
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+
+
+pytestmark = pytest.mark.django_db
+
+EXERCISE_TABLE = PreReadingExercise._meta.db_table
+
+
+# --- Helpers ---
+
+def _exercise_queries(captured):
+    return [query for query in captured if f'"{EXERCISE_TABLE}"' in query['sql']]
+
+
+# ========================
+# 🧊 Question Fragment Caching
+# ========================
+
+def test_manage_questions_serves_cached_lists_until_content_changes(
+    logged_in_client_teacher, published_story, two_pre_reading_exercises,
+):
+    url = reverse('manage_questions', args=[published_story.id])
+    assert 'Q1?' in logged_in_client_teacher.get(url).content.decode()
+
+    with CaptureQueriesContext(connection) as queries:
+        content = logged_in_client_teacher.get(url).content.decode()
+    assert 'Q1?' in content
+    assert not _exercise_queries(queries.captured_queries)
+    assert instrumentation.counters() == {'fragment_cache.hits': 1, 'fragment_cache.misses': 1}
+
+    ORMStoryRepository().update_pre_reading_exercise(two_pre_reading_exercises[0], {'question_text': 'Renamed?'})
+
+    content = logged_in_client_teacher.get(url).content.decode()
+    assert 'Renamed?' in content
+    assert 'Q1?' not in content
+
+
+def test_adding_a_question_shows_on_the_teacher_read_view(logged_in_client_teacher, published_story):
+    url = reverse('story_read_teacher', args=[published_story.id])
+    assert 'No post-reading questions available' in logged_in_client_teacher.get(url).content.decode()
+
+    logged_in_client_teacher.post(reverse('post_reading_create', args=[published_story.id]), {
+        'question_text': 'Who won?', 'option_1': 'A', 'option_2': 'B', 'option_3': 'C', 'option_4': 'D',
+        'correct_option': 1, 'explanation': '',
+    })
+
+    assert 'Who won?' in logged_in_client_teacher.get(url).content.decode()
+
+
+def test_instrumentation_report_shows_hit_rate():
+    instrumentation.increment('fragment_cache.hits', 3)
+    instrumentation.increment('fragment_cache.misses')
+    out = io.StringIO()
+
+    call_command('instrumentation_report', '--reset', stdout=out, stderr=io.StringIO())
+
+    assert 'fragment_cache.hits: 3' in out.getvalue()
+    assert 'fragment_cache.hit_rate: 75.0%' in out.getvalue()
+    assert instrumentation.counters()['fragment_cache.hits'] == 0
@@ -0,0 +1,100 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from vikes_reading_app.identity_map import identity_map_scope
+from vikes_reading_app.models import Story
+from vikes_reading_app.repositories.progress_repository_impl import ORMProgressRepository
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.services.reading_flow import ReadingFlowService
+
+
+pytestmark = pytest.mark.django_db
+
+STORY_TABLE = Story._meta.db_table
+
+
+# --- Helpers ---
+
+def _story_selects(queries):
+    return [query['sql'] for query in queries if query['sql'].startswith('SELECT') and f'FROM "{STORY_TABLE}"' in query['sql']]
+
+
+# ========================
+# 🪪 Request Identity Map
+# ========================
+
+def test_repositories_share_rows_within_a_scope(published_story, two_pre_reading_exercises, django_assert_num_queries):
+    ex1, _ = two_pre_reading_exercises
+
+    with identity_map_scope() as identity_map:
+        with django_assert_num_queries(2):
+            story = ORMStoryRepository().get_story_by_id(published_story.id)
+            exercises = ReadingFlowService.story_repo.list_pre_reading_exercises(story)
+            # Loaded by the list above, and from a different repository instance
+            exercise = ORMStoryRepository().get_pre_reading_exercise(ex1.id)
+            assert ORMStoryRepository().get_story_by_id(published_story.id) is story
+            assert exercise is exercises[0]
+            assert exercise.story is story
+        assert identity_map.hits == 2
+
+    # Outside a request scope every lookup goes to the database
+    with django_assert_num_queries(2):
+        ORMStoryRepository().get_story_by_id(published_story.id)
+        ORMStoryRepository().get_story_by_id(published_story.id)
+
+
+def test_progress_writes_refresh_the_map(student_user, published_story, django_assert_num_queries):
+    repo = ORMProgressRepository()
+
+    with identity_map_scope():
+        assert repo.get_progress_model(student_user, published_story) is None
+        saved = repo.update_progress(
+            student_user, published_story,
+            lambda progress: ReadingFlowService.set_pre_reading_answer(progress, 1, 'A'),
+        )
+        with django_assert_num_queries(0):
+            assert repo.get_progress_model(student_user, published_story) is saved
+            assert repo.get_progress(student_user.id, published_story.id).answers_given['pre_reading'] == {'1': 'A'}
+
+        repo.delete_progress(student_user, published_story)
+        assert repo.get_progress_model(student_user, published_story) is None
+
+
+def test_edits_drop_stale_lists(published_story, two_pre_reading_exercises):
+    repo = ORMStoryRepository()
+
+    with identity_map_scope():
+        assert len(repo.list_pre_reading_exercises(published_story)) == 2
+        repo.delete_pre_reading_exercise(two_pre_reading_exercises[0])
+        assert len(repo.list_pre_reading_exercises(published_story)) == 1
+
+
+def test_submit_loads_the_story_once(logged_in_client_student, published_story, two_pre_reading_exercises):
+    ex1, _ = two_pre_reading_exercises
+
+    with CaptureQueriesContext(connection) as queries:
+        response = logged_in_client_student.post(
+            reverse('pre_reading_submit', args=[published_story.id]),
+            {'exercise_id': ex1.id, 'selected_answer': ex1.option_1},
+        )
+
+    assert response.json()['correct']
+    assert len(_story_selects(queries.captured_queries)) == 1
+
+
+def test_submit_through_the_asgi_stack(student_user, published_story, two_pre_reading_exercises):
+    ex1, _ = two_pre_reading_exercises
+    client = AsyncClient()
+    async_to_sync(client.aforce_login)(student_user)
+
+    response = async_to_sync(client.post)(
+        reverse('pre_reading_submit', args=[published_story.id]),
+        {'exercise_id': ex1.id, 'selected_answer': ex1.option_1},
+    )
+
+    assert response.status_code == 200
+    assert response.json()['correct']
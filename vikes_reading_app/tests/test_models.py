@@ -1,6 +1,9 @@
 # --- Imports and Model Setup ---
 
+from importlib import import_module
+
 import pytest
+from django.apps import apps
 from django.db import IntegrityError
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -9,7 +12,10 @@ from vikes_reading_app.models import (
     Story,
     Progress,
     PreReadingExercise,
-    PostReadingQuestion
+    PostReadingQuestion,
+    StoryReadingStats,
+    ANSWERS_SCHEMA,
+    empty_answers,
 )
 
 # --- Fixtures ---
@@ -144,7 +150,6 @@ def test_create_progress_entry(create_user, create_story):
         score=85.5,
         current_stage='reading',
         answers_given={"q1": "a"},
-        post_reading_lookups={},
     )
     assert progress.score == 85.5
     assert progress.current_stage == "reading"
@@ -191,6 +196,51 @@ def test_progress_is_unique_per_student_and_story(create_user, create_story):
     with pytest.raises(IntegrityError):
         Progress.objects.create(student=student, read_story=story, score=10)
 
+
+@pytest.mark.django_db
+def test_new_progress_stores_both_answer_buckets(create_user, create_story):
+    student = create_user(username="bucket_student", role="student")
+    story = create_story(title="Buckets", author=create_user(username="bucket_teacher", role="teacher"))
+
+    progress = Progress.objects.create(student=student, read_story=story)
+
+    assert progress.answers_given == empty_answers()
+    assert progress.answers_schema == ANSWERS_SCHEMA
+
+
+# 🧪 Migration 0028 rewrites schema 1 answers into the two-bucket layout
+@pytest.mark.parametrize("stored, expected", [
+    ({'7': {'selected_option': '2', 'is_correct': True}},
+     {'pre_reading': {}, 'post_reading': {'7': {'selected_option': '2', 'is_correct': True}}}),
+    ({}, {'pre_reading': {}, 'post_reading': {}}),
+    ({'pre_reading': {'3': 'A'}}, {'pre_reading': {'3': 'A'}, 'post_reading': {}}),
+    ({'pre_reading': {'3': 'A'}, 'post_reading': {'7': True}}, {'pre_reading': {'3': 'A'}, 'post_reading': {'7': True}}),
+    ({'pre_reading': None, 'post_reading': {'7': True}}, {'pre_reading': {}, 'post_reading': {'7': True}}),
+    ({'pre_reading': {'3': 'A'}, 'post_reading': ['7']}, {'pre_reading': {'3': 'A'}, 'post_reading': {}}),
+    (None, {'pre_reading': {}, 'post_reading': {}}),
+])
+def test_answers_schema_migration_nests_legacy_layouts(stored, expected):
+    migration = import_module('vikes_reading_app.migrations.0028_progress_answers_schema')
+
+    assert migration._nested(stored) == expected
+
+
+@pytest.mark.django_db
+def test_answers_schema_migration_repairs_rows_that_have_both_keys(create_user, create_story):
+    migration = import_module('vikes_reading_app.migrations.0028_progress_answers_schema')
+    student = create_user(username="null_bucket_student", role="student")
+    story = create_story(title="Null Bucket", author=create_user(username="null_bucket_teacher", role="teacher"))
+    progress = Progress.objects.create(student=student, read_story=story)
+    Progress.objects.filter(pk=progress.pk).update(
+        answers_given={'pre_reading': None, 'post_reading': {'7': True}}, answers_schema=1,
+    )
+
+    migration.upgrade_answers(apps, None)
+
+    progress.refresh_from_db()
+    assert progress.answers_given == {'pre_reading': {}, 'post_reading': {'7': True}}
+    assert progress.answers_schema == 2
+
 # ================================
 # 🎧 PreReadingExercise Model Tests
 # ================================
@@ -337,3 +387,37 @@ def test_post_question_correct_option_validation(create_story, create_user, corr
     else:
         with pytest.raises(ValidationError):
             question.full_clean()
+
+
+# --- Reading Time Baseline Tests ---
+
+def test_story_reading_stats_matches_batch_mean_and_stddev_after_add_and_remove():
+    stats = StoryReadingStats()
+    for value in [60, 70, 80, 90, 500]:
+        stats.add_sample(value)
+    stats.remove_sample(500)
+    stats.add_sample(100)
+
+    assert stats.sample_count == 5
+    assert stats.mean == pytest.approx(80)
+    assert stats.stddev == pytest.approx(15.8113883)
+
+
+@pytest.mark.parametrize("value,expected", [
+    (20, 'skimmed'),
+    (80, 'typical'),
+    (200, 'stalled'),
+    (0, None),
+])
+def test_story_reading_stats_classify(value, expected):
+    stats = StoryReadingStats()
+    for sample in [60, 70, 80, 90, 100]:
+        stats.add_sample(sample)
+    assert stats.classify(value) == expected
+
+
+def test_story_reading_stats_needs_minimum_samples_before_flagging():
+    stats = StoryReadingStats()
+    for sample in [60, 70, 80]:
+        stats.add_sample(sample)
+    assert stats.classify(5) is None
@@ -1,7 +1,74 @@
 import pytest
 
+from vikes_reading_app.models import PostReadingLookup, Progress, StoryReadingStats
+from vikes_reading_app.repositories.progress_repository_impl import ORMProgressRepository
+
 @pytest.mark.django_db
 def test_session_progress_repository_return_dto(published_story) -> None:
     
     story = published_story
-    
\ No newline at end of file
+    
+
+
+@pytest.mark.django_db
+def test_record_lookup_increments_atomically_up_to_the_limit(student_user, published_story, post_reading_question):
+    repo = ORMProgressRepository()
+
+    counts = [repo.record_lookup(student_user, published_story, post_reading_question.id, 3) for _ in range(4)]
+
+    assert counts == [1, 2, 3, None]
+    assert repo.get_lookup_count(student_user, post_reading_question.id) == 3
+    assert PostReadingLookup.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_get_lookup_count_defaults_to_zero(student_user, post_reading_question):
+    assert ORMProgressRepository().get_lookup_count(student_user, post_reading_question.id) == 0
+
+
+
+@pytest.mark.django_db
+def test_save_time_keeps_reading_baseline_in_step(student_user, published_story):
+    repo = ORMProgressRepository()
+
+    repo.save_time(student_user, published_story, 'reading_time', 'reading', 40)
+    repo.save_time(student_user, published_story, 'reading_time', 'reading', 60)
+    repo.save_time(student_user, published_story, 'pre_reading_time', 'pre_reading', 10)
+
+    stats = StoryReadingStats.objects.get(story=published_story)
+    assert stats.sample_count == 1
+    assert stats.mean == pytest.approx(60)
+
+    repo.delete_progress(student_user, published_story)
+    stats.refresh_from_db()
+    assert stats.sample_count == 0
+
+
+@pytest.mark.django_db
+def test_apply_stage_timings_updates_reading_baseline_once(student_user, published_story):
+    repo = ORMProgressRepository()
+    progress = Progress.objects.create(student=student_user, read_story=published_story)
+
+    assert repo.apply_stage_timings(progress, {'reading_time': 30}, seq=5) is True
+    assert repo.apply_stage_timings(progress, {'reading_time': 30}, seq=5) is False
+
+    stats = StoryReadingStats.objects.get(story=published_story)
+    assert stats.sample_count == 1
+    assert stats.mean == pytest.approx(30)
+
+
+@pytest.mark.django_db
+def test_story_entry_snapshot_reads_only_this_students_progress(
+    student_user, teacher_user, published_story, two_pre_reading_exercises, django_assert_num_queries
+):
+    repo = ORMProgressRepository()
+    Progress.objects.create(student=teacher_user, read_story=published_story, current_stage='completed')
+
+    with django_assert_num_queries(1):
+        snapshot = repo.get_story_entry_snapshot(student_user.id, published_story.id)
+    assert snapshot.progress.is_empty
+    assert (snapshot.pre_reading_total, snapshot.post_reading_total) == (2, 0)
+
+    Progress.objects.create(student=student_user, read_story=published_story, current_stage='reading', reading_time=5)
+    snapshot = repo.get_story_entry_snapshot(student_user.id, published_story.id)
+    assert snapshot.progress.current_stage == 'reading'
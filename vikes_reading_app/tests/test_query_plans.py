@@ -0,0 +1,57 @@
+import pytest
+from django.db import connection
+
+from vikes_reading_app.models import Progress, Story
+from vikes_reading_app.repositories.progress_repository_impl import ORMProgressRepository
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != 'sqlite', reason="Plans are checked with SQLite's EXPLAIN QUERY PLAN"),
+]
+
+
+# --- Helpers ---
+
+def _index_name(model, fields):
+    return next(index.name for index in model._meta.indexes if index.fields == fields)
+
+
+def _assert_uses_index(queryset, index_name):
+    plan = queryset.explain()
+    assert f"INDEX {index_name} " in plan, plan
+    return plan
+
+
+# ========================
+# 🗂 Index Usage (EXPLAIN)
+# ========================
+
+def test_home_listing_uses_status_id_index_without_sorting(student_user):
+    plan = _assert_uses_index(
+        ORMStoryRepository().list_home_stories(student_user),
+        _index_name(Story, ['status', 'id']),
+    )
+    assert 'TEMP B-TREE' not in plan
+
+
+def test_home_listing_by_level_uses_status_level_index(student_user):
+    _assert_uses_index(
+        ORMStoryRepository().list_home_stories(student_user, level='beginner'),
+        _index_name(Story, ['status', 'level']),
+    )
+
+
+@pytest.mark.parametrize('filters', [{}, {'current_stage': 'completed'}])
+def test_per_story_progress_uses_story_stage_index(published_story, filters):
+    _assert_uses_index(
+        Progress.objects.filter(read_story=published_story, **filters),
+        _index_name(Progress, ['read_story', 'current_stage']),
+    )
+
+
+def test_profile_detail_progress_uses_student_story_constraint(teacher_user, student_user):
+    stories = ORMStoryRepository().list_author_stories(teacher_user)
+    plan = ORMProgressRepository().list_progress_records(student_user, stories).explain()
+    assert 'sqlite_autoindex_vikes_reading_app_progress_1 (student_id=? AND read_story_id=?)' in plan, plan
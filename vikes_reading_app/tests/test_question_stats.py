@@ -0,0 +1,100 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from vikes_reading_app.models import QuestionStats
+from vikes_reading_app.repositories.progress_repository_impl import ORMProgressRepository
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.services.reading_flow import ReadingFlowService
+
+
+pytestmark = pytest.mark.django_db
+
+
+# --- Helpers ---
+
+def _student(username):
+    return get_user_model().objects.create_user(username=username, password='pass', role='student')
+
+
+def _answer_pre(student, story, exercise, text):
+    ORMProgressRepository().update_progress(
+        student, story, lambda progress: ReadingFlowService.set_pre_reading_answer(progress, exercise.id, text),
+    )
+
+
+def _answer_post(student, story, question, option):
+    ORMProgressRepository().update_progress(
+        student, story,
+        lambda progress: ReadingFlowService.set_post_reading_answer(
+            progress, question.id, str(option), option == question.correct_option,
+        ),
+    )
+
+
+def _counts(stats):
+    return stats.answer_count, stats.correct_count, stats.option_counts
+
+
+# ========================
+# 📊 Item Statistics
+# ========================
+
+def test_answers_move_the_counters_instead_of_adding_up(student_user, published_story, two_pre_reading_exercises):
+    ex1, _ = two_pre_reading_exercises
+    other = _student('other')
+
+    _answer_pre(student_user, published_story, ex1, 'B')
+    _answer_pre(other, published_story, ex1, 'A')
+    # Changing an answer moves this student's vote rather than counting a second one
+    _answer_pre(student_user, published_story, ex1, 'A')
+
+    stats = QuestionStats.objects.get(exercise=ex1)
+    assert _counts(stats) == (2, 2, [2, 0])
+    assert stats.correct_percentage == 100
+
+
+def test_post_reading_answers_and_lookups(student_user, published_story, post_reading_question):
+    repo = ORMProgressRepository()
+    repo.record_lookup(student_user, published_story, post_reading_question.id, limit=3)
+    repo.record_lookup(student_user, published_story, post_reading_question.id, limit=3)
+    _answer_post(student_user, published_story, post_reading_question, 1)
+    _answer_post(_student('other'), published_story, post_reading_question, 2)
+
+    stats = QuestionStats.objects.get(question=post_reading_question)
+    assert _counts(stats) == (2, 1, [1, 1, 0, 0])
+    assert stats.correct_percentage == 50
+    assert stats.average_lookups == 1.0
+
+
+def test_resetting_progress_removes_the_students_contribution(student_user, published_story, two_pre_reading_exercises, post_reading_question):
+    repo = ORMProgressRepository()
+    _answer_pre(student_user, published_story, two_pre_reading_exercises[0], 'A')
+    _answer_post(student_user, published_story, post_reading_question, 2)
+    repo.record_lookup(student_user, published_story, post_reading_question.id, limit=3)
+
+    repo.delete_progress(student_user, published_story)
+
+    for stats in QuestionStats.objects.all():
+        assert (stats.answer_count, stats.correct_count, stats.lookup_count) == (0, 0, 0)
+
+
+def test_editing_an_exercise_regrades_its_answers(student_user, published_story, two_pre_reading_exercises):
+    ex1, _ = two_pre_reading_exercises
+    _answer_pre(student_user, published_story, ex1, 'B')
+    assert QuestionStats.objects.get(exercise=ex1).correct_count == 0
+
+    ORMStoryRepository().update_pre_reading_exercise(ex1, {'is_option_1_correct': False, 'is_option_2_correct': True})
+
+    assert _counts(QuestionStats.objects.get(exercise=ex1)) == (1, 1, [0, 1])
+
+
+def test_manage_questions_shows_item_analysis(logged_in_client_teacher, student_user, published_story, two_pre_reading_exercises, post_reading_question):
+    _answer_pre(student_user, published_story, two_pre_reading_exercises[0], 'A')
+
+    response = logged_in_client_teacher.get(reverse('manage_questions', args=[published_story.id]))
+
+    content = response.content.decode()
+    assert 'Item Analysis' in content
+    assert 'A: 1 · B: 0' in content
+    assert '100%' in content
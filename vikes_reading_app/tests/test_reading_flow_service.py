@@ -154,3 +154,44 @@ def test_set_post_reading_answer_writes_into_post_reading_bucket_and_preserves_p
             },
         },
     }
+
+
+# ========================
+# ⏱ Stage Telemetry Folding
+# ========================
+
+def test_fold_stage_events_keeps_newest_event_per_stage_and_skips_applied():
+    events = [
+        {'seq': 5, 'stage': 'reading', 'elapsed': 10},
+        {'seq': 12, 'stage': 'reading', 'elapsed': 40},
+        {'seq': 11, 'stage': 'reading', 'elapsed': 30},
+        {'seq': 3, 'stage': 'pre_reading', 'elapsed': 99},
+    ]
+
+    updates, seq = ReadingFlowService.fold_stage_events(events, last_seq=4)
+
+    assert updates == {'reading_time': 40}
+    assert seq == 12
+
+
+def test_fold_stage_events_final_event_advances_stage_and_ignores_bad_events():
+    events = [
+        {'seq': 1, 'stage': 'post_reading', 'elapsed': 20, 'final': True},
+        {'seq': 2, 'stage': 'unknown', 'elapsed': 5},
+        {'seq': 'x', 'stage': 'reading', 'elapsed': 5},
+        {'seq': 3, 'stage': 'reading', 'elapsed': -1},
+    ]
+
+    updates, seq = ReadingFlowService.fold_stage_events(events, last_seq=0)
+
+    assert updates == {'post_reading_time': 20, 'current_stage': 'completed'}
+    assert seq == 1
+
+
+def test_fold_stage_events_returns_no_updates_for_replayed_batch():
+    updates, seq = ReadingFlowService.fold_stage_events(
+        [{'seq': 7, 'stage': 'reading', 'elapsed': 10}], last_seq=7
+    )
+
+    assert updates == {}
+    assert seq == 7
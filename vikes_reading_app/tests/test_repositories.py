@@ -1,5 +1,8 @@
+import io
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from vikes_reading_app.models import Story, PreReadingExercise, PostReadingQuestion
 from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
 
@@ -83,4 +86,87 @@ def test_edit_story(teacher_user):
     assert db_story.title == "Updated Title"
     assert db_story.description == "Updated description"
     assert db_story.content == "Updated content"
-    assert db_story.status == "published"
\ No newline at end of file
+    assert db_story.status == "published"
+
+
+@pytest.mark.django_db
+def test_create_and_edit_story_store_text_profile(teacher_user):
+    repo = ORMStoryRepository()
+    story = repo.create_story(teacher_user.id, {
+        "title": "Short",
+        "description": "Simple",
+        "content": "The dog ran. The dog sat.",
+        "status": "published",
+    })
+
+    assert story.word_count == 6
+    assert story.sentence_count == 2
+    assert story.level == "beginner"
+
+    repo.edit_story(story.id, {"content": ""})
+
+    db_story = Story.objects.get(id=story.id)
+    assert db_story.word_count == 0
+    assert db_story.level == ""
+
+
+@pytest.mark.django_db
+def test_list_home_stories_filters_and_sorts_by_text_profile(teacher_user, student_user):
+    repo = ORMStoryRepository()
+    easy = repo.create_story(teacher_user.id, {
+        "title": "Easy", "description": "d", "content": "I see a cat.", "status": "published",
+    })
+    hard = repo.create_story(teacher_user.id, {
+        "title": "Hard", "description": "d", "status": "published",
+        "content": "Institutional considerations necessitate comprehensive organizational evaluation.",
+    })
+
+    assert list(repo.list_home_stories(student_user, level="beginner")) == [easy]
+    assert list(repo.list_home_stories(student_user, sort="hardest")) == [hard, easy]
+
+
+
+@pytest.mark.django_db
+def test_question_counts_follow_repository_writes(published_story, two_pre_reading_exercises, post_reading_question):
+    repo = ORMStoryRepository()
+    assert (published_story.pre_reading_count, published_story.post_reading_count) == (2, 1)
+
+    repo.delete_pre_reading_exercise(two_pre_reading_exercises[0])
+    repo.delete_post_reading_question(post_reading_question)
+
+    story = Story.objects.get(id=published_story.id)
+    assert (story.pre_reading_count, story.post_reading_count) == (1, 0)
+    assert repo.count_pre_reading_exercises(story) == 1
+
+
+@pytest.mark.django_db
+def test_recount_command_repairs_drifted_counts(published_story, draft_story, two_pre_reading_exercises):
+    # Rows added behind the repository's back (admin, raw SQL) leave the count stale
+    PostReadingQuestion.objects.create(
+        story=published_story, question_text='Q?', option_1='a', option_2='b', option_3='c', option_4='d',
+        correct_option=1,
+    )
+    Story.objects.filter(id=draft_story.id).update(pre_reading_count=7)
+
+    out = io.StringIO()
+    call_command('recount_story_questions', stdout=out)
+
+    assert 'Repaired counts on 2 stories.' in out.getvalue()
+    assert list(Story.objects.order_by('id').values_list('pre_reading_count', 'post_reading_count')) == [(2, 1), (0, 0)]
+
+
+@pytest.mark.django_db
+def test_story_rows_are_cached_per_content_version(published_story, two_pre_reading_exercises, django_assert_num_queries):
+    repo = ORMStoryRepository()
+    assert len(repo.list_pre_reading_exercises(published_story)) == 2
+
+    # Another request (no shared identity map) reads the cached rows
+    with django_assert_num_queries(0):
+        exercises = repo.list_pre_reading_exercises(published_story)
+    assert [exercise.id for exercise in exercises] == [exercise.id for exercise in two_pre_reading_exercises]
+    assert exercises[0].story is published_story
+
+    # An edit moves the story to a new content version, so the old entry is never read again
+    repo.update_pre_reading_exercise(two_pre_reading_exercises[0], {'question_text': 'Changed?'})
+    story = Story.objects.get(id=published_story.id)
+    assert repo.list_pre_reading_exercises(story)[0].question_text == 'Changed?'
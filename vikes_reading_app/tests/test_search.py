@@ -0,0 +1,122 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from vikes_reading_app.models import Story
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.repositories.story_search_impl import get_story_search_repository, search_tokens
+from vikes_reading_app.views.search import RESULTS_PER_PAGE
+
+
+pytestmark = pytest.mark.django_db
+
+
+# --- Fixtures ---
+
+@pytest.fixture
+def indexed_stories(teacher_user):
+    """Creates stories through the repository so they are indexed."""
+    repo = ORMStoryRepository()
+    return {
+        'dragon': repo.create_story(teacher_user.id, {
+            'title': 'The Dragon Cave',
+            'description': 'A brave knight',
+            'content': 'Deep in the mountain a dragon slept.',
+            'status': 'published',
+        }),
+        'forest': repo.create_story(teacher_user.id, {
+            'title': 'Forest Walk',
+            'description': 'Trees and birds',
+            'content': 'They talked about a dragon they never saw.',
+            'status': 'published',
+        }),
+        'draft': repo.create_story(teacher_user.id, {
+            'title': 'Dragon Draft',
+            'description': 'Unfinished',
+            'content': 'Work in progress.',
+            'status': 'draft',
+        }),
+    }
+
+
+# ========================
+# 🔎 Search Index
+# ========================
+
+def test_search_tokens_strip_query_syntax():
+    assert search_tokens('dragon* OR "knight" -cave') == ['dragon', 'or', 'knight', 'cave']
+
+
+def test_search_ranks_title_matches_first_and_filters_by_status(indexed_stories):
+    results = get_story_search_repository().search('dragon', status='published')
+
+    assert results.count() == 2
+    assert list(results[0:10]) == [indexed_stories['dragon'], indexed_stories['forest']]
+
+
+def test_search_matches_word_prefixes(indexed_stories):
+    results = get_story_search_repository().search('mount')
+
+    assert list(results[0:10]) == [indexed_stories['dragon']]
+
+
+def test_index_follows_repository_edit_and_delete(indexed_stories):
+    repo = ORMStoryRepository()
+    search_repo = get_story_search_repository()
+    forest = indexed_stories['forest']
+
+    repo.edit_story(forest.id, {'content': 'Only owls live here.'})
+    assert search_repo.search('owls').count() == 1
+    assert forest not in list(search_repo.search('dragon')[0:10])
+
+    repo.delete_story_with_related(forest.id)
+    assert search_repo.search('owls').count() == 0
+
+
+def test_rebuild_search_index_command_indexes_existing_stories(teacher_user):
+    Story.objects.create(title='Unindexed Comet', description='d', content='c', author=teacher_user)
+    assert get_story_search_repository().search('comet').count() == 0
+
+    call_command('rebuild_search_index')
+
+    assert get_story_search_repository().search('comet').count() == 1
+
+
+# ========================
+# 🌐 Search View
+# ========================
+
+def test_student_search_view_hides_drafts(logged_in_client_student, indexed_stories):
+    response = logged_in_client_student.get(reverse('story_search'), {'q': 'dragon'})
+
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert 'The Dragon Cave' in content
+    assert 'Dragon Draft' not in content
+    assert reverse('story_entry_point', args=[indexed_stories['dragon'].id]) in content
+
+
+def test_teacher_search_view_includes_drafts(logged_in_client_teacher, indexed_stories):
+    response = logged_in_client_teacher.get(reverse('story_search'), {'q': 'dragon', 'mine': '1'})
+
+    assert response.status_code == 200
+    assert response.context['page'].paginator.count == 3
+    assert 'Dragon Draft' in response.content.decode()
+
+
+def test_search_view_paginates(logged_in_client_teacher, teacher_user):
+    repo = ORMStoryRepository()
+    titles = [f'Dragon Tale {number:02d}' for number in range(RESULTS_PER_PAGE + 3)]
+    for title in titles:
+        repo.create_story(teacher_user.id, {
+            'title': title, 'description': 'Dragons', 'content': 'A dragon story.', 'status': 'published',
+        })
+
+    first = logged_in_client_teacher.get(reverse('story_search'), {'q': 'dragon'}).context['page']
+    second = logged_in_client_teacher.get(reverse('story_search'), {'q': 'dragon', 'page': '2'}).context['page']
+
+    assert (len(first.object_list), first.has_next()) == (RESULTS_PER_PAGE, True)
+    assert (second.number, len(second.object_list), second.has_next()) == (2, 3, False)
+    # Every story shows up exactly once across the two pages
+    shown = [story.title for story in [*first.object_list, *second.object_list]]
+    assert sorted(shown) == titles
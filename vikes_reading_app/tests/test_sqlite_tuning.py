@@ -0,0 +1,56 @@
+import pytest
+from django.conf import settings
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+from vikes_reading_app.models import Progress
+from vikes_reading_app.repositories.progress_repository_impl import ORMProgressRepository
+from vikes_reading_app.services.reading_flow import ReadingFlowService
+
+
+# --- Helpers ---
+
+def _tuned_connection(path):
+    return DatabaseWrapper({
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': str(path),
+        'OPTIONS': dict(settings.SQLITE_TUNED_OPTIONS),
+        'TIME_ZONE': None,
+        'CONN_MAX_AGE': 0,
+        'CONN_HEALTH_CHECKS': False,
+        'AUTOCOMMIT': True,
+        'ATOMIC_REQUESTS': False,
+    }, alias='tuned')
+
+
+# ========================
+# 🗄️ SQLite Tuning
+# ========================
+
+def test_tuned_options_apply_pragmas_on_connect(tmp_path, django_db_blocker):
+    connection = _tuned_connection(tmp_path / 'tuned.sqlite3')
+    with django_db_blocker.unblock():
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            assert cursor.fetchone()[0] == 'wal'
+            cursor.execute('PRAGMA synchronous')
+            assert cursor.fetchone()[0] == 1  # NORMAL
+            cursor.execute('PRAGMA busy_timeout')
+            assert cursor.fetchone()[0] == settings.SQLITE_TUNED_OPTIONS['timeout'] * 1000
+        assert connection.transaction_mode == 'IMMEDIATE'
+        connection.close()
+
+
+@pytest.mark.django_db
+def test_update_progress_creates_and_mutates_in_one_write(student_user, published_story):
+    repo = ORMProgressRepository()
+
+    repo.update_progress(student_user, published_story, lambda progress: setattr(progress, 'current_stage', 'reading'))
+    progress = repo.update_progress(
+        student_user, published_story,
+        lambda progress: ReadingFlowService.set_pre_reading_answer(progress, 1, 'a'),
+    )
+
+    stored = Progress.objects.get(student=student_user, read_story=published_story)
+    assert stored.pk == progress.pk
+    assert stored.current_stage == 'reading'
+    assert stored.answers_given['pre_reading'] == {'1': 'a'}
@@ -0,0 +1,73 @@
+import io
+import os
+import subprocess
+import sys
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.management import call_command
+from django.urls import resolve, reverse
+
+from vikes_reading_app.lazy_views import lazy_view
+from vikes_reading_app.management.commands.profile_imports import by_package, parse_importtime
+from vikes_reading_app.views.pre_reading import pre_reading_submit_async
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   django.utils.version
+import time:      1500 |       1620 | django
+some warning printed by a module
+import time:       300 |        300 | vikes_reading_app.views
+"""
+
+
+# ========================
+# ⏱️ Import-Time Profiling
+# ========================
+
+def test_parse_importtime_reads_module_rows():
+    rows = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert rows == [
+        ('django.utils.version', 120, 120),
+        ('django', 1500, 1620),
+        ('vikes_reading_app.views', 300, 300),
+    ]
+    assert by_package(rows) == [('django', 1620), ('vikes_reading_app', 300)]
+
+
+def test_profile_imports_command_prints_a_digest():
+    out = io.StringIO()
+    call_command('profile_imports', target='setup', limit=3, stdout=out)
+
+    output = out.getvalue()
+    assert output.startswith('Cold start (setup): ')
+    assert 'By package (self time):' in output
+    assert 'django' in output
+
+
+# ========================
+# 💤 Lazy View Imports
+# ========================
+
+def test_loading_the_urlconf_imports_no_view_modules():
+    code = (
+        "import sys, django; django.setup();"
+        "from django.urls import get_resolver; get_resolver().url_patterns;"
+        "print(sorted(name for name in sys.modules if name.startswith('vikes_reading_app.views.')))"
+    )
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': 'vikes_project.settings'}
+    result = subprocess.run([sys.executable, '-c', code], cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == '[]'
+
+
+def test_lazy_views_keep_the_views_sync_or_async_kind():
+    submit = resolve(reverse('pre_reading_submit', args=[1])).func
+    async_submit = lazy_view('pre_reading.pre_reading_submit_async', is_async=True)
+
+    assert submit.__name__ == 'pre_reading_submit'
+    assert not iscoroutinefunction(submit)
+    assert iscoroutinefunction(async_submit)
+    assert async_submit.load() is pre_reading_submit_async
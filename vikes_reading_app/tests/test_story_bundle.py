@@ -0,0 +1,150 @@
+import io
+import json
+import zipfile
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+
+from vikes_reading_app.models import PostReadingQuestion, PreReadingExercise, Story
+from vikes_reading_app.repositories.story_search_impl import get_story_search_repository
+from vikes_reading_app.services.story_bundle import StoryBundleError, StoryBundleService
+
+
+pytestmark = pytest.mark.django_db
+
+
+# --- Helpers ---
+
+def _manifest(**overrides):
+    manifest = {
+        'format': StoryBundleService.FORMAT,
+        'version': StoryBundleService.VERSION,
+        'story': {
+            'title': 'Bundled Lighthouse',
+            'description': 'A keeper and a storm',
+            'content': '<p>The keeper lit the lamp. The storm came.</p>',
+            'status': 'published',
+        },
+        'pre_reading_exercises': [
+            {'question_text': 'Lamp?', 'option_1': 'Light', 'option_2': 'Dark', 'is_option_1_correct': True},
+        ],
+        'post_reading_questions': [
+            {
+                'question_text': f'Question {number}?',
+                'option_1': 'A', 'option_2': 'B', 'option_3': 'C', 'option_4': 'D',
+                'correct_option': 3, 'explanation': 'C it is.',
+            }
+            for number in range(30)
+        ],
+    }
+    manifest.update(overrides)
+    return manifest
+
+
+def _upload(manifest, name='bundle.json'):
+    return SimpleUploadedFile(name, json.dumps(manifest).encode(), content_type='application/json')
+
+
+# ========================
+# 📦 Story Bundles
+# ========================
+
+def test_export_then_import_round_trips_story_questions_and_audio(logged_in_client_teacher, published_story, post_reading_question):
+    PreReadingExercise.objects.create(
+        story=published_story,
+        question_text='Hear it?',
+        option_1='Yes',
+        option_2='No',
+        is_option_1_correct=True,
+        audio_file=SimpleUploadedFile('hear.mp3', b'ID3-audio', content_type='audio/mpeg'),
+    )
+
+    export = logged_in_client_teacher.get(reverse('story_export', args=[published_story.id]))
+
+    assert export.status_code == 200
+    assert export['Content-Disposition'] == 'attachment; filename="published-story.zip"'
+    with zipfile.ZipFile(io.BytesIO(export.content)) as archive:
+        manifest = json.loads(archive.read('story.json'))
+        assert archive.read(manifest['pre_reading_exercises'][0]['audio_file']) == b'ID3-audio'
+
+    response = logged_in_client_teacher.post(reverse('story_import'), {
+        'bundle': SimpleUploadedFile('published-story.zip', export.content, content_type='application/zip'),
+    })
+
+    assert response.status_code == 302
+    copy = Story.objects.exclude(pk=published_story.pk).get()
+    assert copy.title == published_story.title
+    assert copy.word_count > 0
+    exercise = copy.pre_reading_exercises.get()
+    assert exercise.audio_file.read() == b'ID3-audio'
+    question = copy.post_reading_questions.get()
+    assert question.correct_option == post_reading_question.correct_option
+    assert question.explanation == post_reading_question.explanation
+
+
+def test_import_json_bundle_uses_one_insert_per_table(logged_in_client_teacher, teacher_user, django_assert_max_num_queries):
+    with django_assert_max_num_queries(25):
+        response = logged_in_client_teacher.post(reverse('story_import'), {'bundle': _upload(_manifest())})
+
+    assert response.status_code == 302
+    story = Story.objects.get(title='Bundled Lighthouse')
+    assert story.author == teacher_user
+    assert PostReadingQuestion.objects.filter(story=story).count() == 30
+    assert [result.id for result in get_story_search_repository().search('lighthouse')] == [story.id]
+
+
+def test_import_rejects_invalid_bundle_and_creates_nothing(logged_in_client_teacher):
+    bad = _manifest(pre_reading_exercises=[
+        {'question_text': 'Both?', 'option_1': 'A', 'option_2': 'B',
+         'is_option_1_correct': True, 'is_option_2_correct': True},
+    ])
+
+    response = logged_in_client_teacher.post(reverse('story_import'), {'bundle': _upload(bad)})
+
+    assert response.status_code == 200
+    assert 'Pre-reading exercise 1' in response.content.decode()
+    assert not Story.objects.exists()
+
+
+def test_read_bundle_reports_missing_audio_entries():
+    manifest = _manifest(story={**_manifest()['story'], 'narration_audio': 'audio/story/0_missing.mp3'})
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('story.json', json.dumps(manifest))
+
+    with pytest.raises(StoryBundleError, match='missing audio'):
+        StoryBundleService.read_bundle(buffer)
+
+
+
+def test_import_rejects_json_bundle_that_names_audio(logged_in_client_teacher):
+    exercise = {**_manifest()['pre_reading_exercises'][0], 'audio_file': 'audio/pre_reading/0_lamp.mp3'}
+
+    response = logged_in_client_teacher.post(
+        reverse('story_import'), {'bundle': _upload(_manifest(pre_reading_exercises=[exercise]))},
+    )
+
+    assert response.status_code == 200
+    assert 'missing audio files: audio/pre_reading/0_lamp.mp3' in response.content.decode()
+    assert not Story.objects.exists()
+
+def test_story_export_is_author_only(client, published_story):
+    other = get_user_model().objects.create_user(username='other', password='pass', role='teacher')
+    client.force_login(other)
+
+    response = client.get(reverse('story_export', args=[published_story.id]))
+
+    assert response.status_code == 403
+
+
+def test_bundle_management_commands_round_trip(tmp_path, teacher_user, published_story, post_reading_question):
+    path = tmp_path / 'story.zip'
+
+    call_command('export_story_bundle', str(published_story.id), str(path))
+    call_command('import_story_bundle', str(path), '--author', teacher_user.username)
+
+    assert Story.objects.filter(title=published_story.title).count() == 2
+    assert PostReadingQuestion.objects.filter(question_text=post_reading_question.question_text).count() == 2
@@ -0,0 +1,123 @@
+import io
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+
+from vikes_reading_app.services import student_import
+from vikes_reading_app.services.student_import import StudentImportService
+
+
+pytestmark = pytest.mark.django_db
+
+User = get_user_model()
+
+CSV = (
+    "username,password,first_name,email\n"
+    "ada,Lovelace-1815,Ada,ada@example.com\n"
+    "grace,Hopper-1906,Grace,\n"
+    "ada,Another-Pass-9,,\n"
+    "bad name!,Strong-Pass-1,,\n"
+    "linus,123,,\n"
+    "student,Taken-Name-7,,\n"
+)
+
+
+@pytest.fixture
+def fast_hasher(settings):
+    """PBKDF2 is deliberately slow; tests only care that a hash is stored."""
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+# ========================
+# 👥 Bulk Student Import
+# ========================
+
+def test_import_csv_creates_valid_rows_and_reports_the_rest(fast_hasher, student_user):
+    result = StudentImportService.import_csv(io.StringIO(CSV), batch_size=2, workers=0)
+
+    assert result.created == 2
+    ada = User.objects.get(username='ada')
+    assert ada.role == 'student'
+    assert ada.first_name == 'Ada'
+    assert ada.check_password('Lovelace-1815')
+    assert {(error.line, error.username) for error in result.errors} == {
+        (4, 'ada'), (5, 'bad name!'), (6, 'linus'), (7, 'student'),
+    }
+    assert [error.line for error in result.errors] == [4, 5, 6, 7]
+
+
+def test_import_csv_hashes_in_worker_processes(fast_hasher):
+    rows = "".join(f"pupil{number},Reading-Pass-{number}\n" for number in range(6))
+
+    result = StudentImportService.import_csv(io.StringIO("username,password\n" + rows), workers=2)
+
+    assert result.created == 6
+    assert User.objects.get(username='pupil5').check_password('Reading-Pass-5')
+
+
+def test_import_csv_reports_names_taken_during_the_import(fast_hasher, monkeypatch, student_user):
+    # As if 'student' signed up between the username check and the insert
+    monkeypatch.setattr(StudentImportService.user_repo, 'existing_usernames', lambda usernames: set())
+    csv_text = "username,password\nnoor,Reading-Pass-1\nstudent,Reading-Pass-2\nomar,Reading-Pass-3\n"
+
+    result = StudentImportService.import_csv(io.StringIO(csv_text))
+
+    assert result.created == 2
+    assert [(error.line, error.messages) for error in result.errors] == [(3, [StudentImportService.USERNAME_TAKEN])]
+    assert set(User.objects.filter(role='student').values_list('username', flat=True)) == {'noor', 'omar', 'student'}
+
+
+def test_import_csv_stops_after_max_rows(fast_hasher):
+    rows = "".join(f"pupil{number},Reading-Pass-{number}\n" for number in range(4))
+
+    result = StudentImportService.import_csv(io.StringIO("username,password\n" + rows), max_rows=2)
+
+    assert result.created == 2
+    assert [error.line for error in result.errors] == [4]
+
+
+def test_import_csv_reports_missing_columns():
+    result = StudentImportService.import_csv(io.StringIO("name,secret\nx,y\n"), workers=0)
+
+    assert result.created == 0
+    assert result.errors[0].messages == ["Missing column(s): username, password."]
+
+
+def test_import_students_view_is_teacher_only_and_shows_report(fast_hasher, monkeypatch, logged_in_client_teacher, client, student_user):
+    upload = SimpleUploadedFile('students.csv', ("﻿" + CSV).encode('utf-8'), content_type='text/csv')
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("the web import forked a process pool")
+    monkeypatch.setattr(student_import, 'ProcessPoolExecutor', no_pool)
+
+    response = logged_in_client_teacher.post(reverse('import_students'), {'csv_file': upload})
+
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert '2 created, 4 skipped.' in content
+    assert 'A user with that username already exists.' in content
+
+    client.force_login(student_user)
+    assert client.get(reverse('import_students')).status_code == 302
+
+
+
+def test_import_students_view_caps_rows_per_upload(fast_hasher, monkeypatch, logged_in_client_teacher):
+    monkeypatch.setattr(StudentImportService, 'WEB_MAX_ROWS', 1)
+    upload = SimpleUploadedFile('students.csv', CSV.encode('utf-8'), content_type='text/csv')
+
+    response = logged_in_client_teacher.post(reverse('import_students'), {'csv_file': upload})
+
+    assert 'Up to 1 students per upload.' in response.content.decode()
+    assert list(User.objects.filter(role='student').values_list('username', flat=True)) == ['ada']
+
+def test_import_students_command(fast_hasher, tmp_path):
+    path = tmp_path / 'students.csv'
+    path.write_text("username,password\nmaria,Montessori-1870\n")
+
+    call_command('import_students', str(path), '--workers', '0')
+
+    assert User.objects.filter(username='maria', role='student').exists()
@@ -0,0 +1,61 @@
+from importlib import import_module
+
+import pytest
+
+from vikes_reading_app.services.text_analysis import TextAnalysisService
+
+
+# ========================
+# 📏 Text Profile
+# ========================
+
+def test_analyze_counts_words_and_sentences_across_html_blocks():
+    profile = TextAnalysisService.analyze('<p>The cat sat on the mat.</p><p>It was happy!</p>')
+
+    assert profile['word_count'] == 9
+    assert profile['sentence_count'] == 2
+    assert profile['level'] == 'beginner'
+    assert profile['reading_time_seconds'] == 4
+    assert profile['vocabulary_profile']['top'][0] == ('cat', 1)
+
+
+def test_analyze_rates_long_academic_sentences_as_advanced():
+    profile = TextAnalysisService.analyze(
+        'Notwithstanding considerable institutional ambiguity, the administration '
+        'nevertheless implemented comprehensive organizational restructuring initiatives.'
+    )
+
+    assert profile['flesch_kincaid_grade'] > 12
+    assert profile['flesch_reading_ease'] < 30
+    assert profile['level'] == 'advanced'
+    assert profile['vocabulary_profile']['long'] > 0.5
+
+
+def test_analyze_empty_content_has_no_level():
+    profile = TextAnalysisService.analyze('')
+
+    assert profile['word_count'] == 0
+    assert profile['level'] == ''
+    assert profile['flesch_kincaid_grade'] is None
+
+
+@pytest.mark.parametrize('grade, level', [
+    (0.0, 'beginner'),
+    (3.0, 'beginner'),
+    (5.5, 'elementary'),
+    (8.9, 'intermediate'),
+    (14.0, 'advanced'),
+])
+def test_level_for_grade_bands(grade, level):
+    assert TextAnalysisService.level_for_grade(grade) == level
+
+
+# 🧪 Migration 0020 backfills with its own copy of the analysis, frozen at the time it was written
+def test_text_profile_migration_analyzes_without_the_service():
+    migration = import_module('vikes_reading_app.migrations.0020_story_text_profile')
+
+    profile = migration._analyze('<p>The cat sat on the mat.</p><p>It was happy!</p>')
+
+    assert (profile['word_count'], profile['sentence_count'], profile['level']) == (9, 2, 'beginner')
+    assert profile['vocabulary_profile']['top'][0] == ('cat', 1)
+    assert sorted(migration._analyze('')) == sorted(migration.PROFILE_FIELDS)
@@ -1,11 +1,13 @@
 # --- Imports and User Model Setup ---
 
 import copy
+import json
 import pytest
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 
-from vikes_reading_app.models import Story, PreReadingExercise, PostReadingQuestion, Progress
+from vikes_reading_app.models import ClassGroup, Story, PreReadingExercise, PostReadingQuestion, PostReadingLookup, Progress, StoryReadingStats
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
 
 User = get_user_model()
 
@@ -219,8 +221,10 @@ def test_student_cannot_access_draft_story_via_student_routes(logged_in_client_s
 
 # ✅ Teacher sees students and their read stories on profile page
 @pytest.mark.django_db
-def test_teacher_profile_shows_students_with_stories(logged_in_client_teacher, published_story):
+def test_teacher_profile_shows_students_with_stories(logged_in_client_teacher, teacher_user, published_story):
     student = User.objects.create_user(username='student1', password='pass123', role='student')
+    ClassGroup.objects.create(teacher=teacher_user, name='Class 1').students.add(student)
+    User.objects.create_user(username='other_class_student', password='pass123', role='student')
     
     Progress.objects.create(
         student=student,
@@ -236,6 +240,7 @@ def test_teacher_profile_shows_students_with_stories(logged_in_client_teacher, p
     content = response.content.decode()
     assert 'student1' in content
     assert 'Published Story' in content
+    assert 'other_class_student' not in content
 
 # ========================
 # 🧠 Student Pre-Reading Flow
@@ -249,6 +254,28 @@ def test_student_redirected_to_pre_reading_if_no_progress(published_story, logge
     assert response.status_code == 302
     assert reverse('pre_reading_read', args=[published_story.id]) in response.url
 
+# 🔢 Entry point decides from one progress/count snapshot, then loads only the answer key
+@pytest.mark.django_db
+def test_entry_point_summary_reads_progress_and_counts_together(
+    published_story, logged_in_client_student, student_user, two_pre_reading_exercises, post_reading_question,
+    django_assert_max_num_queries,
+):
+    ex1, ex2 = two_pre_reading_exercises
+    Progress.objects.create(
+        student=student_user,
+        read_story=published_story,
+        current_stage='reading',
+        answers_given={'pre_reading': {str(ex1.id): ex1.option_1, str(ex2.id): ex1.option_1}, 'post_reading': {}},
+    )
+
+    # Session, user and story (access decorator), snapshot, answer key
+    with django_assert_max_num_queries(5):
+        response = logged_in_client_student.get(reverse('story_entry_point', args=[published_story.id]))
+
+    assert response.status_code == 200
+    assert response.context['pre_correct_answers'] == 1
+    assert response.context['pre_total_questions'] == 2
+
 # ✅ Student is redirected to summary if all pre-reading questions are done
 @pytest.mark.django_db
 def test_student_redirected_to_summary_after_finishing_all_pre_reading(
@@ -347,8 +374,9 @@ def test_student_homepage_visibility(logged_in_client_student, published_story,
     ('logged_in_client_student', [302, 403], False),
     ('logged_in_client_teacher', 200, True),
 ])
-def test_profile_detail_view_permissions(request, client_fixture, expected_status, should_see_name):
+def test_profile_detail_view_permissions(request, teacher_user, client_fixture, expected_status, should_see_name):
     target_user = User.objects.create_user(username='student_target', password='pass', role='student')
+    ClassGroup.objects.create(teacher=teacher_user, name='Class 1').students.add(target_user)
     client = request.getfixturevalue(client_fixture)
     url = reverse('profile_detail', args=[target_user.id])
     response = client.get(url)
@@ -360,24 +388,34 @@ def test_profile_detail_view_permissions(request, client_fixture, expected_statu
         assert target_user.username not in content
 
 
+# 🏫 Teachers only see students in their own class groups
 @pytest.mark.django_db
-def test_profile_detail_shows_dynamic_scores_and_times_for_teacher(logged_in_client_teacher, student_user, published_story):
-    exercise_1 = PreReadingExercise.objects.create(
-        story=published_story,
+def test_profile_detail_is_scoped_to_teacher_class_groups(logged_in_client_teacher, student_user):
+    other_teacher = User.objects.create_user(username='other_teacher', password='pass', role='teacher')
+    ClassGroup.objects.create(teacher=other_teacher, name='Their Class').students.add(student_user)
+
+    response = logged_in_client_teacher.get(reverse('profile_detail', args=[student_user.id]))
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_profile_detail_shows_dynamic_scores_and_times_for_teacher(logged_in_client_teacher, class_group, student_user, published_story):
+    # Through the repository so the story's exercise/question counts follow
+    story_repo = ORMStoryRepository()
+    exercise_1 = story_repo.create_pre_reading_exercise(published_story, dict(
         question_text='Pre 1?',
         option_1='Luck',
         option_2='Duck',
         is_option_1_correct=True,
-    )
-    exercise_2 = PreReadingExercise.objects.create(
-        story=published_story,
+    ))
+    exercise_2 = story_repo.create_pre_reading_exercise(published_story, dict(
         question_text='Pre 2?',
         option_1='Sun',
         option_2='Moon',
         is_option_2_correct=True,
-    )
-    question_1 = PostReadingQuestion.objects.create(
-        story=published_story,
+    ))
+    question_1 = story_repo.create_post_reading_question(published_story, dict(
         question_text='Post 1?',
         option_1='One',
         option_2='Two',
@@ -385,9 +423,8 @@ def test_profile_detail_shows_dynamic_scores_and_times_for_teacher(logged_in_cli
         option_4='Four',
         correct_option=2,
         explanation='Two is correct.',
-    )
-    question_2 = PostReadingQuestion.objects.create(
-        story=published_story,
+    ))
+    question_2 = story_repo.create_post_reading_question(published_story, dict(
         question_text='Post 2?',
         option_1='Red',
         option_2='Blue',
@@ -395,7 +432,7 @@ def test_profile_detail_shows_dynamic_scores_and_times_for_teacher(logged_in_cli
         option_4='Yellow',
         correct_option=4,
         explanation='Yellow is correct.',
-    )
+    ))
     Progress.objects.create(
         student=student_user,
         read_story=published_story,
@@ -550,3 +587,108 @@ def test_post_reading_summary_shows_no_answer_when_missing(
     content = response.content.decode()
     assert '(No answer)' in content
     assert '❌' in content
+
+
+# ========================
+# ⏱ Stage Telemetry Endpoint
+# ========================
+
+@pytest.mark.django_db
+def test_stage_telemetry_folds_json_batch_into_progress(logged_in_client_student, student_user, published_story):
+    url = reverse('stage_telemetry', args=[published_story.id])
+    batch = {'events': [
+        {'seq': 100, 'stage': 'reading', 'elapsed': 15},
+        {'seq': 101, 'stage': 'reading', 'elapsed': 30, 'final': True},
+    ]}
+
+    response = logged_in_client_student.post(url, data=json.dumps(batch), content_type='application/json')
+
+    assert response.status_code == 200
+    assert response.json()['applied'] is True
+    progress = Progress.objects.get(student=student_user, read_story=published_story)
+    assert progress.reading_time == 30
+    assert progress.current_stage == 'reading'
+    assert progress.telemetry_seq == 101
+
+
+@pytest.mark.django_db
+def test_stage_telemetry_accepts_beacon_form_batch_and_deduplicates(logged_in_client_student, student_user, published_story):
+    url = reverse('stage_telemetry', args=[published_story.id])
+    batch = json.dumps({'events': [{'seq': 200, 'stage': 'reading', 'elapsed': 45}]})
+
+    logged_in_client_student.post(url, {'batch': batch})
+    replay = logged_in_client_student.post(url, {'batch': batch})
+
+    assert replay.status_code == 200
+    assert replay.json()['applied'] is False
+    progress = Progress.objects.get(student=student_user, read_story=published_story)
+    assert progress.reading_time == 45
+    assert progress.telemetry_seq == 200
+
+
+@pytest.mark.django_db
+def test_stage_telemetry_rejects_malformed_batch(logged_in_client_student, published_story):
+    url = reverse('stage_telemetry', args=[published_story.id])
+
+    response = logged_in_client_student.post(url, {'batch': 'not json'})
+
+    assert response.status_code == 400
+    assert not Progress.objects.exists()
+
+
+@pytest.mark.django_db
+def test_story_lookup_counts_are_limited_and_cleared_by_reset(
+    logged_in_client_student, student_user, published_story, post_reading_question
+):
+    url = reverse('story_lookup', args=[published_story.id])
+    for _ in range(3):
+        assert logged_in_client_student.get(url, {'question_id': post_reading_question.id}).status_code == 200
+
+    blocked = logged_in_client_student.get(url, {'question_id': post_reading_question.id})
+    assert blocked.status_code == 302
+    lookup = PostReadingLookup.objects.get(student=student_user, question=post_reading_question)
+    assert lookup.lookup_count == 3
+
+    logged_in_client_student.post(reverse('reset_progress', args=[published_story.id]))
+
+    assert not PostReadingLookup.objects.filter(student=student_user).exists()
+
+
+@pytest.mark.django_db
+def test_start_lookup_redirects_without_counting(logged_in_client_student, published_story, post_reading_question):
+    response = logged_in_client_student.post(
+        reverse('start_lookup', args=[published_story.id, post_reading_question.id])
+    )
+
+    assert response.status_code == 302
+    assert f'question_id={post_reading_question.id}' in response.url
+    assert not PostReadingLookup.objects.exists()
+
+
+@pytest.mark.django_db
+def test_home_filters_stories_by_level(client, teacher_user):
+    Story.objects.create(title='Leveled Story', description='d', content='c', author=teacher_user,
+                         status='published', level='beginner')
+    Story.objects.create(title='Other Story', description='d', content='c', author=teacher_user,
+                         status='published', level='advanced')
+
+    response = client.get(reverse('home'), {'level': 'beginner'})
+
+    content = response.content.decode()
+    assert 'Leveled Story' in content
+    assert 'Other Story' not in content
+
+
+@pytest.mark.django_db
+def test_profile_detail_flags_reading_time_against_class_baseline(logged_in_client_teacher, class_group, student_user, published_story):
+    stats = StoryReadingStats(story=published_story)
+    for sample in [100, 110, 120, 130, 140]:
+        stats.add_sample(sample)
+    stats.save()
+    Progress.objects.create(student=student_user, read_story=published_story, reading_time=10)
+
+    response = logged_in_client_teacher.get(reverse('profile_detail', args=[student_user.id]))
+
+    content = response.content.decode()
+    assert 'Skimmed?' in content
+    assert 'Class avg: 120s' in content
@@ -0,0 +1,90 @@
+import logging
+
+import pytest
+from django.core.cache import cache
+from django.template import engines
+
+from vikes_reading_app import warmup
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.warmup import app_template_names, warm_templates, warm_up, warm_urls
+
+
+# --- Helpers ---
+
+def _cached_loader():
+    return engines['django'].engine.template_loaders[0]
+
+
+# ========================
+# 🔥 Template Warm-Up
+# ========================
+
+def test_templates_are_found_through_one_cached_search_path():
+    engine = engines['django'].engine
+
+    assert engine.dirs == []
+    assert [type(loader).__name__ for loader in _cached_loader().loaders] == ['Loader']
+    assert _cached_loader().__module__ == 'django.template.loaders.cached'
+
+
+def test_warm_templates_compiles_every_app_template():
+    loader = _cached_loader()
+    loader.reset()
+    names = app_template_names()
+
+    assert 'vikes_reading_app/base.html' in names
+    assert 'vikes_reading_app/auth/login.html' in names
+    assert warm_templates() == len(names)
+    assert set(names) <= set(loader.get_template_cache)
+
+
+# ========================
+# 🚀 Worker Warm-Up Steps
+# ========================
+
+def test_warm_urls_reverses_every_named_route():
+    # Includes the routes that take a story, question or student id
+    assert warm_urls() >= 40
+
+
+@pytest.mark.django_db
+def test_warm_up_runs_each_step_and_logs_its_time(caplog, published_story, two_pre_reading_exercises):
+    with caplog.at_level(logging.INFO, logger='vikes_reading_app.warmup'):
+        warm_up(['urls', 'templates', 'database', 'story_cache'])
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(message.startswith('Compiled ') and message.endswith(' ms') for message in messages)
+    assert 'Cached exercises and questions for 1 stories' in ' '.join(messages)
+    assert messages[-1].startswith('Worker warm-up finished in ')
+    key = ORMStoryRepository.story_rows_key('pre_reading_exercise', published_story.id, published_story.content_version)
+    assert [row.id for row in cache.get(key)] == [exercise.id for exercise in two_pre_reading_exercises]
+
+
+def test_a_failing_step_does_not_stop_the_worker(caplog, monkeypatch):
+    def broken():
+        raise RuntimeError('no database')
+
+    monkeypatch.setitem(warmup.STEPS, 'database', (broken, '%d'))
+
+    with caplog.at_level(logging.INFO, logger='vikes_reading_app.warmup'):
+        warm_up(['database', 'templates'])
+
+    assert 'Warm-up step database failed' in caplog.text
+    assert 'Compiled ' in caplog.text
+
+
+def test_import_time_warm_up_leaves_connections_to_the_worker(monkeypatch, settings):
+    ran, closed = [], []
+    monkeypatch.setitem(warmup.STEPS, 'database', (lambda: ran.append('database') or 1, '%d'))
+    monkeypatch.setitem(warmup.STEPS, 'urls', (lambda: ran.append('urls') or 1, '%d'))
+    monkeypatch.setattr(warmup, 'close_connections', lambda: closed.append(True))
+    settings.WARMUP_STEPS = ['urls', 'database']
+
+    warmup.warm_up_on_import()
+    assert (ran, closed) == (['urls'], [True])
+
+    warmup.warm_up_worker(serves_on_this_thread=False)
+    assert ran == ['urls']
+
+    warmup.warm_up_worker(serves_on_this_thread=True)
+    assert ran == ['urls', 'database']
@@ -0,0 +1,24 @@
+# --- Assignment Views (Teacher) ---
+
+from django.contrib import messages
+from django.shortcuts import redirect, render
+
+from vikes_reading_app.decorators import teacher_is_author
+from vikes_reading_app.forms import AssignmentForm
+from vikes_reading_app.repositories.assignment_repository_impl import ORMAssignmentRepository
+
+
+@teacher_is_author  # Only the author can assign their story
+def assign_story(request, story):
+    """
+    Assigns a story to one of the teacher's classes with a due date.
+    Re-assigning to the same class moves the due date.
+    """
+    form = AssignmentForm(request.POST or None, teacher=request.user, story=story)
+    if request.method == 'POST' and form.is_valid():
+        group = form.cleaned_data['group']
+        ORMAssignmentRepository().assign_story(group, story, form.cleaned_data['due_date'])
+        messages.success(request, f"\"{story.title}\" assigned to {group.name}.")
+        return redirect('class_group_detail', group_id=group.id)
+
+    return render(request, 'vikes_reading_app/assign_story.html', {'form': form, 'story': story})
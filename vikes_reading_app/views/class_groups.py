@@ -0,0 +1,67 @@
+# --- Class Group Views (Teacher) ---
+
+from django.contrib import messages
+from django.db import IntegrityError
+from django.shortcuts import redirect, render
+
+from vikes_reading_app.decorators import teacher_required
+from vikes_reading_app.forms import ClassGroupForm, GroupStudentsForm, RemoveGroupStudentForm
+from vikes_reading_app.repositories.assignment_repository_impl import ORMAssignmentRepository
+from vikes_reading_app.repositories.user_repository_impl import ORMUserRepository
+
+
+@teacher_required
+def class_groups(request):
+    """
+    Lists the teacher's class groups and creates new ones.
+    """
+    repo = ORMUserRepository()
+    form = ClassGroupForm(request.POST or None)
+    if request.method == 'POST' and form.is_valid():
+        try:
+            group = repo.create_group(request.user, form.cleaned_data['name'])
+        except IntegrityError:
+            form.add_error('name', "You already have a class with this name.")
+        else:
+            messages.success(request, f"Class \"{group.name}\" created.")
+            return redirect('class_group_detail', group_id=group.id)
+
+    return render(request, 'vikes_reading_app/class_groups.html', {
+        'groups': repo.list_groups(request.user),
+        'form': form,
+    })
+
+
+@teacher_required
+def class_group_detail(request, group_id):
+    """
+    Shows a class roster and its assignments; POST enrols students by username or removes one student.
+    """
+    repo = ORMUserRepository()
+    group = repo.get_group(group_id, request.user)
+    form = GroupStudentsForm()
+
+    if request.method == 'POST':
+        if 'remove_student' in request.POST:
+            remove_form = RemoveGroupStudentForm(request.POST, group=group)
+            if remove_form.is_valid():
+                repo.remove_student_from_group(group, remove_form.cleaned_data['remove_student'].id)
+                messages.success(request, "Student removed from the class.")
+            else:
+                messages.error(request, "That student is not in this class.")
+            return redirect('class_group_detail', group_id=group.id)
+
+        form = GroupStudentsForm(request.POST)
+        if form.is_valid():
+            added, unknown = repo.add_students_to_group(group, form.cleaned_data['usernames'])
+            messages.success(request, f"Added {added} students to {group.name}.")
+            if unknown:
+                messages.warning(request, f"No student accounts for: {', '.join(unknown)}")
+            return redirect('class_group_detail', group_id=group.id)
+
+    return render(request, 'vikes_reading_app/class_group_detail.html', {
+        'group': group,
+        'students': repo.list_group_students(group),
+        'assignments': ORMAssignmentRepository().list_group_assignments(group),
+        'form': form,
+    })
@@ -1,7 +1,9 @@
 
 # --- Imports ---
 from django.shortcuts import render
-from django.urls import reverse
+from vikes_reading_app.helpers import get_story_url
+from vikes_reading_app.models import LEVEL_CHOICES
+from vikes_reading_app.repositories.assignment_repository_impl import ORMAssignmentRepository
 from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
 
 # --- Home Page View ---
@@ -12,26 +14,26 @@ def home(request):
     - Students and unauthenticated users see only published stories.
     - Teachers see all stories, including drafts.
     Each story gets a role-specific link.
+    Optional `level` and `sort` query parameters filter and order by the story's text profile.
+    Students also get their assignment to-do list, read straight from the precomputed queue.
     """
     repo = ORMStoryRepository()
     user = request.user
-    stories = repo.list_home_stories(user)
-
-    # Generate appropriate story URLs per user role
-    def get_story_url(story):
-        if not user.is_authenticated:
-            # Unauthenticated users are directed to login
-            return reverse('login')
-        if user.role == 'student':
-            # Students go to the student entry point
-            return reverse('story_entry_point', args=[story.id])
-        if user.role == 'teacher':
-            # Teachers go to the teacher reading view
-            return reverse('story_read_teacher', args=[story.id])
-        # Fallback for other roles
-        return "#"
+    level = request.GET.get('level', '')
+    sort = request.GET.get('sort', '')
+    stories = repo.list_home_stories(user, level=level, sort=sort)
 
     # Pair each story with its link
-    story_links = [(story, get_story_url(story)) for story in stories]
+    story_links = [(story, get_story_url(user, story)) for story in stories]
+
+    assignments = None
+    if user.is_authenticated and user.role == 'student':
+        assignments = ORMAssignmentRepository().list_student_queue(user)
 
-    return render(request, 'vikes_reading_app/home.html', {'story_links': story_links})
+    return render(request, 'vikes_reading_app/home.html', {
+        'assignments': assignments,
+        'story_links': story_links,
+        'level_choices': LEVEL_CHOICES,
+        'level': level,
+        'sort': sort,
+    })
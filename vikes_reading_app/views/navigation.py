@@ -10,34 +10,36 @@ from vikes_reading_app.repositories.story_repository_impl import ORMStoryReposit
 
 # --- Constants ---
 LOOKUP_TIME_LIMITS = {1: 30, 2: 45, 3: 60}
+MAX_LOOKUPS = 3
 
 # --- Story Lookup Views ---
 @student_can_view_story
 def story_lookup(request, story):
     """
     Temporarily displays the story text for a post-reading question lookup.
-    Tracks and limits lookup count per question in session.
-    After max lookups, redirects back to the question.
+    Records the lookup in the database; the limit check and the increment
+    happen in one atomic statement. After max lookups, redirects back to the question.
     """
     story_repo = ORMStoryRepository()
+    progress_repo = ORMProgressRepository()
     # Parse and validate question_id from query parameters
     try:
         question_id = int(request.GET.get('question_id'))
     except (TypeError, ValueError):
         messages.error(request, "Invalid question ID.")
         return redirect('post_reading_summary', story_id=story.id)
-    # Track lookup count in session
-    lookup_key = f'lookup_story_{story.id}_q{question_id}'
-    lookup_count = request.session.get(lookup_key, 0)
     # Determine index of the current question for return logic
     questions = story_repo.list_post_reading_questions(story)
-    question_index = next((index for index, q in enumerate(questions) if q.id == question_id), 0)
-    # Enforce a max limit of 3 lookups
-    if lookup_count >= 3:
+    question_index = next((index for index, q in enumerate(questions) if q.id == question_id), None)
+    if question_index is None:
+        messages.error(request, "Invalid question ID.")
+        return redirect('post_reading_summary', story_id=story.id)
+    # Record the lookup, enforcing a max limit of 3
+    lookup_count = progress_repo.record_lookup(request.user, story, question_id, MAX_LOOKUPS)
+    if lookup_count is None:
         # No more lookups allowed; return to question
+        messages.error(request, "No more lookups left for this question.")
         return redirect('post_reading_read', story_id=story.id, question_index=question_index)
-    lookup_count += 1
-    request.session[lookup_key] = lookup_count
     # Compute and apply time limit for the current lookup
     time_limit = LOOKUP_TIME_LIMITS.get(lookup_count, 60)
     return render(request, 'vikes_reading_app/story_lookup.html', {
@@ -52,28 +54,12 @@ def story_lookup(request, story):
 @student_can_view_story
 def start_lookup(request, story, question_id):
     """
-    Handles tracking of post-reading lookups at the DB level (if used).
-    Increments lookup count for a specific question and user.
-    Redirects to the story lookup page with appropriate time limit.
+    Starts a post-reading lookup for a question of this story.
+    The lookup itself is counted by story_lookup, so there is a single counter.
     """
     story_repo = ORMStoryRepository()
-    progress_repo = ORMProgressRepository()
     question = story_repo.get_post_reading_question(question_id, story=story)
-    # Fetch or create progress record for the student
-    progress, _ = progress_repo.get_or_create_progress(request.user, story)
-    # Update and persist lookup count for this question
-    lookups = progress.post_reading_lookups or {}
-    current_count = lookups.get(str(question_id), 0)
-    if current_count >= 3:
-        messages.error(request, "No more lookups left for this question.")
-        return redirect("post_reading_read", story_id=story.id, question_index=0)
-    current_count += 1
-    lookups[str(question_id)] = current_count
-    progress.post_reading_lookups = lookups
-    progress_repo.save_progress(progress)
-    # Compute redirect URL with appropriate time limit
-    time_limit = LOOKUP_TIME_LIMITS.get(current_count, 60)
-    return redirect(f"/story-lookup/{story.id}/?question_id={question_id}&time_limit={time_limit}")
+    return redirect(f"/story-lookup/{story.id}/?question_id={question.id}")
 
 # --- Navigation Redirect View ---
 @require_POST
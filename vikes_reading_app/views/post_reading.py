@@ -30,6 +30,16 @@ def get_option_text(question, option_number):
     }.get(str(option_number))
 
 
+def _redirect_after_post_reading_answer(story, questions, question):
+    """
+    Redirect to the question after `question`, or to the summary after the last one.
+    """
+    for idx, q in enumerate(questions):
+        if q.id == question.id and idx + 1 < len(questions):
+            return redirect("post_reading_read", story_id=story.id, question_index=idx + 1)
+    return redirect("post_reading_summary", story_id=story.id)
+
+
 # --- Teacher CRUD Views ---
 
 
@@ -102,7 +112,7 @@ def post_reading_delete(request, story, question_id):
 def post_reading_read(request, story, question_index=0):
     """
     Handles displaying post-reading questions one by one to the student.
-    Tracks lookup count in session and determines lookup wait time.
+    Reads the lookup count for the question and determines lookup wait time.
     Redirects to summary page when all questions are answered.
     """
     # Get all post-reading questions for this story
@@ -113,9 +123,8 @@ def post_reading_read(request, story, question_index=0):
 
     question = questions[question_index]
 
-    # Track how many times the student has looked up the story for this question (session)
-    lookup_key = f'lookup_story_{story.id}_q{question.id}'
-    lookup_count = request.session.get(lookup_key, 0)
+    # How many times the student has looked up the story for this question
+    lookup_count = ORMProgressRepository().get_lookup_count(request.user, question.id)
 
     # Set time allowed for lookup depending on count
     if lookup_count == 0:
@@ -159,34 +168,60 @@ def post_reading_submit(request, story, question_id):
         # Check if selected answer matches the correct one
         is_correct = str(question.correct_option) == selected_answer_id
 
-        # Get or create progress record for this student and story
-        progress, _ = progress_repo.get_or_create_progress(request.user, story)
-
-        # Save the result of the current question
-        ReadingFlowService.set_post_reading_answer(
-            progress,
-            question.id,
-            selected_answer_id,
-            is_correct,
+        # Save the result of the current question on this student's progress record
+        progress_repo.update_progress(
+            request.user, story,
+            lambda progress: ReadingFlowService.set_post_reading_answer(
+                progress,
+                question.id,
+                selected_answer_id,
+                is_correct,
+            ),
         )
-        progress_repo.save_progress(progress)
 
         # Get all questions again to determine the next one
         questions = get_post_reading_questions(story)
-        next_index = None
-        for idx, q in enumerate(questions):
-            if q.id == question.id and idx + 1 < len(questions):
-                next_index = idx + 1
-                break
-
-        if next_index is not None:
-            return redirect("post_reading_read", story_id=story.id, question_index=next_index)
-        else:
-            return redirect("post_reading_summary", story_id=story.id)
+        return _redirect_after_post_reading_answer(story, questions, question)
 
     return redirect("post_reading_read", story_id=story.id, question_index=question_id)
 
 
+@student_can_view_story
+async def post_reading_submit_async(request, story, question_id):
+    """
+    Async (ASGI) version of post_reading_submit.
+    Same contract, but database round trips go through the async ORM.
+    """
+    story_repo = ORMStoryRepository()
+    progress_repo = ORMProgressRepository()
+    question = await story_repo.aget_post_reading_question(question_id, story=story)
+
+    if request.method != "POST":
+        return redirect("post_reading_read", story_id=story.id, question_index=question_id)
+
+    try:
+        selected_answer_id = str(int(request.POST.get("answer")))
+    except (TypeError, ValueError):
+        messages.error(request, "Invalid answer.")
+        return redirect("post_reading_read", story_id=story.id, question_index=question_id)
+
+    is_correct = str(question.correct_option) == selected_answer_id
+
+    user = await request.auser()
+    await progress_repo.aupdate_progress(
+        user, story,
+        lambda progress: ReadingFlowService.set_post_reading_answer(
+            progress,
+            question.id,
+            selected_answer_id,
+            is_correct,
+        ),
+    )
+
+    questions = await story_repo.alist_post_reading_questions(story)
+    return _redirect_after_post_reading_answer(story, questions, question)
+
+
 @student_can_view_story
 def post_reading_summary(request, story):
     """
@@ -125,11 +125,11 @@ def pre_reading_read(request, story):
     """
     story_repo = ORMStoryRepository()
     progress_repo = ORMProgressRepository()
-    pre_reading_exercises = story_repo.list_pre_reading_exercises(story)
-    if not pre_reading_exercises:
+    if not story.pre_reading_count:
         messages.info(request, "No pre-reading exercises available for this story.")
         return redirect('story_read_student', story_id=story.id)
 
+    pre_reading_exercises = story_repo.list_pre_reading_exercises(story)
     progress = progress_repo.get_progress_model(request.user, story)
     answers = ReadingFlowService.get_pre_reading_answers(progress)
     completed_questions = {int(exercise_id) for exercise_id in answers.keys()}
@@ -149,6 +149,37 @@ def pre_reading_read(request, story):
     return render(request, 'vikes_reading_app/pre_reading_read.html', context)
 
 
+def _grade_pre_reading_answer(exercise, selected_answer):
+    """
+    Returns (is_correct, correct_answer) for a selected pre-reading option.
+    """
+    is_correct = (
+        (selected_answer == exercise.option_1 and exercise.is_option_1_correct) or
+        (selected_answer == exercise.option_2 and exercise.is_option_2_correct)
+    )
+    correct_answer = exercise.option_1 if exercise.is_option_1_correct else exercise.option_2
+    return is_correct, correct_answer
+
+
+def _pre_reading_next_url(story, pre_reading_exercises, progress):
+    """
+    Returns the URL of the next unanswered exercise, or the summary when all are done.
+    """
+    completed_questions = {
+        int(exercise_id) for exercise_id in
+        ReadingFlowService.get_pre_reading_answers(progress).keys()
+    }
+
+    next_question = next(
+        (q for q in pre_reading_exercises if q.id not in completed_questions),
+        None
+    )
+    return (
+        reverse('pre_reading_read', args=[story.id])
+        if next_question else reverse('pre_reading_summary', args=[story.id])
+    )
+
+
 @student_can_view_story
 def pre_reading_submit(request, story):
     """
@@ -168,38 +199,61 @@ def pre_reading_submit(request, story):
         selected_answer = request.POST.get("selected_answer")
         exercise = story_repo.get_pre_reading_exercise(exercise_id)
 
-        if exercise.story != story:
+        if exercise.story_id != story.id:
             return HttpResponseForbidden("Exercise does not belong to this story.")
 
-        is_correct = (
-            (selected_answer == exercise.option_1 and exercise.is_option_1_correct) or
-            (selected_answer == exercise.option_2 and exercise.is_option_2_correct)
-        )
-        correct_answer = exercise.option_1 if exercise.is_option_1_correct else exercise.option_2
-
-        progress, _ = progress_repo.get_or_create_progress(request.user, story)
-        ReadingFlowService.set_pre_reading_answer(progress, exercise.id, selected_answer)
-        progress_repo.save_progress(progress)
+        is_correct, correct_answer = _grade_pre_reading_answer(exercise, selected_answer)
 
-        completed_questions = {
-            int(exercise_id) for exercise_id in
-            ReadingFlowService.get_pre_reading_answers(progress).keys()
-        }
-
-        next_question = next(
-            (q for q in pre_reading_exercises if q.id not in completed_questions),
-            None
-        )
-        next_url = (
-            reverse('pre_reading_read', args=[story.id])
-            if next_question else reverse('pre_reading_summary', args=[story.id])
+        progress = progress_repo.update_progress(
+            request.user, story,
+            lambda progress: ReadingFlowService.set_pre_reading_answer(progress, exercise.id, selected_answer),
         )
 
         return JsonResponse({
             "correct": is_correct,
             "selected_answer": selected_answer,
             "correct_answer": correct_answer,
-            "next_url": next_url
+            "next_url": _pre_reading_next_url(story, pre_reading_exercises, progress)
         })
 
     return redirect('pre_reading_read', story_id=story.id)
+
+
+@student_can_view_story
+async def pre_reading_submit_async(request, story):
+    """
+    Async (ASGI) version of pre_reading_submit.
+    Same contract, but database round trips go through the async ORM.
+    """
+    if request.method != "POST":
+        return redirect('pre_reading_read', story_id=story.id)
+
+    story_repo = ORMStoryRepository()
+    progress_repo = ORMProgressRepository()
+
+    try:
+        exercise_id = int(request.POST.get("exercise_id"))
+    except (TypeError, ValueError):
+        return HttpResponseForbidden("Invalid exercise ID.")
+
+    selected_answer = request.POST.get("selected_answer")
+    exercise = await story_repo.aget_pre_reading_exercise(exercise_id)
+
+    if exercise.story_id != story.id:
+        return HttpResponseForbidden("Exercise does not belong to this story.")
+
+    is_correct, correct_answer = _grade_pre_reading_answer(exercise, selected_answer)
+
+    user = await request.auser()
+    progress = await progress_repo.aupdate_progress(
+        user, story,
+        lambda progress: ReadingFlowService.set_pre_reading_answer(progress, exercise.id, selected_answer),
+    )
+
+    pre_reading_exercises = await story_repo.alist_pre_reading_exercises(story)
+    return JsonResponse({
+        "correct": is_correct,
+        "selected_answer": selected_answer,
+        "correct_answer": correct_answer,
+        "next_url": _pre_reading_next_url(story, pre_reading_exercises, progress)
+    })
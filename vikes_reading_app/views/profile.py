@@ -1,37 +1,42 @@
 # --- Profile Views (Student + Teacher) ---
 
+import io
+
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.shortcuts import redirect, render
 
+from vikes_reading_app.forms import StudentImportForm
 from vikes_reading_app.helpers import is_teacher
+from vikes_reading_app.models import StoryReadingStats
 from vikes_reading_app.repositories.progress_repository_impl import ORMProgressRepository
 from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
 from vikes_reading_app.repositories.user_repository_impl import ORMUserRepository
+from vikes_reading_app.services.reading_flow import ReadingFlowService
+from vikes_reading_app.services.student_import import StudentImportService
 
 
  # --- Helper Function for Teacher View ---
-def get_students_with_stories():
+def get_students_with_stories(teacher):
     """
-    Returns a list of dictionaries containing each student and the titles of stories they've read.
+    Returns a list of dictionaries containing each student in the teacher's class groups
+    and the titles of stories they've read.
     This is used by teachers to view student progress.
     """
     user_repo = ORMUserRepository()
     progress_repo = ORMProgressRepository()
-    students = user_repo.list_students()
-    # Prepare a list to collect each student's data
-    student_data = []
-
-    for student in students:
-        # Get titles of all distinct stories read by this student
-        story_titles = progress_repo.list_story_titles_for_student(student)
-        student_data.append({
-            "student": student,
-            "story_titles": story_titles,
-        })
+    students = list(user_repo.list_students(teacher))
+    # One query for the whole roster rather than one per student
+    titles_by_student = progress_repo.list_story_titles_by_student(students)
 
     # Return the collected student progress data
-    return student_data
+    return [
+        {
+            "student": student,
+            "story_titles": titles_by_student.get(student.id, []),
+        }
+        for student in students
+    ]
 
 
  # --- Profile View (Handles Both Roles) ---
@@ -53,7 +58,7 @@ def profile(request):
 
     # --- Teacher View: Show all students and their progress ---
     if request.user.role == 'teacher':
-        students_with_stories = get_students_with_stories()
+        students_with_stories = get_students_with_stories(request.user)
         return render(request, 'vikes_reading_app/profile.html', {
             'user': request.user,
             'students_with_stories': students_with_stories
@@ -63,31 +68,49 @@ def profile(request):
     return render(request, 'vikes_reading_app/profile.html', {'user': request.user})
 
 
+ # --- Helper Function for Reading Time Baselines ---
+def get_reading_time_baseline(story, reading_time):
+    """
+    Compares a reading time with the class baseline for the story.
+    Returns (flag, class average) where flag is 'skimmed', 'stalled', 'typical' or None.
+    """
+    try:
+        stats = story.reading_stats
+    except StoryReadingStats.DoesNotExist:
+        return None, None
+    average = round(stats.mean) if stats.sample_count else None
+    return stats.classify(reading_time), average
+
+
  # --- Detailed Profile View for Teacher ---
 @user_passes_test(is_teacher)
 @login_required
 def profile_detail(request, student_id):
     """
     View for teachers to inspect detailed progress of a specific student.
-    Shows all story progress only for stories authored by the current teacher.
+    Shows all story progress only for stories authored by the current teacher,
+    and only for students in one of the teacher's class groups.
     """
     # Fetch the targeted student object; ensure they are indeed a student
     user_repo = ORMUserRepository()
     story_repo = ORMStoryRepository()
     progress_repo = ORMProgressRepository()
-    student = user_repo.get_student(student_id)
+    student = user_repo.get_student(student_id, teacher=request.user)
     teacher_stories = story_repo.list_author_stories(request.user)
     progress_records = progress_repo.list_progress_records(student, teacher_stories)
-    story_progress = [
-        {
+    story_progress = []
+    for record in progress_records:
+        ReadingFlowService.unpack_answers(record)
+        reading_flag, class_average = get_reading_time_baseline(record.read_story, record.reading_time)
+        story_progress.append({
             'story': record.read_story,
             'pre_reading': record.get_pre_reading_stats(),
             'reading_time': record.reading_time,
+            'reading_flag': reading_flag,
+            'class_average_reading_time': class_average,
             'post_reading': record.get_post_reading_stats(),
             'overall': record.get_overall_stats(),
-        }
-        for record in progress_records
-    ]
+        })
 
     # Prepare context for rendering detailed progress page
     context = {
@@ -95,3 +118,35 @@ def profile_detail(request, student_id):
         'story_progress': story_progress,
     }
     return render(request, 'vikes_reading_app/profile_detail.html', context)
+
+
+ # --- Bulk Student Import for Teachers ---
+@user_passes_test(is_teacher)
+@login_required
+def import_students(request):
+    """
+    Creates student accounts from an uploaded CSV and reports per-row errors.
+    The file is streamed row by row rather than read into memory.
+    """
+    result = None
+    if request.method == 'POST':
+        form = StudentImportForm(request.POST, request.FILES, teacher=request.user)
+        if form.is_valid():
+            # utf-8-sig drops the BOM spreadsheet apps put at the start of exported CSVs
+            stream = io.TextIOWrapper(form.cleaned_data['csv_file'].file, encoding='utf-8-sig', newline='')
+            try:
+                # Hashed in this thread: a process pool must not be forked from a web worker
+                result = StudentImportService.import_csv(
+                    stream, workers=0, group=form.cleaned_data['group'],
+                    max_rows=StudentImportService.WEB_MAX_ROWS,
+                )
+            except UnicodeDecodeError:
+                form.add_error('csv_file', "The file must be UTF-8 encoded CSV.")
+            else:
+                messages.success(request, f"Created {result.created} student accounts.")
+    else:
+        form = StudentImportForm(teacher=request.user)
+
+    return render(request, 'vikes_reading_app/student_import.html', {
+        'form': form, 'result': result, 'max_rows': StudentImportService.WEB_MAX_ROWS,
+    })
@@ -37,6 +37,30 @@ def _save_time(request, story_id, time_field):
         return JsonResponse({"status": "error", "message": str(e)}, status=400)
 
 
+async def _asave_time(request, story_id, time_field):
+    """
+    Async (ASGI) counterpart of _save_time with the same JSON contract.
+    """
+    if request.method != "POST":
+        return JsonResponse({"status": "error", "message": "Invalid request method"}, status=405)
+    try:
+        story_repo = ORMStoryRepository()
+        progress_repo = ORMProgressRepository()
+        data = json.loads(request.body)
+        time_spent = data.get("time_spent", 0)
+        story = await story_repo.aget_story_by_id(story_id)
+        await progress_repo.asave_time(
+            student=await request.auser(),
+            story=story,
+            time_field=time_field,
+            current_stage=ReadingFlowService.get_next_stage(time_field),
+            time_spent=time_spent,
+        )
+        return JsonResponse({"status": "success", "time_spent": time_spent})
+    except Exception as e:
+        return JsonResponse({"status": "error", "message": str(e)}, status=400)
+
+
 # --- Views for Saving Progress ---
 
 @login_required
@@ -57,14 +81,66 @@ def save_post_reading_time(request, story_id):
     return _save_time(request, story_id, 'post_reading_time')
 
 
+@login_required
+async def save_reading_time_async(request, story_id):
+    """Async API endpoint to save reading time progress."""
+    return await _asave_time(request, story_id, 'reading_time')
+
+
+@login_required
+async def save_pre_reading_time_async(request, story_id):
+    """Async API endpoint to save pre-reading time progress."""
+    return await _asave_time(request, story_id, 'pre_reading_time')
+
+
+@login_required
+async def save_post_reading_time_async(request, story_id):
+    """Async API endpoint to save post-reading time progress."""
+    return await _asave_time(request, story_id, 'post_reading_time')
+
+
+# --- Batched Stage Telemetry ---
+
+@login_required
+def stage_telemetry(request, story_id):
+    """
+    Accepts a batch of stage-timing events (heartbeats and the final event of a stage)
+    and folds them into Progress with one write.
+
+    The batch is either a JSON body or a form-encoded `batch` field, which is what
+    navigator.sendBeacon sends so the CSRF token can travel with it on page unload.
+    Events already applied (by sequence number) are ignored.
+    """
+    if request.method != "POST":
+        return JsonResponse({"status": "error", "message": "Invalid request method"}, status=405)
+    try:
+        if request.content_type == "application/json":
+            payload = json.loads(request.body)
+        else:
+            payload = json.loads(request.POST.get("batch", ""))
+        events = payload.get("events", [])
+        if not isinstance(events, list):
+            raise ValueError("events must be a list")
+
+        story_repo = ORMStoryRepository()
+        progress_repo = ORMProgressRepository()
+        story = story_repo.get_story_by_id(story_id)
+        progress, _ = progress_repo.get_or_create_progress(request.user, story)
+        updates, seq = ReadingFlowService.fold_stage_events(events, progress.telemetry_seq)
+        applied = bool(updates) and progress_repo.apply_stage_timings(progress, updates, seq)
+        return JsonResponse({"status": "success", "applied": applied, "seq": seq})
+    except Exception as e:
+        return JsonResponse({"status": "error", "message": str(e)}, status=400)
+
+
 # --- View for Resetting Progress ---
 
 @login_required
 def reset_progress(request, story_id):
     """
     Resets all progress for the current user and story:
-      - Removes session-based pre/post-reading answers and lookups
-      - Deletes Progress record from DB
+      - Removes session-based pre/post-reading answers
+      - Deletes Progress record and lookup counters from DB
       - Redirects to start pre-reading again
     """
     story_repo = ORMStoryRepository()
@@ -85,12 +161,7 @@ def reset_progress(request, story_id):
         request.session.pop(f'answer_{qid}', None)
     request.session.pop(post_reading_key, None)
 
-    # Remove lookup-related session data for this story
-    keys_to_delete = [key for key in request.session.keys() if key.startswith(f'lookup_story_{story_id}_')]
-    for key in keys_to_delete:
-        del request.session[key]
-
-    # Remove DB-based progress for this user/story
+    # Remove DB-based progress and lookup counters for this user/story
     progress_repo.delete_progress(request.user, story)
 
     # Redirect to start pre-reading again
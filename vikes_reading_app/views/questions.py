@@ -3,9 +3,32 @@ from django.shortcuts import render
 
 # --- App Imports ---
 from vikes_reading_app.decorators import teacher_is_author
+from vikes_reading_app.repositories.question_stats_repository_impl import ORMQuestionStatsRepository
 from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
 
 
+# --- Item Analysis ---
+
+PRE_READING_OPTIONS = ('option_1', 'option_2')
+POST_READING_OPTIONS = ('option_1', 'option_2', 'option_3', 'option_4')
+
+
+def _item_analysis(items, stats, kind, option_fields):
+    """
+    One row per exercise/question: its stats (None until someone answers) and (option text, count) pairs.
+    """
+    rows = []
+    for item in items:
+        item_stats = stats.get((kind, item.id))
+        counts = item_stats.option_counts if item_stats else [0] * len(option_fields)
+        rows.append({
+            'item': item,
+            'stats': item_stats,
+            'options': [(getattr(item, field), count) for field, count in zip(option_fields, counts)],
+        })
+    return rows
+
+
 # --- Views for Managing Questions ---
 
 @teacher_is_author
@@ -15,15 +38,21 @@ def manage_questions(request, story):
     pre-reading and post-reading questions for a story.
 
     - Retrieves and displays all pre-reading exercises and post-reading questions.
+    - Shows item analysis (answer spread, correct rate, lookups) from the precomputed stats.
     - Only the author (teacher) of the story can access this view.
     """
     repo = ORMStoryRepository()
+    # Changes with every submit, so it's rendered outside the cached fragment
+    stats = ORMQuestionStatsRepository().get_story_stats(story)
+
+    # The item analysis needs both lists on every render, so they're loaded once up front;
+    # they come from the story-row cache, which is keyed by content version like the fragment
     pre_reading_exercises = repo.list_pre_reading_exercises(story)
     post_reading_questions = repo.list_post_reading_questions(story)
-
-    # Render the management page with fetched data
     return render(request, 'vikes_reading_app/manage_questions.html', {
         'story': story,
         'pre_reading_exercises': pre_reading_exercises,
         'post_reading_questions': post_reading_questions,
+        'pre_reading_analysis': _item_analysis(pre_reading_exercises, stats, 'pre_reading', PRE_READING_OPTIONS),
+        'post_reading_analysis': _item_analysis(post_reading_questions, stats, 'post_reading', POST_READING_OPTIONS),
     })
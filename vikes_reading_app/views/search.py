@@ -0,0 +1,35 @@
+# --- Imports ---
+from django.core.paginator import Paginator
+from django.shortcuts import render
+
+from vikes_reading_app.helpers import get_story_url
+from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+
+# --- Constants ---
+RESULTS_PER_PAGE = 20
+
+
+# --- Story Search View ---
+
+def story_search(request):
+    """
+    Ranked, paginated full-text search over story title, description and content.
+    - Students and unauthenticated users search published stories only.
+    - Teachers search all stories; `mine=1` limits results to their own.
+    Only the requested page of stories is loaded from the database.
+    """
+    repo = ORMStoryRepository()
+    user = request.user
+    query = request.GET.get('q', '').strip()
+    mine = request.GET.get('mine') == '1'
+
+    results = repo.search_stories(user, query, mine=mine)
+    page = Paginator(results, RESULTS_PER_PAGE).get_page(request.GET.get('page'))
+    story_links = [(story, get_story_url(user, story)) for story in page.object_list]
+
+    return render(request, 'vikes_reading_app/search.html', {
+        'query': query,
+        'mine': mine,
+        'page': page,
+        'story_links': story_links,
+    })
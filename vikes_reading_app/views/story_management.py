@@ -1,9 +1,13 @@
 # --- Imports for Django views, models, forms, and decorators ---
 from django.contrib import messages
+from django.http import HttpResponse
 from django.shortcuts import redirect, render
+from django.utils.text import slugify
 from vikes_reading_app.decorators import teacher_required, teacher_is_author
-from vikes_reading_app.forms import StoryForm
+from vikes_reading_app.forms import StoryBundleImportForm, StoryForm
+from vikes_reading_app.models import LEVEL_CHOICES
 from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+from vikes_reading_app.services.story_bundle import StoryBundleError, StoryBundleService
 
 
 # --- Views for Teacher Story Management ---
@@ -14,10 +18,18 @@ from vikes_reading_app.repositories.story_repository_impl import ORMStoryReposit
 def my_stories(request):
     """
     Shows a list of stories authored by the currently logged-in user.
+    Optional `level` and `sort` query parameters filter and order by the story's text profile.
     """
     repo = ORMStoryRepository()
-    stories = repo.list_author_stories(request.user)
-    return render(request, 'vikes_reading_app/my_stories.html', {'stories': stories})
+    level = request.GET.get('level', '')
+    sort = request.GET.get('sort', '')
+    stories = repo.list_author_stories(request.user, level=level, sort=sort)
+    return render(request, 'vikes_reading_app/my_stories.html', {
+        'stories': stories,
+        'level_choices': LEVEL_CHOICES,
+        'level': level,
+        'sort': sort,
+    })
 
 
 @teacher_required  # Ensures only logged-in teachers can create stories
@@ -76,3 +88,51 @@ def story_delete(request, story):
         return redirect('my_stories')
 
     return render(request, 'vikes_reading_app/story_delete.html', {'story': story})
+
+
+# --- Story Bundle Import/Export ---
+
+@teacher_is_author  # Only the author may export a story with its answer keys
+def story_export(request, story):
+    """
+    Downloads the story, its exercises, questions and audio as one bundle.
+    """
+    repo = ORMStoryRepository()
+    archive = StoryBundleService.write_archive(
+        story,
+        repo.list_pre_reading_exercises(story),
+        repo.list_post_reading_questions(story),
+    )
+    response = HttpResponse(archive, content_type='application/zip')
+    filename = slugify(story.title) or f"story-{story.id}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}.zip"'
+    return response
+
+
+@teacher_required  # Imported stories belong to the importing teacher
+def story_import(request):
+    """
+    Creates a complete story from an uploaded bundle in a single request.
+    """
+    if request.method == 'POST':
+        form = StoryBundleImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            try:
+                manifest, audio = StoryBundleService.read_bundle(form.cleaned_data['bundle'])
+                story_data, exercises, questions = StoryBundleService.validate(manifest)
+            except StoryBundleError as error:
+                form.add_error('bundle', str(error))
+            else:
+                story = ORMStoryRepository().import_story_bundle(
+                    request.user.id, story_data, exercises, questions, audio
+                )
+                messages.success(
+                    request,
+                    f"Imported \"{story.title}\" with {len(exercises)} pre-reading exercises "
+                    f"and {len(questions)} post-reading questions.",
+                )
+                return redirect('my_stories')
+    else:
+        form = StoryBundleImportForm()
+
+    return render(request, 'vikes_reading_app/story_import.html', {'form': form})
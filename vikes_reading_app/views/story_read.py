@@ -1,3 +1,5 @@
+from functools import partial
+
 from django.shortcuts import render, redirect
 from vikes_reading_app.decorators import student_can_view_story, teacher_is_author
 from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
@@ -16,12 +18,11 @@ def story_read_teacher(request, story):
     Only the author of the story (teacher) can access this view.
     """
     repo = ORMStoryRepository()
-    pre_reading_exercises = repo.list_pre_reading_exercises(story)
-    post_reading_questions = repo.list_post_reading_questions(story)
+    # Loaded only when the cached fragment for this content version is missing
     return render(request, 'vikes_reading_app/story_read_teacher.html', {
         'story': story,
-        'pre_reading_exercises': pre_reading_exercises,
-        'post_reading_questions': post_reading_questions,
+        'pre_reading_exercises': partial(repo.list_pre_reading_exercises, story),
+        'post_reading_questions': partial(repo.list_post_reading_questions, story),
     })
 
 
@@ -46,16 +47,19 @@ def story_entry_point(request, story):
     it shows a summary of their progress on this story.
     """
     repo = ORMProgressRepository()
-    # Retrieve the student's progress from the database
-    progress = repo.get_progress(student_id=request.user.id, story_id=story.id)
+    # Retrieve the student's progress and the story's exercise/question counts in one query
+    snapshot = repo.get_story_entry_snapshot(student_id=request.user.id, story_id=story.id)
+    progress = snapshot.progress
 
     # Determine if the student should be redirected to another part of the app
-    redirect_target = ReadingFlowService.get_resume_target(progress, story)
+    redirect_target = ReadingFlowService.resolve_resume_target(
+        progress, snapshot.pre_reading_total, snapshot.post_reading_total,
+    )
     if redirect_target:
         return redirect(redirect_target, story_id=story.id)
 
     # Calculate pre-reading and post-reading scores
-    pre_correct, pre_total = ReadingFlowService.get_pre_reading_score(progress, story)
+    pre_correct, pre_total = ReadingFlowService.get_pre_reading_score(progress, story, snapshot.pre_reading_total)
     post_correct, post_total = ReadingFlowService.get_post_reading_score(progress)
 
     # Render the entry point template with progress summary
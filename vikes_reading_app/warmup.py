@@ -0,0 +1,151 @@
+# --- Worker Warm-Up ---
+
+import logging
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.template import TemplateSyntaxError
+from django.template.loader import get_template
+from django.urls import NoReverseMatch, get_resolver, reverse
+
+from vikes_reading_app.lazy_views import load_lazy_views
+
+
+logger = logging.getLogger(__name__)
+
+APP_LABEL = 'vikes_reading_app'
+
+
+def app_template_names():
+    """Names of every template under the app's templates/vikes_reading_app/ directory."""
+    root = Path(apps.get_app_config(APP_LABEL).path) / 'templates'
+    return sorted(path.relative_to(root).as_posix() for path in (root / APP_LABEL).rglob('*.html'))
+
+
+def warm_urls():
+    """
+    Builds the URL resolver, imports the lazily loaded views behind it and reverses each
+    named route once, so the first request doesn't pay for any of it. Returns how many reversed.
+    """
+    resolver = get_resolver()
+    load_lazy_views(resolver.url_patterns)
+    reversed_count = 0
+    for name in [key for key in resolver.reverse_dict if isinstance(key, str)]:
+        # Every route parameter here is an int or a str, both of which accept '1'
+        possibilities = resolver.reverse_dict.getlist(name)
+        params = possibilities[0][0][0][1]
+        try:
+            reverse(name, kwargs={param: '1' for param in params})
+        except NoReverseMatch:
+            logger.debug("Could not reverse %s during warm-up", name)
+            continue
+        reversed_count += 1
+    return reversed_count
+
+
+def warm_templates():
+    """
+    Compiles every app template so the cached loader holds them before the first request.
+    Returns how many compiled; a template that fails is logged and left for the request
+    that needs it to report.
+    """
+    compiled = 0
+    for name in app_template_names():
+        try:
+            get_template(name)
+        except TemplateSyntaxError:
+            logger.exception("Template %s failed to compile during warm-up", name)
+            continue
+        compiled += 1
+    return compiled
+
+
+def warm_database():
+    """
+    Opens a connection to every configured database (the primary and any replica),
+    so they're kept by CONN_MAX_AGE for the worker's first requests. Returns how many opened.
+    Only useful in the thread that will serve requests, see warm_up_worker().
+    """
+    opened = 0
+    for alias in connections:
+        connections[alias].ensure_connection()
+        opened += 1
+    return opened
+
+
+def warm_story_cache():
+    """Loads published stories' exercises and questions into the cache. Returns the story count."""
+    from vikes_reading_app.repositories.story_repository_impl import ORMStoryRepository
+
+    return ORMStoryRepository().cache_published_story_rows()
+
+
+def close_connections():
+    """Closes this thread's connections, and the process's pools when DB_POOL is on."""
+    for alias in connections:
+        connection = connections[alias]
+        connection.close()
+        if settings.DB_POOL and hasattr(connection, 'close_pool'):
+            connection.close_pool()
+
+
+STEPS = {
+    'urls': (warm_urls, "Reversed %d URLs"),
+    'templates': (warm_templates, "Compiled %d templates"),
+    'database': (warm_database, "Opened %d database connections"),
+    'story_cache': (warm_story_cache, "Cached exercises and questions for %d stories"),
+}
+
+
+def warm_up(steps=None):
+    """
+    Boot-time work for a new worker, run from wsgi.py and asgi.py after Django is set up.
+    Runs each of `steps` (default settings.WARMUP_STEPS) and logs what it did and how long
+    it took. A failing step is logged and skipped; the worker still starts.
+    """
+    steps = settings.WARMUP_STEPS if steps is None else steps
+    started = time.perf_counter()
+    for name in steps:
+        step, message = STEPS[name]
+        step_started = time.perf_counter()
+        try:
+            count = step()
+        except Exception:
+            logger.exception("Warm-up step %s failed", name)
+            continue
+        logger.info(message + " in %.1f ms", count, (time.perf_counter() - step_started) * 1000)
+    if steps:
+        logger.info("Worker warm-up finished in %.1f ms", (time.perf_counter() - started) * 1000)
+
+
+# Steps whose result is an open connection for the worker to keep. At import time that could be
+# a gunicorn --preload master, whose sockets every forked worker would share, or an ASGI import
+# thread that never runs the ORM (sync work goes to sync_to_async threads), so they wait for
+# warm_up_worker().
+WORKER_STEPS = ('database',)
+
+
+def warm_up_on_import():
+    """
+    Run from wsgi.py and asgi.py once Django is set up: the configured steps except
+    WORKER_STEPS, then closes the connections they used so none outlives the import.
+    """
+    warm_up([name for name in settings.WARMUP_STEPS if name not in WORKER_STEPS])
+    close_connections()
+
+
+def warm_up_worker(serves_on_this_thread):
+    """
+    Run from gunicorn's post_worker_init hook (gunicorn.conf.py), in a worker's main thread
+    after any fork: the configured WORKER_STEPS. A plain connection opened here is only
+    reused when this thread serves the requests (the sync worker); a pool is shared by
+    all of the worker's threads.
+    """
+    steps = [name for name in settings.WARMUP_STEPS if name in WORKER_STEPS]
+    if serves_on_this_thread or settings.DB_POOL:
+        warm_up(steps)
+    elif steps:
+        logger.info("Skipped warm-up steps %s: this worker serves requests from other threads", ', '.join(steps))